@@ -3,22 +3,85 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email import encoders
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import io
 import os
+import shutil
+import threading
+
+# 상수 모음 ------------------------------------------------------------------------------------------------------------ #
+ATTACH_COMPRESS_THRESHOLD = 1024 * 1024     # 이 크기(바이트)를 넘는 첨부파일은 gzip 압축 후 첨부
+ATTACH_CHUNK_SIZE = 1024 * 1024             # 압축 시 파일을 읽는 단위(바이트)
 
 
 class EmailSender:
-    def __init__(self, smtp_id, smtp_pw, smtp_server='smtp.kakaowork.com', smtp_port=465):
+    def __init__(self, smtp_id, smtp_pw, smtp_server='smtp.kakaowork.com', smtp_port=465, keep_alive=True,
+                 compress_threshold=ATTACH_COMPRESS_THRESHOLD):
         """
         이메일 전송 클래스 초기화
         :param smtp_id: SMTP 서버 로그인 ID
         :param smtp_pw: SMTP 서버 로그인 패스워드
         :param smtp_server: SMTP 서버 주소 (기본값: 'smtp.kakaowork.com')
         :param smtp_port: SMTP 서버 포트 (기본값: 465)
+        :param keep_alive: 로그인된 SMTP 연결을 유지하여 다음 전송에 재사용할지 여부 (기본값: True)
+        :param compress_threshold: 이 크기(바이트)를 넘는 첨부파일은 gzip 압축 (기본값: 1MB, None이면 압축 안 함)
         """
         self.smtp_id = smtp_id
         self.smtp_pw = smtp_pw
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        self.keep_alive = keep_alive
+        self.compress_threshold = compress_threshold
+
+        self._server = None
+        self._lock = threading.Lock()           # 연결/전송 직렬화
+        self._executor_lock = threading.Lock()  # 실행기 생성/종료 보호 (전송 중에도 막히지 않도록 _lock과 분리)
+        self._executor = None                   # 비동기 전송용 단일 스레드 실행기 (전송 순서 유지)
+
+    def _connect(self):
+        """
+        로그인된 SMTP 연결을 반환한다. 유지 중인 연결이 살아 있으면(NOOP 응답 250) 재사용하고, 아니면 새로 연결한다.
+        :return: smtplib.SMTP_SSL 객체
+        """
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._disconnect()
+
+        server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        server.login(self.smtp_id, self.smtp_pw)
+        self._server = server
+        return server
+
+    def _disconnect(self):
+        """유지 중인 SMTP 연결을 종료한다."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+    def _send_message(self, message):
+        """
+        메시지를 전송한다. 재사용한 연결이 끊겨 있으면 새로 연결하여 1회 재시도한다.
+        :param message: 이메일 메시지 객체
+        """
+        with self._lock:
+            try:
+                try:
+                    self._connect().send_message(message)
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    self._disconnect()
+                    self._connect().send_message(message)
+            finally:
+                if not self.keep_alive:
+                    self._disconnect()
 
     def send_email(self, mail_subject, mail_body, mail_to, mail_cc='knw.rpa@knworks.co.kr', mail_bcc='', mail_attachments=None):
         """
@@ -63,35 +126,83 @@ class EmailSender:
                     if not attachment_result:  # 첨부파일 추가가 실패하면 예외 발생
                         raise Exception(f"첨부파일 {attachment} 추가에 실패했습니다.")
 
-            # SMTP 서버에 연결 및 이메일 전송
-            with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as server:
-                server.login(self.smtp_id, self.smtp_pw)
-                server.send_message(message)
+            # SMTP 서버에 연결(또는 유지 중인 연결 재사용) 및 이메일 전송
+            self._send_message(message)
 
             return True  # 이메일 전송 성공
         except Exception as e:
             raise Exception(f"이메일 전송에 실패했습니다: {e}")
 
+    def send_email_async(self, *args, **kwargs):
+        """
+        이메일을 백그라운드 스레드에서 전송하도록 큐에 넣고 바로 반환하는 메서드 (인자는 send_email과 동일)
+        - 큐에 넣은 순서대로 전송하며, 첨부파일은 전송 시점의 내용으로 읽는다.
+        :return: concurrent.futures.Future (result()는 send_email 결과, 실패 시 예외)
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mail')
+            return self._executor.submit(self.send_email, *args, **kwargs)
+
+    def flush(self, timeout=None):
+        """
+        비동기 전송 큐가 빌 때까지 기다리는 메서드
+        :param timeout: 최대 대기 시간(초) (기본값: None, 무제한)
+        :return: 제한 시간 안에 모두 전송 시도를 마쳤으면 True
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                return True
+            marker = self._executor.submit(lambda: None)
+        try:
+            marker.result(timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """비동기 전송 큐를 모두 처리한 뒤 유지 중인 SMTP 연결을 종료하는 메서드"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            self._disconnect()
+
     def add_attachment(self, message, file_path):
         """
         이메일에 첨부파일을 추가하는 함수
+        - 파일 크기가 compress_threshold를 넘으면 조각 단위로 읽으며 gzip 압축하여 '<파일명>.gz'로 첨부한다. (이미 .gz인 파일 제외)
         :param message: 이메일 메시지 객체
         :param file_path: 첨부파일 경로
         :return: 첨부파일 처리 결과 (True: 성공, False: 실패)
         """
         try:
-            # 첨부파일을 바이너리 형식으로 읽어 MIMEBase 객체 생성
+            file_name = os.path.basename(file_path)
+            compress = (self.compress_threshold is not None and not file_name.endswith('.gz')
+                        and os.path.getsize(file_path) > self.compress_threshold)
+
+            # 첨부파일을 바이너리 형식으로 읽어(필요 시 압축) MIMEBase 객체 생성
             with open(file_path, 'rb') as file:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(file.read())
-                encoders.encode_base64(part)  # Base64로 인코딩
+                if compress:
+                    buffer = io.BytesIO()
+                    with gzip.GzipFile(filename=file_name, mode='wb', fileobj=buffer) as gz:
+                        shutil.copyfileobj(file, gz, ATTACH_CHUNK_SIZE)
+                    payload = buffer.getvalue()
+                    part = MIMEBase('application', 'gzip')
+                    file_name = f'{file_name}.gz'
+                else:
+                    payload = file.read()
+                    part = MIMEBase('application', 'octet-stream')
+
+            part.set_payload(payload)
+            encoders.encode_base64(part)  # Base64로 인코딩
 
-                # 파일 이름 추출 및 첨부 헤더 설정
-                file_name = os.path.basename(file_path)
-                part.add_header('Content-Disposition', f'attachment; filename={file_name}')
+            # 첨부 헤더 설정 (비ASCII 파일명 대응)
+            part.add_header('Content-Disposition', 'attachment', filename=file_name)
 
-                # 메시지에 첨부파일 추가
-                message.attach(part)
+            # 메시지에 첨부파일 추가
+            message.attach(part)
             return True  # 첨부파일 추가 성공
         except Exception as e:
             return False  # 첨부파일 추가 실패
@@ -1,11 +1,169 @@
 import logging
+import logging.handlers
+import atexit
 import datetime
+import glob
+import gzip
 import os
+import queue
+import shutil
 import sys
+import threading
+import time
 from pathlib import Path
 
+# 상수 모음 ------------------------------------------------------------------------------------------------------------ #
+LOG_MAX_BYTES = 20 * 1024 * 1024    # 하루 로그 파일이 이 크기를 넘으면 분할(.1.gz, .2.gz ...)
+LOG_BACKUP_COUNT = 20               # 하루에 보관할 분할 파일 수
+LOG_ENCODING = 'euc-kr'             # 메모장 호환 인코딩 (표현 불가 문자는 '?'로 대체)
+
+
+def _gzip_file(source, dest):
+    """source 파일을 dest(.gz)로 압축하고 원본을 삭제한다."""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class _DailyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Log_YYYYMMDD.log 파일에 기록하며 날짜/크기 기준으로 교체하는 파일 핸들러.
+
+    - 날짜가 바뀌면 이전 날짜 파일을 gzip 압축하고 새 날짜 파일로 전환한다.
+    - 파일이 max_bytes를 넘으면 Log_YYYYMMDD.log.1.gz ... 로 압축 분할한다.
+    """
+
+    def __init__(self, log_dir, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT, encoding=LOG_ENCODING):
+        self.log_dir = log_dir
+        self._date = self._today()
+        super().__init__(self._path(self._date), maxBytes=max_bytes, backupCount=backup_count,
+                         encoding=encoding, errors='replace')
+        self.namer = lambda name: f'{name}.gz'
+        self.rotator = _gzip_file
+
+    @staticmethod
+    def _today():
+        return datetime.datetime.now().strftime("%Y%m%d")
+
+    def _path(self, date_str):
+        return os.path.abspath(os.path.join(self.log_dir, f'Log_{date_str}.log'))
+
+    def shouldRollover(self, record):
+        if self._today() != self._date:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        today = self._today()
+        if today == self._date:
+            super().doRollover()
+            return
+
+        # 날짜 교체 : 이전 날짜 파일 압축 후 새 파일로 전환
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        previous = self.baseFilename
+        self._date = today
+        self.baseFilename = self._path(today)
+        self.stream = self._open()
+        try:
+            _gzip_file(previous, f'{previous}.gz')
+        except OSError:
+            pass
+
+    def compress_old_logs(self):
+        """오늘이 아닌 날짜의 압축되지 않은 로그 파일을 압축한다. (이전 실행에서 남은 파일)"""
+        for path in glob.glob(os.path.join(self.log_dir, 'Log_*.log')):
+            if os.path.abspath(path) == self.baseFilename or os.path.exists(f'{path}.gz'):
+                continue
+            try:
+                _gzip_file(path, f'{path}.gz')
+            except OSError:
+                pass
+
+
+class _TimedQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서 큐에 넣는 데 걸린 시간을 집계하는 QueueHandler."""
+
+    def __init__(self, log_queue, stats):
+        super().__init__(log_queue)
+        self.stats = stats
+
+    def emit(self, record):
+        started = time.perf_counter()
+        super().emit(record)
+        self.stats.add('caller', time.perf_counter() - started)
+
+
+class _TimedHandler(logging.Handler):
+    """백그라운드 스레드에서 실제 핸들러들의 기록 시간을 집계하는 래퍼 핸들러."""
+
+    def __init__(self, handlers, stats):
+        super().__init__()
+        self.handlers = handlers
+        self.stats = stats
+
+    def handle(self, record):
+        started = time.perf_counter()
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        self.stats.add('writer', time.perf_counter() - started)
+        return True
+
+
+class _LogStats:
+    """로깅 부하 집계 (호출 측 / 백그라운드 기록 측 소요 시간과 건수)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.records = 0
+            self.caller_secs = 0.0
+            self.writer_secs = 0.0
+
+    def add(self, side, secs):
+        with self._lock:
+            if side == 'caller':
+                self.records += 1
+                self.caller_secs += secs
+            else:
+                self.writer_secs += secs
+
+
 class Log:
+    """
+    프로세스 전체가 공유하는 로거 (logger_name별 싱글턴).
+
+    - 모든 모듈의 Log()는 같은 인스턴스를 반환하며, 핸들러는 최초 1회만 구성한다. (exec_dir도 최초 값 사용)
+    - log() 호출은 QueueHandler로 큐에 넣기만 하고, 파일/콘솔 기록은 QueueListener 백그라운드 스레드가 수행한다.
+    - 로그 파일은 날짜/크기 기준으로 교체하며 이전 파일은 gzip 압축한다.
+    - 호출 측 부하(큐 적재 시간)와 백그라운드 기록 시간을 집계한다. (report_overhead)
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, exec_dir: str = '', logger_name: str = 'knwrpa'):
+        with cls._instances_lock:
+            instance = cls._instances.get(logger_name)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[logger_name] = instance
+            return instance
+
     def __init__(self, exec_dir: str = '', logger_name: str = 'knwrpa'):
+        with self._instances_lock:
+            if self._initialized:
+                return
+            self._initialized = True
+
         # 로그 디렉토리
         if exec_dir:
             self.log_dir = os.path.join(exec_dir, 'Log')
@@ -14,7 +172,6 @@ class Log:
         os.makedirs(self.log_dir, exist_ok=True)
 
         # 파일명 구성
-        self.log_file = os.path.join(self.log_dir, f'Log_{self._current_date_str()}.log')
         self.target_path = Path(sys.executable).parent / f'{self._current_date_str()}_작업로그.log'
 
         # === 전용 로거 구성 (루트 상태와 무관하게 항상 내 핸들러 사용) ===
@@ -30,15 +187,30 @@ class Log:
         fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
                                 datefmt='%Y/%m/%d %H:%M')
 
-        # 파일 핸들러 (메모장 호환 위해 BOM 포함)
-        fh = logging.FileHandler(self.log_file, encoding='euc-kr')
-        fh.setFormatter(fmt)
-        self.logger.addHandler(fh)
+        # 파일 핸들러 (날짜/크기 교체 + 이전 파일 압축)
+        self._file_handler = _DailyRotatingFileHandler(str(self.log_dir))
+        self._file_handler.setFormatter(fmt)
 
         # 콘솔 핸들러 (원래 print로 화면에 찍던 역할 대체)
         sh = logging.StreamHandler(sys.stdout)
         sh.setFormatter(fmt)
-        self.logger.addHandler(sh)
+
+        # 큐 기반 비동기 기록 : 호출 스레드는 큐 적재만, 기록은 리스너 스레드에서
+        self.stats = _LogStats()
+        self._queue = queue.Queue()
+        self.logger.addHandler(_TimedQueueHandler(self._queue, self.stats))
+        self._listener = logging.handlers.QueueListener(
+            self._queue, _TimedHandler([self._file_handler, sh], self.stats))
+        self._listener.start()
+        atexit.register(self.close)
+
+        # 이전 실행에서 남은 날짜 파일 압축 (시작 지연 없도록 백그라운드)
+        threading.Thread(target=self._file_handler.compress_old_logs, name='log-compress', daemon=True).start()
+
+    @property
+    def log_file(self):
+        """현재 기록 중인 로그 파일 경로 (날짜가 바뀌면 함께 바뀜)"""
+        return self._file_handler.baseFilename
 
     def _current_date_str(self):
         return datetime.datetime.now().strftime("%Y%m%d")
@@ -67,3 +239,44 @@ class Log:
     def get_log_paths(self) -> str:
         """현재 사용 중인 로그 파일(절대경로)을 반환합니다."""
         return str(self.log_file)
+
+    def get_log_parts(self) -> list:
+        """
+        이번 실행(reset_stats 이후)에 기록된 로그 파일 목록을 기록 순서대로 반환합니다. (메일 첨부용)
+        크기 초과로 분할된 오늘 날짜의 압축 파일(.N.gz, 숫자가 클수록 오래됨) 뒤에 현재 로그 파일이 옵니다.
+        """
+        current = self.log_file
+        parts = []
+        for path in glob.glob(f'{glob.escape(current)}.*.gz'):
+            index = os.path.basename(path)[len(os.path.basename(current)) + 1:-len('.gz')]
+            try:
+                if index.isdigit() and os.path.getmtime(path) >= self.stats.started:
+                    parts.append((int(index), path))
+            except OSError:
+                continue    # 조회 중 교체된 파일
+        return [path for _, path in sorted(parts, reverse=True)] + [current]
+
+    def flush(self, timeout=5.0):
+        """큐에 쌓인 로그가 파일에 모두 기록될 때까지 기다립니다. (메일 첨부 직전 등)"""
+        deadline = time.perf_counter() + timeout
+        while self._queue.unfinished_tasks and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self._file_handler.flush()
+
+    def reset_stats(self):
+        """로깅 부하 집계를 초기화합니다. (실행 시작 시 호출)"""
+        self.stats.reset()
+
+    def report_overhead(self):
+        """실행 동안의 로깅 부하(건수, 호출 측 소요, 백그라운드 기록 소요)를 로그로 남깁니다."""
+        records, caller, writer = self.stats.records, self.stats.caller_secs, self.stats.writer_secs
+        average_us = caller / records * 1e6 if records else 0.0
+        self.log(f"> 로깅 부하 : {records}건, 호출 측 {caller * 1000:.1f}ms (평균 {average_us:.0f}µs), "
+                 f"백그라운드 기록 {writer * 1000:.1f}ms", level="INFO")
+
+    def close(self):
+        """리스너를 멈추고(남은 로그 기록) 파일을 닫습니다. (프로세스 종료 시 자동 호출)"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self._file_handler.close()
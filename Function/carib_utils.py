@@ -1,5 +1,9 @@
 # carib_utils.py (통합 버전 발췌)
+import base64
+import json
 import os
+import re
+import shutil
 import time
 import traceback
 from selenium import webdriver
@@ -13,6 +17,9 @@ from knw_Chromedriver_manager import Chromedriver_manager
 
 from Common.log import Log
 from Service.constants import Constants
+from Function.wait_utils import WaitUtils
+from Function.step_timer import StepTimer
+from Function.common_utils import CommonUtils
 
 
 class CaribUtils:
@@ -23,20 +30,42 @@ class CaribUtils:
     - 실패 시 재시도를 지원하며, 지정된 횟수 이상 실패하면 예외를 발생시킨다.
     - logger와 constants 객체를 외부에서 주입할 수 있어 테스트 및 확장에 용이하다.
     - Chrome 다운로드 디렉토리를 옵션으로 설정해 CSV 등 파일 저장을 자동화한다.
+    - session_file이 지정되면 로그인 쿠키를 암호화해 보관하고, 다음 실행 시 복원하여 재로그인을 생략한다.
 
     Attributes:
         carib_url (str): 로그인 대상 URL
         carib_id (str): 로그인 계정 ID
         carib_pw (str): 로그인 계정 비밀번호
         download_dir (str | None): Chrome 기본 다운로드 디렉토리
+        session_file (str | None): 암호화된 로그인 쿠키 보관 파일 경로
+        capture_network (bool): 로그인 드라이버의 DevTools 네트워크 이벤트 수집 여부 (capture_json_responses)
         logging (Log): 로그 기록 객체 (기본값: Common.log.Log)
         constants (Constants): 환경 상수 객체 (기본값: Service.constants.Constants)
         driver (webdriver.Chrome | None): Chrome WebDriver 인스턴스
     """
 
     DEFAULT_WAIT = 120
-
-    def __init__(self, carib_url, carib_id, carib_pw, logger=None, constants=None, download_dir=None):
+    _chromedriver_path = None   # 프로세스 내 chromedriver 설치 경로 (최초 1회만 설치 확인)
+
+    DOWNLOAD_SUBDIR = 'downloads'       # 실행별 다운로드 폴더의 상위 폴더명 (download_dir 하위)
+    DOWNLOAD_RETENTION_DAYS = 7         # 실행별 다운로드 폴더 보관 기간(일)
+    DOWNLOAD_POLL = 0.2                 # 다운로드 완료 확인 주기(초)
+
+    # lean 프로필에서 차단할 리소스 (폰트/동영상/이미지 및 광고·분석 트래커 도메인)
+    # 확장자별로 쿼리스트링이 붙은 URL(예: a.png?v=1)도 차단 ('*.ts*'처럼 쓰면 'www.tsite.com' 등도 차단되므로 분리)
+    LEAN_BLOCKED_URLS = [pattern for extension in (
+        'woff', 'woff2', 'ttf', 'otf', 'eot',
+        'mp4', 'webm', 'm3u8', 'ts',
+        'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico',
+    ) for pattern in (f'*.{extension}', f'*.{extension}?*')] + [
+        '*google-analytics.com*', '*googletagmanager.com*', '*googleadservices.com*', '*doubleclick.net*',
+        '*facebook.net*', '*facebook.com/tr*', '*criteo.*', '*appsflyer.com*', '*adjust.com*', '*branch.io*',
+        '*hotjar.com*', '*clarity.ms*', '*amplitude.com*', '*braze.com*', '*mixpanel.com*',
+        '*sentry.io*', '*nr-data.net*', '*newrelic.com*', '*datadoghq.com*', '*channel.io*',
+    ]
+
+    def __init__(self, carib_url, carib_id, carib_pw, logger=None, constants=None, download_dir=None,
+                 session_file=None, capture_network=False):
         """
         CaribUtils 인스턴스를 초기화한다.
 
@@ -47,19 +76,37 @@ class CaribUtils:
             logger (Log, optional): 로깅 객체 (기본값: Log())
             constants (Constants, optional): 상수 객체 (기본값: Constants())
             download_dir (str | None, optional): Chrome의 기본 다운로드 경로. 지정 시 해당 폴더로 자동 저장.
+            session_file (str | None, optional): 로그인 쿠키 보관 파일 경로. 지정 시 세션 유지/복원 사용.
+            capture_network (bool, optional): DevTools 네트워크 이벤트 수집 여부. 기본값 False.
         """
         self.carib_url = carib_url
         self.carib_id = carib_id
         self.carib_pw = carib_pw
         self.download_dir = download_dir
+        self.session_file = session_file
+        self.capture_network = capture_network
         self.logging = logger or Log()
         self.constants = constants or Constants()
         self.driver = None
 
+    @classmethod
+    def _chrome_service(cls):
+        """
+        chromedriver Service 객체를 생성한다.
+        - Chromedriver_manager.install()은 프로세스당 최초 1회만 호출하고 경로를 재사용한다.
+
+        Returns:
+            Service: chromedriver Service 인스턴스
+        """
+        if cls._chromedriver_path is None:
+            cls._chromedriver_path = Chromedriver_manager.install()
+        return Service(cls._chromedriver_path)
+
     def _init_driver(self):
         """
         Chrome WebDriver를 초기화한다.
         - download_dir이 지정된 경우 Chrome prefs에 기본 다운로드 경로를 설정한다.
+        - capture_network=True인 경우에만 DevTools 네트워크 이벤트(performance 로그)를 수집한다.
 
         Returns:
             webdriver.Chrome: 초기화된 Chrome 드라이버
@@ -69,6 +116,11 @@ class CaribUtils:
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument('--blink-settings=imagesEnabled=false')
 
+        # DevTools 네트워크 이벤트 수집 (capture_json_responses에서 사용)
+        if self.capture_network:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
         # 다운로드 폴더 설정 (선택)
         if self.download_dir:
             os.makedirs(self.download_dir, exist_ok=True)
@@ -80,12 +132,192 @@ class CaribUtils:
             }
             options.add_experimental_option("prefs", prefs)
 
-        self.driver = webdriver.Chrome(service=Service(Chromedriver_manager.install()), options=options)
+        self.driver = webdriver.Chrome(service=self._chrome_service(), options=options)
         return self.driver
 
+    def create_worker_driver(self, headless=True, lean=False, measure_network=False):
+        """
+        랜딩 페이지 조회 전용 Chrome WebDriver를 새로 생성한다.
+        - 로그인 세션(self.driver)과 분리된 별도 브라우저로, 병렬 작업자가 각자 하나씩 소유한다.
+        - 다운로드 폴더 설정 없이 이미지 비활성화만 적용한다.
+        - lean=True이면 eager 페이지 로드 전략을 사용하고, 불필요한 리소스를 차단한다. (apply_lean_profile)
+        - measure_network=True이면 DevTools 네트워크 이벤트를 수집하여 전송 바이트를 잴 수 있다. (page_transfer_bytes)
+
+        Args:
+            headless (bool, optional): 헤드리스 모드 실행 여부. 기본값 True.
+            lean (bool, optional): lean 프로필 사용 여부. 기본값 False.
+            measure_network (bool, optional): 네트워크 이벤트 수집 여부. 기본값 False.
+
+        Returns:
+            webdriver.Chrome: 새로 생성된 Chrome 드라이버 (종료 책임은 호출 측에 있음)
+        """
+        options = Options()
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument('--blink-settings=imagesEnabled=false')
+
+        if lean:
+            options.page_load_strategy = 'eager'    # DOMContentLoaded 시점에 반환 (이후는 요소 대기로 판단)
+            options.add_argument('--disable-extensions')
+            options.add_argument('--mute-audio')
+            options.add_argument('--autoplay-policy=user-gesture-required')
+
+        if measure_network:
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+        driver = webdriver.Chrome(service=self._chrome_service(), options=options)
+        if lean and not self.apply_lean_profile(driver):
+            self.logging.log("> 리소스 차단 설정 실패 : 기본 프로필로 진행", level="WARNING")
+        return driver
+
+    @classmethod
+    def apply_lean_profile(cls, driver):
+        """
+        현재 탭에 DevTools Network.setBlockedURLs로 LEAN_BLOCKED_URLS 차단을 적용한다.
+        - 차단 설정은 탭 단위이므로 새 탭을 열면 다시 호출해야 한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+
+        Returns:
+            bool: 차단 설정 성공 여부
+        """
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': cls.LEAN_BLOCKED_URLS})
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def page_transfer_bytes(driver):
+        """
+        마지막 호출 이후 수집된 DevTools 네트워크 이벤트에서 전송 바이트 합계를 구한다.
+        - 성능 로그는 읽으면 비워지므로, 페이지 로드 직전에 한 번 호출해 초기화한다.
+
+        Args:
+            driver (webdriver.Chrome): measure_network=True로 생성된 WebDriver 인스턴스
+
+        Returns:
+            int | None: Network.loadingFinished의 encodedDataLength 합계 (네트워크 수집을 사용하지 않으면 None)
+        """
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return None
+
+        total = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            if message.get('method') == 'Network.loadingFinished':
+                total += int(message.get('params', {}).get('encodedDataLength', 0))
+        return total
+
+    def save_session(self):
+        """
+        현재 드라이버의 쿠키를 PC별 세션 키(CommonUtils.session_key)로 암호화하여 session_file에 저장한다.
+        - session_file이 지정되지 않았거나 드라이버가 없으면 아무것도 하지 않는다.
+        - 세션 키(환경 변수)가 설정되지 않았으면 저장하지 않는다.
+        """
+        if not (self.session_file and self.driver):
+            return
+        key = CommonUtils.session_key()
+        if key is None:
+            self.logging.log(f"> 로그인 세션 저장 생략 : {CommonUtils.SESSION_KEY_ENV} 미설정", level="WARNING")
+            return
+        try:
+            token = CommonUtils.encrypt_text(json.dumps(self.driver.get_cookies()), key)
+            os.makedirs(os.path.dirname(os.path.abspath(self.session_file)), exist_ok=True)
+            with open(self.session_file, 'wb') as f:
+                f.write(token)
+            self.logging.log("> 로그인 세션 저장", level="INFO")
+        except Exception as e:
+            self.logging.log(f"> 로그인 세션 저장 실패 : {type(e).__name__}", level="WARNING")
+
+    def _restore_session(self):
+        """
+        session_file의 쿠키를 복호화해 현재 드라이버에 주입하고 세션 유효성을 확인한다.
+        - 만료된 쿠키는 제외하며, 복원에 실패하면(세션 만료, 키 불일치/미설정 포함) 보관 파일을 삭제한다.
+
+        Returns:
+            bool: 복원된 세션이 유효하면 True
+        """
+        if not (self.session_file and os.path.exists(self.session_file)):
+            return False
+        try:
+            key = CommonUtils.session_key()
+            if key is None:
+                raise ValueError(f"{CommonUtils.SESSION_KEY_ENV} 미설정")
+            with open(self.session_file, 'rb') as f:
+                cookies = json.loads(CommonUtils.decrypt_text(f.read(), key))
+
+            self.driver.get(self.carib_url)
+            self.driver.delete_all_cookies()
+            now = time.time()
+            for cookie in cookies:
+                if cookie.get('expiry') and cookie['expiry'] < now:
+                    continue
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    pass    # 현재 도메인과 다른 쿠키는 주입 불가
+
+            if self.is_session_valid():
+                return True
+        except Exception as e:
+            self.logging.log(f"> 로그인 세션 복원 실패 : {type(e).__name__}", level="WARNING")
+
+        try:
+            os.remove(self.session_file)
+        except OSError:
+            pass
+        return False
+
+    def clone_session(self, headless=True):
+        """
+        현재 로그인 세션의 쿠키를 복사한 새 Chrome WebDriver를 만든다.
+        - 로그인 절차 없이 같은 계정으로 CARIB 작업을 병렬 수행하기 위해 사용한다.
+
+        Args:
+            headless (bool, optional): 헤드리스 모드 실행 여부. 기본값 True.
+
+        Returns:
+            webdriver.Chrome: 로그인 상태의 새 드라이버 (종료 책임은 호출 측에 있음)
+
+        Raises:
+            TimeoutException: 쿠키 복사 후에도 로그인 상태가 확인되지 않은 경우
+        """
+        cookies = self.driver.get_cookies()
+        driver = self.create_worker_driver(headless=headless)
+        try:
+            driver.get(self.carib_url)
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    pass    # 현재 도메인과 다른 쿠키는 주입 불가
+            driver.get(self.carib_url)
+            WebDriverWait(driver, self.DEFAULT_WAIT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#mainContent")))
+            return driver
+        except Exception:
+            driver.quit()
+            raise
+
+    @StepTimer.timed('carib.login', target=lambda self: self.carib_id)
     def login(self):
         """
         CARIB 사이트에 로그인 절차를 수행한다.
+        - session_file이 지정되어 있으면 먼저 보관된 세션 복원을 시도하고, 만료된 경우에만 전체 로그인을 수행한다.
+        - 전체 로그인 성공 시 세션을 저장하며, 로그인 방식과 소요 시간을 로그로 남긴다.
 
         Returns:
             webdriver.Chrome: 로그인 성공 후의 WebDriver 인스턴스
@@ -96,8 +328,14 @@ class CaribUtils:
             Exception: 그 외 예기치 못한 오류
         """
         self.logging.log("▷ [CARIB] 로그인 → 시작", level="INFO")
+        started = time.perf_counter()
         self._init_driver()
 
+        if self._restore_session():
+            StepTimer.annotate(outcome='restored')
+            self.logging.log(f"▷ [CARIB] 로그인 → 완료 (세션 복원, {time.perf_counter() - started:.1f}s)", level="INFO")
+            return self.driver
+
         max_retries = self.constants.RETRY_COUNT
         wait_secs = getattr(self.constants, "RETRY_DELAY", 5)
 
@@ -105,7 +343,7 @@ class CaribUtils:
             try:
                 self.driver.get(self.carib_url)
                 self.driver.maximize_window()
-                time.sleep(3)
+                WaitUtils.element(self.driver, "#id", timeout=self.DEFAULT_WAIT, budget=3, name='login_form')
 
                 self.driver.find_element(By.CSS_SELECTOR, "#id").send_keys(self.carib_id)
                 self.driver.find_element(By.CSS_SELECTOR, "#password").send_keys(self.carib_pw)
@@ -114,10 +352,14 @@ class CaribUtils:
                 WebDriverWait(self.driver, self.DEFAULT_WAIT).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "#mainContent")))
 
-                self.logging.log("▷ [CARIB] 로그인 → 완료", level="INFO")
+                self.save_session()
+                StepTimer.annotate(retries=attempt - 1)
+                self.logging.log(f"▷ [CARIB] 로그인 → 완료 (전체 로그인, {time.perf_counter() - started:.1f}s)",
+                                 level="INFO")
                 return self.driver
 
             except (TimeoutException, WebDriverException) as e:
+                StepTimer.annotate(retries=attempt - 1)
                 if attempt == max_retries:
                     self.logging.log(f"▷ [CARIB] 로그인 → 실패 : 최대 재시도 초과\n{traceback.format_exc()}", level="ERROR")
                     self.driver.quit()
@@ -134,9 +376,60 @@ class CaribUtils:
                 self.driver.quit()
                 raise
 
+    def is_session_valid(self, timeout=10):
+        """
+        현재 드라이버가 살아 있고 CARIB에 로그인된 상태인지 가볍게 확인한다.
+        - CARIB URL로 이동한 뒤 timeout 안에 #mainContent가 나타나면 유효한 세션으로 판단한다.
+
+        Args:
+            timeout (int, optional): 확인 대기 시간(초). 기본값 10.
+
+        Returns:
+            bool: 로그인 세션 유효 여부
+        """
+        if not self.driver:
+            return False
+        try:
+            self.driver.get(self.carib_url)
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#mainContent")))
+            return True
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def ensure_login(self):
+        """
+        로그인 세션을 재검증하고, 유효하지 않으면 드라이버를 새로 띄워 다시 로그인한다.
+        - 데몬 모드에서 각 실행 직전에 호출하여 유지 중인 세션을 재사용한다.
+        - capture_network=True이면 실행 사이에 쌓인 performance 로그를 비운다. (버퍼 누적 방지)
+
+        Returns:
+            webdriver.Chrome: 로그인된 WebDriver 인스턴스
+        """
+        if self.is_session_valid():
+            self.logging.log("▷ [CARIB] 로그인 세션 재사용", level="INFO")
+            if self.capture_network:
+                try:
+                    self.driver.get_log('performance')
+                except WebDriverException:
+                    pass
+            return self.driver
+
+        if self.driver:
+            self.logging.log("> 로그인 세션 만료 → 재로그인", level="WARNING")
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+        return self.login()
+
+    @StepTimer.timed('carib.logout', target=lambda self: self.carib_id)
     def logout(self):
         """
         CARIB 사이트에 로그아웃 절차를 수행한다.
+        - session_file이 지정된 경우 다음 실행에서 세션을 복원할 수 있도록
+          로그아웃하지 않고 현재 세션(쿠키)만 저장한다.
 
         Returns:
             None
@@ -146,6 +439,12 @@ class CaribUtils:
             WebDriverException: 드라이버/브라우저 구동 관련 오류가 발생한 경우
             Exception: 그 외 예기치 못한 오류
         """
+        if self.driver and self.session_file:
+            self.save_session()
+            StepTimer.annotate(outcome='skipped')
+            self.logging.log("▷ [CARIB] 로그아웃 생략 (세션 유지)", level="INFO")
+            return
+
         if self.driver:
             self.logging.log("▷ [CARIB] 로그아웃 → 시작", level="INFO")
 
@@ -156,14 +455,15 @@ class CaribUtils:
                 try:
                     self.driver.find_element(By.CSS_SELECTOR,    # 로그아웃 버튼
                                              '#ka-review > div > div > header > span:nth-child(2) > span').click()
-                    time.sleep(3)
 
-                    WebDriverWait(self.driver, self.DEFAULT_WAIT).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "span > input#id")))
+                    WaitUtils.element(self.driver, "span > input#id", timeout=self.DEFAULT_WAIT,
+                                      budget=3, name='logout')
 
+                    StepTimer.annotate(retries=attempt - 1)
                     self.logging.log("▷ [CARIB] 로그아웃 → 완료", level="INFO")
                     break
                 except (TimeoutException, WebDriverException) as e:
+                    StepTimer.annotate(retries=attempt - 1)
                     if attempt == max_retries:
                         self.logging.log(f"▷ [CARIB] 로그아웃 → 실패 : 최대 재시도 초과\n{traceback.format_exc()}", level="ERROR")
                         self.driver.quit()
@@ -179,10 +479,139 @@ class CaribUtils:
                     self.driver.quit()
                     raise
 
+    def capture_json_responses(self, trigger, url_pattern, timeout=30, idle_grace=3):
+        """
+        trigger() 실행 중 발생한 XHR/Fetch 응답 중 URL이 url_pattern과 일치하는 JSON 본문을 수집한다.
+
+        - Chrome DevTools performance 로그(Network.responseReceived / loadingFinished)를 읽고,
+          Network.getResponseBody로 응답 본문을 가져온다. (파일 시스템 미사용)
+        - trigger 실행 전 쌓여 있던 로그는 비운다.
+        - 일치하는 응답을 받았거나, trigger 종료 후 idle_grace초 동안 일치하는 요청이 없으면 바로 반환한다.
+          (timeout은 일치하는 요청의 로딩 완료를 기다리는 경우에만 적용)
+        - performance 로그를 사용할 수 없는 드라이버면 trigger만 실행하고 빈 리스트를 반환한다.
+
+        Args:
+            trigger (Callable[[], None]): 네트워크 요청을 유발하는 동작 (예: 조회 버튼 클릭)
+            url_pattern (str): 수집할 응답 URL 정규식
+            timeout (int, optional): 일치하는 응답의 로딩 완료를 기다릴 최대 시간(초). 기본값 30.
+            idle_grace (int, optional): trigger 종료 후 일치하는 요청을 기다릴 시간(초). 기본값 3.
+
+        Returns:
+            list: 파싱된 JSON 본문 리스트 (수신 순서)
+        """
+        pattern = re.compile(url_pattern)
+        try:
+            self.driver.get_log('performance')
+        except WebDriverException:
+            trigger()
+            return []
+
+        trigger()
+        idle_until = time.time() + idle_grace
+
+        pending, finished, payloads = {}, set(), []
+        end_time = time.time() + timeout
+        while time.time() < end_time:
+            for entry in self.driver.get_log('performance'):
+                message = json.loads(entry['message']).get('message', {})
+                method, params = message.get('method'), message.get('params', {})
+                if method == 'Network.responseReceived' and params.get('type') in ('XHR', 'Fetch') \
+                        and pattern.search(params.get('response', {}).get('url', '')):
+                    pending[params['requestId']] = params['response']['url']
+                elif method == 'Network.loadingFinished':
+                    finished.add(params.get('requestId'))
+
+            for request_id in [rid for rid in pending if rid in finished]:
+                url = pending.pop(request_id)
+                try:
+                    body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                    text = base64.b64decode(body['body']).decode('utf-8') if body.get('base64Encoded') else body['body']
+                    payloads.append(json.loads(text))
+                except (WebDriverException, ValueError) as e:
+                    self.logging.log(f"> 응답 본문 수집 실패 ({url}) : {type(e).__name__}", level="WARNING")
+
+            if not pending and (payloads or time.time() >= idle_until):
+                break
+            time.sleep(0.2)
+
+        self.logging.log(f"▷ [CARIB] 네트워크 응답 수집 : {len(payloads)}건", level="INFO")
+        return payloads
+
+    def _prune_downloads(self, root_dir):
+        """
+        root_dir 하위 실행별 다운로드 폴더 중 DOWNLOAD_RETENTION_DAYS가 지난 폴더를 삭제한다.
+
+        Args:
+            root_dir (str): 실행별 다운로드 폴더의 상위 경로
+        """
+        expire_before = time.time() - self.DOWNLOAD_RETENTION_DAYS * 24 * 60 * 60
+        removed = 0
+        for entry in os.scandir(root_dir):
+            if entry.is_dir() and entry.stat().st_mtime < expire_before:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        if removed:
+            self.logging.log(f"> 보관 기간 지난 다운로드 폴더 삭제 : {removed}개", level="INFO")
+
+    def _prepare_download_dir(self):
+        """
+        이번 실행 전용 다운로드 하위 폴더를 만들고 Chrome 다운로드 경로를 해당 폴더로 바꾼다.
+        - DevTools Browser.setDownloadBehavior가 실패하면 기본 download_dir을 그대로 사용한다.
+        - 다운로드 완료는 파일 폴링(_find_completed_csv)으로 판단한다. (execute_cdp_cmd로는 downloadProgress 이벤트 수신 불가)
+
+        Returns:
+            str: 다운로드 파일이 저장될 폴더 경로
+        """
+        root_dir = os.path.join(os.path.abspath(self.download_dir), self.DOWNLOAD_SUBDIR)
+        os.makedirs(root_dir, exist_ok=True)
+        self._prune_downloads(root_dir)
+
+        run_dir = os.path.join(root_dir, time.strftime('%Y%m%d_%H%M%S'))
+        os.makedirs(run_dir, exist_ok=True)
+        try:
+            self.driver.execute_cdp_cmd('Browser.setDownloadBehavior',
+                                        {'behavior': 'allow', 'downloadPath': run_dir})
+            return run_dir
+        except WebDriverException:
+            os.rmdir(run_dir)
+            return os.path.abspath(self.download_dir)
+
+    @staticmethod
+    def _find_completed_csv(directory, before_files, sizes):
+        """
+        directory에서 새로 생긴 CSV 중 다운로드가 끝난 파일을 찾는다.
+        - Chrome 임시 파일(.crdownload/.tmp)이 남아 있으면 미완료로 본다.
+        - 직전 확인 때와 크기가 같고 0보다 크면 완료로 판단한다.
+
+        Args:
+            directory (str): 다운로드 폴더
+            before_files (set[str]): 다운로드 시작 전 파일명 집합
+            sizes (dict[str, int]): 직전 확인 시 파일 크기 (호출 간 갱신됨)
+
+        Returns:
+            str | None: 완료된 CSV 파일 경로. 없으면 None
+        """
+        names = {entry.name: entry.stat().st_size for entry in os.scandir(directory)
+                 if entry.is_file() and entry.name not in before_files}
+        if any(name.endswith(('.crdownload', '.tmp')) for name in names):
+            return None
+
+        for name, size in names.items():
+            if not name.lower().endswith('.csv'):
+                continue
+            path = os.path.join(directory, name)
+            if size > 0 and sizes.get(path) == size:
+                return path
+            sizes[path] = size
+        return None
+
+    @StepTimer.timed('carib.download_csv', target=lambda self, *args, **kwargs: self.carib_id)
     def download_csv(self, button_selector, timeout=30):
         """
         CSV 다운로드 버튼을 클릭하여 파일을 저장한다.
-        - 생성된 새 파일들 중 .csv 확장자를 탐지하여 경로를 반환한다.
+        - 실행마다 download_dir/downloads/<실행시각> 전용 폴더로 저장하여 다른 파일과 섞이지 않게 한다.
+        - 보관 기간(DOWNLOAD_RETENTION_DAYS)이 지난 실행 폴더는 다운로드 전에 삭제한다.
+        - Chrome 임시 파일이 사라지고 파일 크기가 안정되면 즉시 경로를 반환한다. (DOWNLOAD_POLL 주기 확인)
         - download_dir이 설정되어 있어야 동작한다.
 
         Args:
@@ -201,23 +630,22 @@ class CaribUtils:
         if not self.download_dir:
             raise ValueError("> download_dir가 설정되지 않았습니다.")
 
-        before_files = set(os.listdir(self.download_dir))
+        target_dir = self._prepare_download_dir()
+        before_files = set(os.listdir(target_dir))
 
         # 버튼 클릭
         btn = WebDriverWait(self.driver, 240).until(EC.element_to_be_clickable((By.CSS_SELECTOR, button_selector)))
         btn.click()
 
         # 다운로드 완료 대기
+        sizes = {}
         end_time = time.time() + timeout
         while time.time() < end_time:
-            after_files = set(os.listdir(self.download_dir))
-            new_files = after_files - before_files
-            for f in new_files:
-                if f.lower().endswith(".csv"):
-                    csv_path = os.path.join(self.download_dir, f)
-                    self.logging.log(f"▷ [CARIB] CSV 다운로드 → 완료 : {csv_path}", level="INFO")
-                    return csv_path
-            time.sleep(1)
+            csv_path = self._find_completed_csv(target_dir, before_files, sizes)
+            if csv_path:
+                self.logging.log(f"▷ [CARIB] CSV 다운로드 → 완료 : {csv_path}", level="INFO")
+                return csv_path
+            time.sleep(self.DOWNLOAD_POLL)
 
         raise TimeoutException("> CSV 파일 다운로드가 제한 시간 내에 완료되지 않았습니다.")
 
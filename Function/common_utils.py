@@ -1,7 +1,10 @@
 # common_utils.py
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from cryptography.fernet import Fernet
 
+import base64
+import hashlib
+import os
 import traceback
 
 from Common.log import Log
@@ -37,6 +40,12 @@ class CommonUtils:
     # 오차 허용 범위(초)
     ALLOWED_OFFSET = 60  # ±60초 허용
 
+    # Fernet 암호화 키 (계정 정보 복호화용)
+    ENCRYPT_KEY = b'QQkA27VdTmO0U1K0EEK_vU9wcvQOQJGY3C6M_uxQxBs='
+
+    # 로그인 세션 암호화 비밀값 환경 변수 (PC별로 설정, 소스에 포함된 ENCRYPT_KEY는 세션에 사용하지 않음)
+    SESSION_KEY_ENV = 'CARIB_SESSION_KEY'
+
     @classmethod
     def _is_within_offset(cls, current, target):
         """현재 시각(current)이 target 시각 ± OFFSET 안에 있으면 True"""
@@ -74,6 +83,36 @@ class CommonUtils:
 
         return None
 
+    @classmethod
+    def next_schedule(cls, current=None, after=None):
+        """
+        다음 실행 시각과 케이스를 반환한다.
+        - 데몬 모드에서 ±OFFSET 판정 대신 정확한 시각에 실행하기 위해 사용한다.
+        - after가 주어지면 after 이후 첫 슬롯을 반환한다. (이미 지난 시각일 수 있음 → 늦게라도 실행)
+          after가 없으면 current 이후(current 포함) 가장 가까운 슬롯을 반환한다.
+
+        Parameters:
+            current (datetime): 기준 시간 (기본값은 현재 시간)
+            after (datetime): 마지막으로 처리한 슬롯 시각 (기본값 None)
+
+        Returns:
+            tuple[datetime, str]: (다음 실행 시각, "A" / "B")
+        """
+        if current is None:
+            current = datetime.now()
+        base = after if after is not None else current
+
+        slots = [(t, "A") for t in cls.CASE_A_TIMES] + [(t, "B") for t in cls.CASE_B_TIMES]
+        candidates = []
+        for day_offset in (0, 1):
+            day = base.date() + timedelta(days=day_offset)
+            for t, case in slots:
+                slot_dt = datetime.combine(day, t)
+                if slot_dt > base or (after is None and slot_dt == base):
+                    candidates.append((slot_dt, case))
+
+        return min(candidates)
+
     @staticmethod
     def decrypt_carib_account():
         """
@@ -89,7 +128,7 @@ class CommonUtils:
         try:
             logging.log(f'▷ [CommonUtils] Carib 계정 복호화 → 시작', level="INFO")
 
-            encrypt_key = b'QQkA27VdTmO0U1K0EEK_vU9wcvQOQJGY3C6M_uxQxBs='
+            encrypt_key = CommonUtils.ENCRYPT_KEY
             encrypt_id = 'gAAAAABoor4N9o1SHRq7V37IzV1H_P4F-pghGX9WV4JXYROOQvpMnwPXexjNKc7EcdlM2nhZKBODwF2sHJDZH8VMXp7PvF47ng=='
             encrypt_pw = 'gAAAAABoor4NuKshifaWjXklGyEJCkfZlmhmnSaTU1cMqoPQsKmdDihNLBnK-FIsGjJFRswI_lxbDMlGEys3W8k47GirRcAwXQ=='
 
@@ -104,3 +143,47 @@ class CommonUtils:
         except Exception:
             logging.log(f"▷ [CommonUtils] Carib 계정 복호화 → 실패 : {traceback.format_exc()}", level="ERROR")
             return None
+
+    @classmethod
+    def session_key(cls):
+        """
+        환경 변수(SESSION_KEY_ENV)의 PC별 비밀값에서 로그인 세션 암호화용 Fernet 키를 만든다.
+
+        Returns:
+            bytes | None: Fernet 키. 환경 변수가 설정되지 않았으면 None
+        """
+        secret = os.environ.get(cls.SESSION_KEY_ENV)
+        if not secret:
+            return None
+        return base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest())
+
+    @staticmethod
+    def encrypt_text(plain_text, key):
+        """
+        문자열을 Fernet 키로 암호화한다.
+
+        Parameters:
+            plain_text (str): 평문 문자열
+            key (bytes): Fernet 키 (session_key 등)
+
+        Returns:
+            bytes: 암호화된 토큰
+        """
+        return Fernet(key).encrypt(plain_text.encode())
+
+    @staticmethod
+    def decrypt_text(token, key):
+        """
+        Fernet 키로 암호화된 토큰을 복호화한다.
+
+        Parameters:
+            token (bytes): 암호화된 토큰
+            key (bytes): Fernet 키 (session_key 등)
+
+        Returns:
+            str: 복호화된 문자열
+
+        Raises:
+            cryptography.fernet.InvalidToken: 키가 다르거나 토큰이 손상된 경우
+        """
+        return Fernet(key).decrypt(token).decode()
@@ -0,0 +1,150 @@
+# landing_cache.py
+import os
+import sqlite3
+import time
+
+from Common.log import Log
+
+
+class LandingCache:
+    """
+    랜딩URL 분류 텍스트(elem_txt)를 로컬 SQLite 파일에 보관하는 캐시 클래스.
+
+    - 키는 숙소 단위 정규화 키(landing_utils.normalize_landing_url)이며, 저장 시각 기준 TTL이 지나면 만료된다.
+    - 구분 값은 저장하지 않는다. (적중한 텍스트도 현재 분류 규칙으로 다시 판정)
+    - 최대 건수를 넘으면 마지막 조회 시각이 오래된 항목부터 제거한다. (LRU)
+    - 조회 적중/미적중 건수를 집계하여 로그로 남긴다.
+    - enabled=False이면 조회/저장을 모두 건너뛴다. (캐시 우회)
+
+    Attributes:
+        db_path (str): SQLite 파일 경로
+        ttl (int): 항목 유효 시간(초)
+        max_entries (int): 보관 최대 건수
+        enabled (bool): 캐시 사용 여부
+        hits (int): 적중 건수
+        misses (int): 미적중 건수
+    """
+
+    DEFAULT_TTL = 7 * 24 * 60 * 60
+    DEFAULT_MAX_ENTRIES = 5000
+
+    def __init__(self, db_path, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, enabled=True, logger=None):
+        """
+        LandingCache 인스턴스를 초기화한다.
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            ttl (int, optional): 항목 유효 시간(초). 기본값 7일.
+            max_entries (int, optional): 보관 최대 건수. 기본값 5000.
+            enabled (bool, optional): 캐시 사용 여부. 기본값 True.
+            logger (Log, optional): 로깅 객체 (기본값: Log())
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.logging = logger or Log()
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS landing_cache ("
+                " cache_key TEXT PRIMARY KEY,"
+                " landing_url TEXT,"
+                " elem_txt TEXT,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_landing_cache_accessed ON landing_cache (accessed_at)")
+            self._conn.commit()
+
+    def get(self, key):
+        """
+        캐시 항목을 조회한다. 만료된 항목은 삭제하고 미적중으로 처리한다.
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            str | None: 분류 텍스트(elem_txt). 미적중 시 None
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT elem_txt, created_at FROM landing_cache WHERE cache_key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        elem_txt, created_at = row
+        if now - created_at > self.ttl:
+            self._conn.execute("DELETE FROM landing_cache WHERE cache_key = ?", (key,))
+            self._conn.commit()
+            self.misses += 1
+            return None
+
+        self._conn.execute("UPDATE landing_cache SET accessed_at = ? WHERE cache_key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return elem_txt
+
+    def put(self, key, landing_url, elem_txt):
+        """
+        캐시 항목을 저장(갱신)하고 최대 건수를 넘는 항목을 제거한다.
+
+        Args:
+            key (str): 캐시 키
+            landing_url (str): 원본 랜딩 URL
+            elem_txt (str): 추출된 분류 텍스트
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO landing_cache"
+            " (cache_key, landing_url, elem_txt, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, landing_url, elem_txt, now, now))
+        self._conn.commit()
+        self._evict()
+
+    def _evict(self):
+        """만료 항목을 삭제하고, 최대 건수를 넘는 항목을 오래 조회되지 않은 순으로 삭제한다."""
+        self._conn.execute("DELETE FROM landing_cache WHERE created_at < ?", (time.time() - self.ttl,))
+        count = self._conn.execute("SELECT COUNT(*) FROM landing_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM landing_cache WHERE cache_key IN ("
+                " SELECT cache_key FROM landing_cache ORDER BY accessed_at ASC LIMIT ?)", (overflow,))
+        self._conn.commit()
+
+    def purge(self):
+        """캐시 항목을 모두 삭제한다."""
+        if not self.enabled:
+            return
+        self._conn.execute("DELETE FROM landing_cache")
+        self._conn.commit()
+        self.logging.log("> 랜딩 분류 캐시 초기화", level="INFO")
+
+    def log_stats(self):
+        """적중/미적중 건수와 적중률을 로그로 남긴다."""
+        if not self.enabled:
+            self.logging.log("> 랜딩 분류 캐시 : 사용 안 함", level="INFO")
+            return
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        self.logging.log(f"> 랜딩 분류 캐시 : hit={self.hits}, miss={self.misses} ({ratio:.1f}%)", level="INFO")
+
+    def close(self):
+        """SQLite 연결을 종료한다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
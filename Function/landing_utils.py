@@ -0,0 +1,297 @@
+# landing_utils.py
+import re
+import threading
+from html.parser import HTMLParser
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Common.log import Log
+
+
+SITE_INTERPARK = 'interpark'
+SITE_YANOLJA = 'yanolja'
+
+# 정규화 시 제거할 트래킹 파라미터 (알려진 DSP/분석 도구 전용 파라미터만)
+# 'source', 'ref', 'n_' 등 일반적인 이름은 숙소/객실 식별자일 수 있으므로 제거하지 않는다.
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'dclid', 'msclkid', 'igshid', 'yclid', 'wbraid', 'gbraid',
+    'deep_link_sub1', 'deep_link_sub2', 'deep_link_sub3',
+}
+TRACKING_PREFIXES = ('utm_', 'af_', 'adj_', 'appier_')
+
+# 사이트별 숙소 식별자 추출 규칙 (쿼리 파라미터명 우선, 없으면 경로 정규식)
+# 'detail'/'view' 같은 경로 단어는 식별자로 잡지 않는다. (/goods/detail?goodsCode=... 형태)
+PROPERTY_PATH_PATTERNS = {
+    SITE_INTERPARK: [re.compile(r'/goods/(?:(?:detail|view)/)?(?!(?:detail|view)\b)(\w+)', re.I),
+                     re.compile(r'/product/(?!(?:detail|view)\b)(\w+)', re.I),
+                     re.compile(r'/hotel/(\d+)', re.I)],
+    SITE_YANOLJA: [re.compile(r'/places?/(?:domestic/)?(\d+)', re.I), re.compile(r'/hotel/(\d+)', re.I)],
+}
+PROPERTY_QUERY_KEYS = {
+    SITE_INTERPARK: ('goodscode', 'goods_code', 'goods_cd', 'goodsno', 'goodsid', 'hotelcode', 'productno'),
+    SITE_YANOLJA: ('placeid', 'place_id', 'placeno'),
+}
+
+
+def detect_site(landing_url):
+    """
+    랜딩URL이 어느 숙박 사이트인지 판별한다.
+
+    Args:
+        landing_url (str): 랜딩 URL
+
+    Returns:
+        str | None: 'interpark' / 'yanolja' / None(확인되지 않은 사이트)
+    """
+    if not landing_url:
+        return None
+    if SITE_INTERPARK in landing_url:
+        return SITE_INTERPARK
+    if SITE_YANOLJA in landing_url:
+        return SITE_YANOLJA
+    return None
+
+
+def _unwrap_landing_url(landing_url):
+    """
+    딥링크/리다이렉트 래퍼 URL이면 쿼리에 포함된 실제 interpark/yanolja URL을 꺼낸다.
+
+    Args:
+        landing_url (str): 랜딩 URL
+
+    Returns:
+        str: 실제 숙소 페이지 URL (래퍼가 아니면 입력값 그대로)
+    """
+    for _ in range(3):  # 중첩 래핑 대비 최대 3단계
+        parts = urlsplit(landing_url)
+        if detect_site(parts.netloc):
+            return landing_url
+        inner = None
+        for _, value in parse_qsl(parts.query, keep_blank_values=True):
+            candidate = unquote(value)
+            if candidate.lower().startswith(('http://', 'https://')) and detect_site(candidate):
+                inner = candidate
+                break
+        if inner is None:
+            return landing_url
+        landing_url = inner
+    return landing_url
+
+
+def normalize_landing_url(landing_url):
+    """
+    랜딩URL을 숙소 단위 정규화 키로 변환한다.
+
+    - 딥링크 래퍼 URL은 내부의 실제 숙소 URL로 치환한다.
+    - interpark/yanolja 숙소 식별자를 찾으면 '사이트:식별자' 형태로 반환한다.
+      (식별자 쿼리 파라미터를 경로보다 먼저 확인)
+    - 식별자를 찾지 못하면 트래킹 파라미터와 fragment를 제거하고
+      쿼리를 정렬한 URL을 반환한다.
+
+    Args:
+        landing_url (str): 랜딩 URL
+
+    Returns:
+        str: 정규화 키 (예: 'interpark:12345', 'yanolja:1000112')
+    """
+    url = _unwrap_landing_url(landing_url.strip())
+    parts = urlsplit(url)
+    site = detect_site(parts.netloc) or detect_site(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if site:
+        for key, value in query:
+            if key.lower() in PROPERTY_QUERY_KEYS[site] and value:
+                return f'{site}:{value}'
+        for pattern in PROPERTY_PATH_PATTERNS[site]:
+            match = pattern.search(parts.path)
+            if match:
+                return f'{site}:{match.group(1)}'
+
+    kept = sorted((k, v) for k, v in query
+                  if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), urlencode(kept), ''))
+
+
+class _LandingHTMLParser(HTMLParser):
+    """
+    랜딩 페이지 원본 HTML에서 분류에 필요한 값만 추출하는 경량 파서.
+
+    - interpark : <tr><th>분류</th><td>값</td></tr> 의 td 텍스트
+    - yanolja : <title> 텍스트 및 <h1> 렌더링 여부
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.category = None
+        self.has_h1 = False
+
+        self._in_title = False
+        self._title_buf = []
+        self._cell_tag = None
+        self._cell_buf = []
+        self._row_th = []
+        self._row_td = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title':
+            self._in_title = True
+        elif tag == 'h1':
+            self.has_h1 = True
+        elif tag == 'tr':
+            self._row_th, self._row_td = [], []
+        elif tag in ('th', 'td'):
+            self._cell_tag = tag
+            self._cell_buf = []
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self._in_title = False
+            self.title = ' '.join(''.join(self._title_buf).split())
+        elif tag in ('th', 'td') and self._cell_tag == tag:
+            text = ' '.join(''.join(self._cell_buf).split())
+            (self._row_th if tag == 'th' else self._row_td).append(text)
+            self._cell_tag = None
+        elif tag == 'tr':
+            if self.category is None and '분류' in self._row_th and self._row_td:
+                self.category = self._row_td[0]
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_buf.append(data)
+        if self._cell_tag:
+            self._cell_buf.append(data)
+
+
+class LandingUtils:
+    """
+    랜딩 페이지(interpark/yanolja) 분류 텍스트를 브라우저 없이 HTTP로 추출하는 유틸 클래스.
+
+    - 커넥션 풀을 사용하는 requests.Session 하나를 재사용한다.
+    - 원본 HTML에서 값을 찾지 못하면(JS 렌더링 필요) None을 반환하여
+      호출 측에서 Selenium 경로로 폴백하도록 한다.
+    - 사이트별로 어떤 경로(http/selenium/failed)로 처리되었는지 카운트한다.
+    - Selenium 경로의 페이지 로드 시간/전송 바이트를 사이트·브라우저 프로필별로 집계한다.
+
+    Attributes:
+        timeout (int): HTTP 요청 타임아웃(초)
+        session (requests.Session): 풀링된 HTTP 세션
+        stats (dict[str, dict[str, int]]): 사이트별 처리 경로 카운터
+        load_stats (dict[tuple[str, str], list[tuple[float, int | None]]]): (사이트, 프로필)별 (로드 시간, 전송 바이트) 목록
+    """
+
+    DEFAULT_TIMEOUT = 10
+    DEFAULT_HEADERS = {
+        "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                       "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+    }
+    PATHS = ('http', 'selenium', 'failed')
+
+    def __init__(self, logger=None, timeout=DEFAULT_TIMEOUT, pool_size=10):
+        """
+        LandingUtils 인스턴스를 초기화한다.
+
+        Args:
+            logger (Log, optional): 로깅 객체 (기본값: Log())
+            timeout (int, optional): HTTP 요청 타임아웃(초). 기본값 10.
+            pool_size (int, optional): 호스트별 커넥션 풀 크기. 기본값 10.
+        """
+        self.logging = logger or Log()
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.stats = {}
+        self.load_stats = {}
+        self._lock = threading.Lock()
+
+    def fetch_elem_txt(self, landing_url):
+        """
+        랜딩 페이지를 HTTP로 조회하여 분류 텍스트를 추출한다.
+
+        - interpark : '분류' 셀 텍스트
+        - yanolja : <h1>이 서버 렌더링된 경우의 <title> 텍스트
+
+        Args:
+            landing_url (str): 랜딩 URL
+
+        Returns:
+            str | None: 추출된 텍스트. 원본 HTML만으로 판단할 수 없거나 요청이 실패하면 None
+        """
+        site = detect_site(landing_url)
+        if site is None:
+            return None
+
+        try:
+            response = self.session.get(landing_url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code != 200:
+                return None
+            if 'charset' not in response.headers.get('Content-Type', '').lower():
+                response.encoding = response.apparent_encoding
+
+            parser = _LandingHTMLParser()
+            parser.feed(response.text)
+            parser.close()
+        except Exception as e:
+            self.logging.log(f"> HTTP 조회 실패 (URL={landing_url}) : {type(e).__name__}", level="WARNING")
+            return None
+
+        if site == SITE_INTERPARK:
+            return parser.category or None
+
+        # yanolja : Selenium 경로의 'div > div > h1' 대기 조건과 동일하게 h1 렌더링 여부로 판단
+        if parser.has_h1 and parser.title:
+            return parser.title
+        return None
+
+    def record(self, site, path):
+        """
+        사이트별 처리 경로 카운터를 1 증가시킨다.
+
+        Args:
+            site (str): 사이트 구분 ('interpark' / 'yanolja' / 'unknown')
+            path (str): 처리 경로 ('http' / 'selenium' / 'failed')
+        """
+        with self._lock:
+            counter = self.stats.setdefault(site or 'unknown', dict.fromkeys(self.PATHS, 0))
+            counter[path] = counter.get(path, 0) + 1
+
+    def record_load(self, site, profile, load_secs, transfer_bytes=None):
+        """
+        Selenium 경로의 페이지 로드 시간과 전송 바이트를 기록한다.
+
+        Args:
+            site (str): 사이트 구분 ('interpark' / 'yanolja')
+            profile (str): 브라우저 프로필 ('lean' / 'default')
+            load_secs (float): 페이지 이동부터 분류 요소 확인까지 걸린 시간(초)
+            transfer_bytes (int | None, optional): 전송 바이트 (측정하지 않았으면 None)
+        """
+        with self._lock:
+            self.load_stats.setdefault((site or 'unknown', profile), []).append((load_secs, transfer_bytes))
+
+    def log_stats(self):
+        """사이트별 처리 경로 카운터와 프로필별 페이지 로드 통계를 로그로 남긴다."""
+        with self._lock:
+            for site, counter in sorted(self.stats.items()):
+                summary = ', '.join(f'{path}={counter.get(path, 0)}' for path in self.PATHS)
+                self.logging.log(f"> 랜딩 분류 경로 [{site}] : {summary}", level="INFO")
+
+            for (site, profile), loads in sorted(self.load_stats.items()):
+                avg_secs = sum(secs for secs, _ in loads) / len(loads)
+                measured = [size for _, size in loads if size is not None]
+                avg_kb = f'{sum(measured) / len(measured) / 1024:.0f}KB' if measured else '-'
+                self.logging.log(f"> 랜딩 로드 [{site}/{profile}] : {len(loads)}건, 평균 {avg_secs:.2f}s, "
+                                 f"평균 전송 {avg_kb}", level="INFO")
+
+    def close(self):
+        """HTTP 세션을 종료한다."""
+        self.session.close()
@@ -0,0 +1,154 @@
+# rule_engine.py
+import hashlib
+import json
+import threading
+from collections import deque
+
+from Common.log import Log
+
+
+def normalize_text(text):
+    """매칭용 정규화 : 소문자 변환 후 공백을 모두 제거한다. ('러브 호텔' == '러브호텔')"""
+    return ''.join(text.lower().split()) if text else ''
+
+
+def rules_version(rules):
+    """
+    규칙 목록의 버전(해시)을 반환한다. 구분 값/보류 사유/정규화된 키워드와 우선순위가 같으면 같은 값.
+
+    Args:
+        rules (list[dict]): 규칙 목록
+
+    Returns:
+        str: 12자리 16진수 해시
+    """
+    canonical = [[rule.get('category'), rule.get('hold_reason'),
+                  sorted(normalize_text(keyword) for keyword in rule.get('keywords', []))] for rule in rules]
+    return hashlib.sha1(json.dumps(canonical, ensure_ascii=False).encode('utf-8')).hexdigest()[:12]
+
+
+class RuleEngine:
+    """
+    숙소 분류 텍스트에 제한 업종 키워드 규칙을 적용하는 다중 패턴 매칭 엔진.
+
+    - 모든 규칙의 키워드를 Aho-Corasick 오토마톤 하나로 미리 컴파일하여,
+      키워드 수와 관계없이 텍스트를 한 번만 훑어 일치하는 규칙을 모두 찾는다.
+    - 여러 규칙이 일치하면 규칙 목록 순서(앞쪽 우선)로 대표 규칙을 정한다.
+    - 규칙마다 구분 값(category)과 보류 사유(hold_reason)를 가진다.
+    - classify_many로 여러 텍스트를 한 번에 판정하며 규칙별 적중 건수를 집계한다.
+
+    Attributes:
+        rules (list[dict]): 규칙 목록. 각 규칙은 {'category': str, 'keywords': list[str], 'hold_reason': str}
+        hits (dict[str, int]): 규칙(구분)별 적중 건수
+        version (str): 규칙 목록 버전 (rules_version)
+    """
+
+    def __init__(self, rules, logger=None):
+        """
+        규칙 목록으로 오토마톤을 만든다.
+
+        Args:
+            rules (list[dict]): 규칙 목록 (앞쪽일수록 우선순위 높음)
+            logger (Log, optional): 로깅 객체 (기본값: Log())
+
+        Raises:
+            ValueError: 규칙에 category/keywords/hold_reason이 없거나 키워드가 비어 있는 경우
+        """
+        self.logging = logger or Log()
+        self.rules = list(rules)
+        self.hits = {rule['category']: 0 for rule in self.rules}
+        self.version = rules_version(self.rules)
+        self._lock = threading.Lock()
+
+        # 오토마톤 : 상태별 전이(goto), 실패 링크(fail), 출력(규칙 순번 집합)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+
+        for priority, rule in enumerate(self.rules):
+            if not rule.get('category') or not rule.get('hold_reason') or not rule.get('keywords'):
+                raise ValueError(f"> 분류 규칙 설정 오류 : {rule}")
+            for keyword in rule['keywords']:
+                keyword = normalize_text(keyword)
+                if not keyword:
+                    raise ValueError(f"> 분류 규칙 키워드 오류 : {rule['category']}")
+                self._add(keyword, priority)
+        self._build_fail_links()
+
+    def _add(self, keyword, priority):
+        state = 0
+        for char in keyword:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].add(priority)
+
+    def _build_fail_links(self):
+        """BFS로 실패 링크를 만들고, 실패 링크 상태의 출력을 합쳐 둔다."""
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def match(self, text):
+        """
+        텍스트에서 일치하는 모든 규칙을 우선순위 순으로 반환한다. (적중 건수는 집계하지 않음)
+
+        Args:
+            text (str | None): 분류 텍스트
+
+        Returns:
+            list[dict]: 일치한 규칙 목록 (없으면 빈 리스트)
+        """
+        state, matched = 0, set()
+        for char in normalize_text(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            matched |= self._output[state]
+        return [self.rules[priority] for priority in sorted(matched)]
+
+    def classify(self, text):
+        """
+        텍스트의 대표 규칙(가장 우선순위가 높은 일치 규칙)을 반환한다. (적중 건수는 집계하지 않음)
+
+        Args:
+            text (str | None): 분류 텍스트
+
+        Returns:
+            dict | None: 대표 규칙 (일치 없으면 None)
+        """
+        matched = self.match(text)
+        return matched[0] if matched else None
+
+    def classify_many(self, texts):
+        """
+        여러 텍스트를 한 번에 판정하고 규칙별 적중 건수를 집계한다.
+
+        Args:
+            texts (dict): {키: 분류 텍스트(str | None)}
+
+        Returns:
+            dict: {키: 대표 규칙(dict | None)}
+        """
+        results = {key: self.classify(text) for key, text in texts.items()}
+        with self._lock:
+            for rule in results.values():
+                if rule is not None:
+                    self.hits[rule['category']] += 1
+        return results
+
+    def log_stats(self):
+        """규칙별 적중 건수를 로그로 남긴다."""
+        with self._lock:
+            summary = ', '.join(f'{category}={count}' for category, count in self.hits.items())
+        self.logging.log(f"> 분류 규칙 적중 : {summary}", level="INFO")
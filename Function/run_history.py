@@ -0,0 +1,176 @@
+# run_history.py
+import os
+import sqlite3
+import time
+
+from Common.log import Log
+
+
+class RunHistory:
+    """
+    Case B 실행 이력(심사대상ID별 분류 결과와 보류 결과)을 로컬 SQLite 파일에 보관하는 클래스.
+
+    - 이전 실행에서 처리가 끝난 심사대상ID(제한 업종 아님 판정, 또는 보류 완료)는 다음 실행에서 제외한다.
+    - 처음 보는 ID, 랜딩URL이 바뀐 ID, 분류 실패/보류 미완료 ID만 처리 대상으로 남긴다. (delta)
+      분류 실패('확인불가', 미지원 사이트 포함)는 처리 완료로 보지 않으므로 매 실행 다시 분류된다.
+    - 분류 결과와 함께 분류 규칙 버전(rule_version)을 저장하여, 규칙이 바뀌면 '제한 업종 아님' 판정을 다시 확인한다.
+    - 목록에 계속 남아 있는 ID는 마지막 확인 시각을 갱신하고, 보관 기간이 지난 이력은 삭제한다.
+    - enabled=False이면 모든 행을 처리 대상으로 반환하고 기록을 건너뛴다.
+
+    Attributes:
+        db_path (str): SQLite 파일 경로
+        retention (int): 이력 보관 기간(초)
+        enabled (bool): 이력 사용 여부
+        rule_version (str | None): 현재 분류 규칙 버전
+    """
+
+    DEFAULT_RETENTION = 30 * 24 * 60 * 60
+
+    CATEGORY_UNKNOWN = '확인불가'
+    HOLD_DONE = 'held'
+    HOLD_FAILED = 'failed'
+    HOLD_TEST = 'test'
+
+    def __init__(self, db_path, retention=DEFAULT_RETENTION, enabled=True, rule_version=None, logger=None):
+        """
+        RunHistory 인스턴스를 초기화한다.
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            retention (int, optional): 이력 보관 기간(초). 기본값 30일.
+            enabled (bool, optional): 이력 사용 여부. 기본값 True.
+            rule_version (str, optional): 현재 분류 규칙 버전 (rule_engine.rules_version). 기본값 None.
+            logger (Log, optional): 로깅 객체 (기본값: Log())
+        """
+        self.db_path = db_path
+        self.retention = retention
+        self.enabled = enabled
+        self.rule_version = rule_version
+        self.logging = logger or Log()
+        self._conn = None
+
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS review_history ("
+                " review_target_id TEXT PRIMARY KEY,"
+                " landing_url TEXT,"
+                " category TEXT,"
+                " hold_status TEXT,"
+                " rule_version TEXT,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL)")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(review_history)")}
+            if 'rule_version' not in columns:     # 이전 버전 파일 : 규칙 버전 없음 → 다음 비교 시 재확인
+                self._conn.execute("ALTER TABLE review_history ADD COLUMN rule_version TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_review_history_last_seen ON review_history (last_seen)")
+            self._conn.commit()
+
+    def _is_done(self, category, hold_status, rule_version):
+        """이전 실행에서 처리가 끝난 이력인지 여부"""
+        if category is None:
+            return rule_version == self.rule_version    # 제한 업종 아님 : 같은 규칙으로 판정한 경우만 완료
+        if category == self.CATEGORY_UNKNOWN:
+            # 분류 실패는 완료로 보지 않고 매 실행 다시 처리
+            # (대부분 일시적 조회 오류이며, 미지원 사이트는 네트워크 조회 없이 바로 판정되어 재처리 비용이 작음)
+            return False
+        return hold_status == self.HOLD_DONE    # 제한 업종은 보류 완료 시에만 종료
+
+    def delta(self, df_work_data):
+        """
+        이전 실행에서 처리가 끝나지 않은 행만 남긴 DataFrame을 반환한다.
+
+        - 제외된 행의 마지막 확인 시각을 갱신하고, 보관 기간이 지난 이력을 삭제한다.
+        - 신규/변경/재처리/제외 건수를 로그로 남긴다.
+
+        Args:
+            df_work_data (pandas.DataFrame): '랜딩URL', '심사대상ID' 컬럼을 포함하는 DataFrame
+
+        Returns:
+            tuple[pandas.DataFrame, int]: (처리 대상 DataFrame, 제외된 행 수)
+        """
+        if not self.enabled or df_work_data.empty:
+            return df_work_data, 0
+
+        now = time.time()
+        self._conn.execute("DELETE FROM review_history WHERE last_seen < ?", (now - self.retention,))
+        history = {review_target_id: (landing_url, category, hold_status, rule_version)
+                   for review_target_id, landing_url, category, hold_status, rule_version in self._conn.execute(
+                       "SELECT review_target_id, landing_url, category, hold_status, rule_version"
+                       " FROM review_history")}
+
+        keep, skipped_ids = [], []
+        new_count = changed_count = retry_count = rule_count = 0
+        for review_target_id, landing_url in zip(df_work_data['심사대상ID'].astype(str), df_work_data['랜딩URL']):
+            previous = history.get(review_target_id)
+            if previous is None:
+                new_count += 1
+                keep.append(True)
+            elif previous[0] != landing_url:
+                changed_count += 1
+                keep.append(True)
+            elif previous[1] is None and previous[3] != self.rule_version:
+                rule_count += 1
+                keep.append(True)
+            elif not self._is_done(previous[1], previous[2], previous[3]):
+                retry_count += 1
+                keep.append(True)
+            else:
+                skipped_ids.append(review_target_id)
+                keep.append(False)
+
+        self._conn.executemany("UPDATE review_history SET last_seen = ? WHERE review_target_id = ?",
+                               [(now, review_target_id) for review_target_id in skipped_ids])
+        self._conn.commit()
+
+        self.logging.log(f"> 실행 이력 비교 : 전체 {len(df_work_data)}건 → 처리 {len(df_work_data) - len(skipped_ids)}건 "
+                         f"(신규 {new_count}, 랜딩URL 변경 {changed_count}, 분류 규칙 변경 {rule_count}, "
+                         f"재처리 {retry_count}) / "
+                         f"제외 {len(skipped_ids)}건", level="INFO")
+        return df_work_data[keep].copy(), len(skipped_ids)
+
+    def record_classification(self, df_work_data):
+        """
+        심사대상ID별 랜딩URL과 분류 결과('구분'), 분류 규칙 버전을 저장한다. (보류 결과는 초기화)
+
+        Args:
+            df_work_data (pandas.DataFrame): '랜딩URL', '심사대상ID', '구분' 컬럼을 포함하는 DataFrame
+        """
+        if not self.enabled or df_work_data.empty:
+            return
+
+        now = time.time()
+        rows = [(str(review_target_id), landing_url, None if category is None or category != category else category,
+                 self.rule_version, now, now)
+                for review_target_id, landing_url, category in zip(
+                    df_work_data['심사대상ID'], df_work_data['랜딩URL'], df_work_data['구분'])]
+        self._conn.executemany(
+            "INSERT INTO review_history"
+            " (review_target_id, landing_url, category, hold_status, rule_version, first_seen, last_seen)"
+            " VALUES (?, ?, ?, NULL, ?, ?, ?)"
+            " ON CONFLICT(review_target_id) DO UPDATE SET"
+            " landing_url = excluded.landing_url, category = excluded.category, hold_status = NULL,"
+            " rule_version = excluded.rule_version, last_seen = excluded.last_seen", rows)
+        self._conn.commit()
+
+    def record_holds(self, review_target_ids, hold_status):
+        """
+        심사대상ID들의 보류 결과를 저장한다.
+
+        Args:
+            review_target_ids (Iterable[str]): 심사대상ID 목록
+            hold_status (str): 보류 결과 ('held' / 'failed' / 'test')
+        """
+        if not self.enabled:
+            return
+        self._conn.executemany("UPDATE review_history SET hold_status = ? WHERE review_target_id = ?",
+                               [(hold_status, str(review_target_id)) for review_target_id in review_target_ids])
+        self._conn.commit()
+
+    def close(self):
+        """SQLite 연결을 종료한다."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
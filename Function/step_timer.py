@@ -0,0 +1,211 @@
+# step_timer.py
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from Common.log import Log
+
+
+class _Span:
+    """진행 중인 단계 하나의 기록 (StepTimer.span / timed 내부용)"""
+
+    __slots__ = ('step', 'target', 'outcome', 'retries', 'started_at', 'started')
+
+    def __init__(self, step, target=None):
+        self.step = step
+        self.target = target
+        self.outcome = 'ok'
+        self.retries = 0
+        self.started_at = datetime.now()
+        self.started = time.perf_counter()
+
+
+class StepTimer:
+    """
+    파이프라인 단계별 소요 시간을 밀리초 단위로 기록하는 경량 span/timer 유틸 클래스.
+
+    - span(step, target) 컨텍스트 매니저 또는 timed(step) 데코레이터로 단계를 감싼다.
+    - 단계 내부에서 annotate(retries=..., outcome=...)로 재시도 횟수/결과를 남길 수 있다.
+      (예외로 끝나면 outcome은 'error:<예외명>')
+    - 단계가 끝날 때마다 JSON 한 줄(ts, step, target, outcome, retries, ms, thread)을 기록 파일에 추가한다.
+    - 실행 단위로 단계별 건수/p50/p95/최대 요약표를 로그와 메일 본문에 남긴다. (summary_table, log_report)
+    """
+
+    logging = Log()
+    _records = []       # (step, outcome, ms)
+    _lock = threading.Lock()
+    _local = threading.local()
+    _jsonl = None
+
+    # 기록 -------------------------------------------------------------------------------------------------------------- #
+    @classmethod
+    def reset(cls, jsonl_path=None):
+        """
+        누적 기록을 초기화하고 JSON lines 기록 파일을 연다. (실행 시작 시 호출)
+
+        Args:
+            jsonl_path (str, optional): 단계 기록을 추가할 JSON lines 파일 경로 (None이면 파일 기록 생략)
+        """
+        with cls._lock:
+            cls._records.clear()
+            if cls._jsonl is not None:
+                cls._jsonl.close()
+                cls._jsonl = None
+            if jsonl_path:
+                os.makedirs(os.path.dirname(os.path.abspath(jsonl_path)), exist_ok=True)
+                cls._jsonl = open(jsonl_path, 'a', encoding='utf-8', buffering=1)
+
+    @classmethod
+    def _stack(cls):
+        if not hasattr(cls._local, 'stack'):
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def _finish(cls, span):
+        elapsed_ms = (time.perf_counter() - span.started) * 1000
+        line = json.dumps({
+            'ts': span.started_at.isoformat(timespec='milliseconds'),
+            'step': span.step,
+            'target': None if span.target is None else str(span.target),
+            'outcome': span.outcome,
+            'retries': span.retries,
+            'ms': round(elapsed_ms, 1),
+            'thread': threading.current_thread().name,
+        }, ensure_ascii=False)
+        with cls._lock:
+            cls._records.append((span.step, span.outcome, elapsed_ms))
+            if cls._jsonl is not None:
+                cls._jsonl.write(line + '\n')
+
+    @classmethod
+    @contextmanager
+    def span(cls, step, target=None):
+        """
+        with 블록 하나를 단계로 기록하는 컨텍스트 매니저.
+
+        Args:
+            step (str): 단계명 (예: 'carib.login', 'landing.fetch')
+            target (object, optional): 계정/심사대상ID/URL 등 단계 대상
+
+        Yields:
+            _Span: 진행 중인 단계 (outcome/retries/target 직접 수정 가능)
+        """
+        span = _Span(step, target)
+        stack = cls._stack()
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            if span.outcome == 'ok':
+                span.outcome = f'error:{type(e).__name__}'
+            raise
+        finally:
+            stack.pop()
+            cls._finish(span)
+
+    @classmethod
+    def timed(cls, step, target=None):
+        """
+        함수 호출 전체를 단계로 기록하는 데코레이터.
+
+        Args:
+            step (str): 단계명
+            target (Callable[..., object], optional): 함수 인자를 받아 단계 대상을 반환하는 함수
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with cls.span(step, target(*args, **kwargs) if target else None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @classmethod
+    def annotate(cls, outcome=None, retries=None, target=None):
+        """
+        현재 스레드에서 진행 중인 가장 안쪽 단계에 결과/재시도 횟수/대상을 기록한다. (진행 중인 단계가 없으면 무시)
+
+        Args:
+            outcome (str, optional): 단계 결과 (예: 'http', 'not_found')
+            retries (int, optional): 재시도 횟수
+            target (object, optional): 단계 대상
+        """
+        stack = cls._stack()
+        if not stack:
+            return
+        span = stack[-1]
+        if outcome is not None:
+            span.outcome = outcome
+        if retries is not None:
+            span.retries = retries
+        if target is not None:
+            span.target = target
+
+    # 리포트 ------------------------------------------------------------------------------------------------------------ #
+    @staticmethod
+    def _percentile(sorted_values, q):
+        """nearest-rank 백분위수"""
+        return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+    @classmethod
+    def summary(cls):
+        """
+        단계별 건수/실패 건수/p50/p95/최대(ms)를 집계한다.
+
+        Returns:
+            list[dict]: 단계명 순 요약 행 (step, count, errors, p50, p95, max)
+        """
+        with cls._lock:
+            records = list(cls._records)
+
+        by_step = {}
+        for step, outcome, elapsed_ms in records:
+            by_step.setdefault(step, []).append((outcome, elapsed_ms))
+
+        rows = []
+        for step, items in sorted(by_step.items()):
+            values = sorted(elapsed_ms for _, elapsed_ms in items)
+            rows.append({
+                'step': step,
+                'count': len(values),
+                'errors': sum(1 for outcome, _ in items if outcome.startswith('error')),
+                'p50': cls._percentile(values, 0.50),
+                'p95': cls._percentile(values, 0.95),
+                'max': values[-1],
+            })
+        return rows
+
+    @classmethod
+    def summary_table(cls):
+        """단계별 요약을 고정폭 텍스트 표로 반환한다. (기록이 없으면 빈 문자열)"""
+        rows = cls.summary()
+        if not rows:
+            return ''
+        width = max(len('step'), *(len(row['step']) for row in rows))
+        lines = [f"{'step':<{width}} {'count':>6} {'error':>6} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}"]
+        for row in rows:
+            lines.append(f"{row['step']:<{width}} {row['count']:>6} {row['errors']:>6} "
+                         f"{row['p50']:>10.1f} {row['p95']:>10.1f} {row['max']:>10.1f}")
+        return '\n'.join(lines)
+
+    @classmethod
+    def log_report(cls, logger=None):
+        """
+        단계별 요약표를 로그로 남긴다.
+
+        Args:
+            logger (Log, optional): 로깅 객체 (기본값: 클래스 logging)
+        """
+        logger = logger or cls.logging
+        table = cls.summary_table()
+        if not table:
+            return
+        logger.log("> 단계별 소요 시간", level="INFO")
+        for line in table.splitlines():
+            logger.log(f">   {line}", level="INFO")
@@ -0,0 +1,187 @@
+# tab_pool.py
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from Common.log import Log
+
+
+class TabPool:
+    """
+    작업 탭을 고정 개수로 열어 두고 재사용하는 탭 풀 클래스.
+
+    - 페이지마다 탭을 열고 닫는 대신 같은 탭을 돌려 쓰고, 사용 후 about:blank로 초기화한다.
+    - driver_factory가 주어지면 풀이 드라이버를 소유하며, max_pages 페이지마다 또는
+      탭 메모리가 max_memory_mb를 넘으면 브라우저 전체를 새로 띄운다.
+      (driver_factory가 없으면 공유 드라이버의 작업 탭만 닫고 다시 연다)
+    - 탭이 깨진 경우(핸들 소실 등) 작업 탭을 다시 구성하여 이후 작업에 영향을 주지 않는다.
+    - 탭별 JS 힙 메모리(DevTools Performance.getMetrics)를 주기적으로 측정해 로그로 남긴다.
+
+    Attributes:
+        driver (webdriver.Chrome): 현재 사용 중인 WebDriver 인스턴스
+        size (int): 작업 탭 수
+        max_pages (int): 브라우저(또는 작업 탭) 재시작 주기(페이지 수)
+        max_memory_mb (float): 재시작 기준 탭 메모리(MB)
+        total_pages (int): 처리한 전체 페이지 수
+        recycles (int): 재시작 횟수
+    """
+
+    BLANK_URL = 'about:blank'
+    DEFAULT_MAX_PAGES = 200
+    DEFAULT_MAX_MEMORY_MB = 512
+    MEMORY_CHECK_EVERY = 10     # 메모리 측정 주기(페이지 수)
+
+    def __init__(self, driver=None, size=1, max_pages=DEFAULT_MAX_PAGES, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 driver_factory=None, on_new_tab=None, logger=None):
+        """
+        TabPool 인스턴스를 초기화하고 작업 탭을 연다.
+
+        Args:
+            driver (webdriver.Chrome | None, optional): 공유 드라이버. driver_factory가 없으면 필수.
+                현재 탭은 복귀용(home)으로 남겨 두고 작업 탭을 새로 연다.
+            size (int, optional): 작업 탭 수. 기본값 1.
+            max_pages (int, optional): 재시작 주기(페이지 수). 기본값 200.
+            max_memory_mb (float, optional): 재시작 기준 탭 메모리(MB). 기본값 512.
+            driver_factory (Callable[[], webdriver.Chrome], optional): 풀 전용 드라이버 생성 함수
+            on_new_tab (Callable[[webdriver.Chrome], object], optional): 작업 탭을 새로 열 때마다 호출 (탭 설정용)
+            logger (Log, optional): 로깅 객체 (기본값: Log())
+        """
+        self.size = max(size, 1)
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.driver_factory = driver_factory
+        self.on_new_tab = on_new_tab
+        self.logging = logger or Log()
+
+        self.driver = driver if driver_factory is None else driver_factory()
+        self.home_handle = self.driver.current_window_handle if driver_factory is None else None
+
+        self.total_pages = 0
+        self.recycles = 0
+        self.peak_memory_mb = 0.0
+        self.tab_memory_mb = {}     # {탭 핸들: 최근 측정 메모리(MB)}
+
+        self._handles = []
+        self._next = 0
+        self._pages = 0             # 마지막 재시작 이후 페이지 수
+        self._open_tabs()
+
+    def _open_tabs(self):
+        """작업 탭을 size개가 되도록 연다. (풀 전용 드라이버는 첫 탭도 작업 탭으로 사용)"""
+        if self.driver_factory is not None and not self._handles:
+            self._handles.append(self.driver.current_window_handle)
+            if self.on_new_tab is not None:
+                self.on_new_tab(self.driver)
+
+        while len(self._handles) < self.size:
+            self.driver.switch_to.new_window('tab')
+            self._handles.append(self.driver.current_window_handle)
+            if self.on_new_tab is not None:
+                self.on_new_tab(self.driver)
+
+        self._switch_home()
+
+    def _switch_home(self):
+        if self.home_handle is not None:
+            self.driver.switch_to.window(self.home_handle)
+
+    def _close_tabs(self):
+        """공유 드라이버의 작업 탭을 모두 닫는다."""
+        for handle in self._handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException:
+                pass
+        self._handles = []
+        self.tab_memory_mb.clear()
+        self._switch_home()
+
+    def _rebuild(self):
+        """작업 탭(풀 전용 드라이버면 브라우저 전체)을 새로 구성한다."""
+        if self.driver_factory is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = self.driver_factory()
+            self._handles = []
+            self.tab_memory_mb.clear()
+        else:
+            self._close_tabs()
+        self._pages = 0
+        self._open_tabs()
+
+    def _measure_memory(self, handle):
+        """현재 탭의 JS 힙 사용량(MB)을 측정해 기록한다. (측정 실패 시 None)"""
+        try:
+            self.driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = self.driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+        except WebDriverException:
+            return None
+        used = next((metric['value'] for metric in metrics if metric.get('name') == 'JSHeapUsedSize'), None)
+        if used is None:
+            return None
+        memory_mb = used / (1024 * 1024)
+        self.tab_memory_mb[handle] = memory_mb
+        self.peak_memory_mb = max(self.peak_memory_mb, memory_mb)
+        return memory_mb
+
+    @contextmanager
+    def page(self):
+        """
+        작업 탭 하나로 전환해 드라이버를 넘겨주고, 사용 후 about:blank로 초기화하는 컨텍스트 매니저.
+
+        - 사용 후 공유 드라이버면 원래 탭(home)으로 복귀한다.
+        - 초기화 중 탭 오류가 나면 작업 탭을 다시 구성한다.
+        - 재시작 조건(max_pages / max_memory_mb)을 만족하면 재시작한다.
+
+        Yields:
+            webdriver.Chrome: 작업 탭으로 전환된 드라이버
+        """
+        handle = self._handles[self._next % len(self._handles)]
+        self._next += 1
+        try:
+            self.driver.switch_to.window(handle)
+        except WebDriverException:
+            self._rebuild()
+            handle = self._handles[0]
+            self.driver.switch_to.window(handle)
+
+        try:
+            yield self.driver
+        finally:
+            self._pages += 1
+            self.total_pages += 1
+            memory_mb = None
+            try:
+                if self.total_pages % self.MEMORY_CHECK_EVERY == 0:
+                    memory_mb = self._measure_memory(handle)
+                self.driver.get(self.BLANK_URL)
+                self._switch_home()
+            except WebDriverException as e:
+                self.logging.log(f"> 작업 탭 초기화 실패 : {type(e).__name__} → 탭 재구성", level="WARNING")
+                self._rebuild()
+            else:
+                over_memory = memory_mb is not None and memory_mb > self.max_memory_mb
+                if self._pages >= self.max_pages or over_memory:
+                    reason = f'메모리 {memory_mb:.0f}MB' if over_memory else f'{self._pages}페이지'
+                    self.logging.log(f"> 작업 탭 재시작 ({reason})", level="INFO")
+                    self.recycles += 1
+                    self._rebuild()
+
+    def log_stats(self):
+        """탭 수, 처리 페이지 수, 재시작 횟수, 탭 메모리(최대/현재 합계)를 로그로 남긴다."""
+        total_mb = sum(self.tab_memory_mb.values())
+        self.logging.log(f"> 탭 풀 : 탭 {self.size}개, 페이지 {self.total_pages}건, 재시작 {self.recycles}회, "
+                         f"탭 메모리 최대 {self.peak_memory_mb:.0f}MB / 현재 합계 {total_mb:.0f}MB", level="INFO")
+
+    def close(self):
+        """풀 전용 드라이버면 종료하고, 공유 드라이버면 작업 탭만 닫는다."""
+        try:
+            if self.driver_factory is not None:
+                self.driver.quit()
+            else:
+                self._close_tabs()
+        except WebDriverException:
+            pass
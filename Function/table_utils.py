@@ -0,0 +1,148 @@
+# table_utils.py
+import json
+import threading
+
+from Common.log import Log
+
+
+class TableUtils:
+    """
+    antd 테이블 전체를 execute_script 한 번으로 읽어오는 스냅샷 유틸 클래스.
+
+    - 행마다 find_element로 셀/체크박스를 읽는 대신 행 키, 체크 상태, 셀 텍스트, 링크를
+      한 번의 호출로 JSON으로 받아온다.
+    - 클릭 대상 결정은 파이썬에서 하고, 체크박스 변경도 한 번의 호출로 처리한다. (set_checked)
+    - 행별 조회였다면 필요했을 WebDriver 호출 수를 추정하여 절감량을 실행 단위로 리포트한다.
+
+    Attributes:
+        ROW_SELECTOR (str): 기본 행 CSS Selector
+    """
+
+    ROW_SELECTOR = 'table > tbody > tr'
+    EMPTY_SELECTOR = 'div.ant-empty-description'
+
+    # 행 키는 data-row-key, 없으면 행 텍스트 (페이지가 바뀌어도 같은 행은 같은 키)
+    SNAPSHOT_JS = """
+const [rowSelector, emptySelector] = arguments;
+const headers = Array.from(document.querySelectorAll('table > thead > tr > th')).map((th) => th.innerText.trim());
+const rows = Array.from(document.querySelectorAll(rowSelector))
+    .filter((row) => !row.classList.contains('ant-table-measure-row') && !row.querySelector(emptySelector))
+    .map((row) => {
+        const checkbox = row.querySelector('input[type="checkbox"]');
+        return {
+            key: row.getAttribute('data-row-key') ?? ('#' + row.innerText.trim()),
+            checked: !!(checkbox && checkbox.checked),
+            cells: Array.from(row.querySelectorAll('td')).map((td) => td.innerText.trim()),
+            links: Array.from(row.querySelectorAll('a[href]')).map((a) => a.href),
+        };
+    });
+return JSON.stringify({headers, rows});
+"""
+
+    SET_CHECKED_JS = """
+const [rowSelector, emptySelector, keys, checked] = arguments;
+const targets = new Set(keys.map(String));
+const changed = [];
+Array.from(document.querySelectorAll(rowSelector))
+    .filter((row) => !row.classList.contains('ant-table-measure-row') && !row.querySelector(emptySelector))
+    .forEach((row) => {
+        const key = row.getAttribute('data-row-key') ?? ('#' + row.innerText.trim());
+        const checkbox = row.querySelector('input[type="checkbox"]');
+        if (!targets.has(key) || !checkbox || checkbox.checked === checked) return;
+        checkbox.click();
+        changed.push(key);
+    });
+return changed;
+"""
+
+    logging = Log()
+    _stats = {'snapshots': 0, 'rows': 0, 'saved_calls': 0}
+    _lock = threading.Lock()
+
+    # 기록/리포트 -------------------------------------------------------------------------------------------------------- #
+    @classmethod
+    def _record(cls, snapshots, rows, saved_calls):
+        with cls._lock:
+            cls._stats['snapshots'] += snapshots
+            cls._stats['rows'] += rows
+            cls._stats['saved_calls'] += saved_calls
+
+    @classmethod
+    def reset(cls):
+        """누적된 스냅샷 기록을 초기화한다. (실행 시작 시 호출)"""
+        with cls._lock:
+            for key in cls._stats:
+                cls._stats[key] = 0
+
+    @classmethod
+    def log_report(cls, logger=None):
+        """
+        스냅샷 호출 수, 읽은 행 수, 절감한 WebDriver 호출 수(추정)를 로그로 남긴다.
+
+        Args:
+            logger (Log, optional): 로깅 객체 (기본값: 클래스 logging)
+        """
+        logger = logger or cls.logging
+        with cls._lock:
+            stats = dict(cls._stats)
+        logger.log(f"> 테이블 스냅샷 : {stats['snapshots']}회, 행 {stats['rows']}건, "
+                   f"WebDriver 호출 약 {stats['saved_calls']}회 절감", level="INFO")
+
+    # 스냅샷/선택 -------------------------------------------------------------------------------------------------------- #
+    @classmethod
+    def snapshot(cls, driver, row_selector=ROW_SELECTOR):
+        """
+        현재 테이블의 모든 행을 한 번의 execute_script로 읽어온다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            row_selector (str, optional): 행 CSS Selector. 기본값 'table > tbody > tr'
+
+        Returns:
+            list[dict]: 행 목록. 각 행은
+                - key (str): data-row-key (없으면 '#' + 행 텍스트)
+                - checked (bool): 행 체크박스 선택 여부
+                - cells (dict[str, str]): 헤더명 → 셀 텍스트 (헤더가 비어 있으면 'col<순번>')
+                - links (list[str]): 행 내부 링크 URL
+
+        Raises:
+            JavascriptException: JS 실행 중 오류가 발생한 경우
+        """
+        result = json.loads(driver.execute_script(cls.SNAPSHOT_JS, row_selector, cls.EMPTY_SELECTOR) or '{}')
+        headers = result.get('headers', [])
+        rows = []
+        for row in result.get('rows', []):
+            cells = {}
+            for index, text in enumerate(row['cells']):
+                header = headers[index] if index < len(headers) and headers[index] else f'col{index}'
+                cells.setdefault(header, text)
+            rows.append({'key': row['key'], 'checked': row['checked'], 'cells': cells, 'links': row['links']})
+
+        # 행별 조회 시 : 행 목록 1회 + 행마다 (키 1회 + 체크박스 1회 + 셀 수 + 링크 1회)
+        per_row_calls = 1 + sum(3 + len(row['cells']) for row in rows)
+        cls._record(1, len(rows), per_row_calls - 1)
+        return rows
+
+    @classmethod
+    def set_checked(cls, driver, keys, checked=True, row_selector=ROW_SELECTOR):
+        """
+        행 키가 keys에 포함된 행의 체크박스를 한 번의 execute_script로 선택(해제)한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            keys (Iterable[str]): 대상 행 키 (snapshot의 key)
+            checked (bool, optional): True면 선택, False면 해제. 기본값 True.
+            row_selector (str, optional): 행 CSS Selector. 기본값 'table > tbody > tr'
+
+        Returns:
+            list[str]: 상태가 변경된 행 키 목록
+
+        Raises:
+            JavascriptException: JS 실행 중 오류가 발생한 경우
+        """
+        keys = [str(key) for key in keys]
+        if not keys:
+            return []
+        changed = driver.execute_script(cls.SET_CHECKED_JS, row_selector, cls.EMPTY_SELECTOR, keys, checked) or []
+        cls._record(0, 0, max(len(changed) - 1, 0))    # 행별 클릭 대비
+        return changed
@@ -0,0 +1,283 @@
+# wait_utils.py
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, TimeoutException)
+
+from Common.log import Log
+
+
+class WaitUtils:
+    """
+    고정 time.sleep 대신 페이지 상태를 확인하며 기다리는 공통 대기 유틸 클래스.
+
+    - 조건이 충족되는 즉시 반환하므로 고정 대기보다 빠르다.
+    - 각 대기 호출의 실제 대기 시간과 기존 고정 대기 예산(budget)을 기록하여
+      실행 단위로 비교 리포트를 남길 수 있다. (log_report)
+
+    Attributes:
+        POLL_INTERVAL (float): 조건 확인 주기(초)
+        DEFAULT_TIMEOUT (int): 기본 최대 대기 시간(초)
+        STABLE_SECS (float): '안정' 판정을 위해 값이 유지되어야 하는 시간(초)
+    """
+
+    POLL_INTERVAL = 0.2
+    DEFAULT_TIMEOUT = 60
+    STABLE_SECS = 0.5
+
+    SPINNER_SELECTOR = '.ant-spin-spinning, .ant-spin-dot-spin'
+    DROPDOWN_SELECTOR = '.ant-select-dropdown:not(.ant-select-dropdown-hidden):not([aria-hidden="true"])'
+    EMPTY_SELECTOR = 'div.ant-empty-description'
+    REFRESH_GRACE = 5       # table_refresh : 테이블 변화가 없을 때 이전 결과와 같다고 볼 때까지의 시간(초)
+
+    # 테이블 영역(없으면 body)의 DOM 변화를 감시하여 window.__tableRefreshed 플래그를 세운다.
+    ARM_REFRESH_JS = """
+if (window.__tableObserver) window.__tableObserver.disconnect();
+window.__tableRefreshed = false;
+const target = document.querySelector('.ant-table-wrapper') || document.body;
+window.__tableObserver = new MutationObserver(() => {
+    window.__tableRefreshed = true;
+    window.__tableObserver.disconnect();
+});
+window.__tableObserver.observe(target, {childList: true, subtree: true, characterData: true, attributes: true});
+"""
+
+    logging = Log()
+    _records = []
+    _lock = threading.Lock()
+
+    # 기록/리포트 -------------------------------------------------------------------------------------------------------- #
+    @classmethod
+    def _record(cls, name, started, budget):
+        with cls._lock:
+            cls._records.append((name, time.perf_counter() - started, budget))
+
+    @classmethod
+    def reset(cls):
+        """누적된 대기 기록을 초기화한다. (실행 시작 시 호출)"""
+        with cls._lock:
+            cls._records.clear()
+
+    @classmethod
+    def log_report(cls, logger=None):
+        """
+        대기 종류별 호출 수, 실제 대기 시간 합계, 기존 고정 대기 예산 합계를 로그로 남긴다.
+
+        Args:
+            logger (Log, optional): 로깅 객체 (기본값: 클래스 logging)
+        """
+        logger = logger or cls.logging
+        with cls._lock:
+            records = list(cls._records)
+
+        summary = {}
+        for name, waited, budget in records:
+            count, waited_sum, budget_sum = summary.get(name, (0, 0.0, 0.0))
+            summary[name] = (count + 1, waited_sum + waited, budget_sum + budget)
+
+        total_waited = sum(waited for _, waited, _ in records)
+        total_budget = sum(budget for _, _, budget in records)
+        logger.log(f"> 대기 리포트 : 실제 {total_waited:.1f}s / 기존 고정 대기 {total_budget:.1f}s", level="INFO")
+        for name, (count, waited_sum, budget_sum) in sorted(summary.items()):
+            logger.log(f">   {name} : {count}회, 실제 {waited_sum:.1f}s / 기존 {budget_sum:.1f}s", level="INFO")
+
+    # 대기 조건 ---------------------------------------------------------------------------------------------------------- #
+    @classmethod
+    def _until(cls, driver, condition, timeout, name, budget):
+        started = time.perf_counter()
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=cls.POLL_INTERVAL,
+                                 ignored_exceptions=(NoSuchElementException, StaleElementReferenceException,
+                                                     JavascriptException)).until(condition)
+        finally:
+            cls._record(name, started, budget)
+
+    @classmethod
+    def _stable(cls, probe):
+        """probe() 값이 STABLE_SECS 동안 변하지 않으면 (값,) 튜플을 반환하는 조건 함수를 만든다. (None은 미충족)"""
+        state = {'value': None, 'since': None}
+
+        def _condition(driver):
+            value = probe(driver)
+            now = time.perf_counter()
+            if value is None or value != state['value']:
+                state['value'], state['since'] = value, now
+                return False
+            return (value,) if now - state['since'] >= cls.STABLE_SECS else False
+        return _condition
+
+    @classmethod
+    def element(cls, driver, css_selector, timeout=DEFAULT_TIMEOUT, clickable=False, budget=0, name='element'):
+        """
+        요소가 나타날(clickable=True면 클릭 가능해질) 때까지 대기한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            css_selector (str): 대상 요소 CSS Selector
+            timeout (int, optional): 최대 대기 시간(초)
+            clickable (bool, optional): 클릭 가능 상태까지 대기할지 여부. 기본값 False.
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Returns:
+            WebElement: 대상 요소
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        locator = (By.CSS_SELECTOR, css_selector)
+        condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+        return cls._until(driver, condition, timeout, name, budget)
+
+    @classmethod
+    def network_idle(cls, driver, timeout=DEFAULT_TIMEOUT, budget=0, name='network_idle'):
+        """
+        문서 로딩이 끝나고 리소스 요청 수가 STABLE_SECS 동안 늘지 않을 때까지 대기한다.
+        - 대기 시작 시 리소스 타이밍 기록을 비운다. (기록 버퍼가 가득 차 새 요청이 집계되지 않는 것 방지)
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        driver.execute_script("performance.clearResourceTimings();")
+
+        def _probe(d):
+            return d.execute_script(
+                "return document.readyState === 'complete' "
+                "? performance.getEntriesByType('resource').length : null;")
+        cls._until(driver, cls._stable(_probe), timeout, name, budget)
+
+    @classmethod
+    def spinner_gone(cls, driver, timeout=DEFAULT_TIMEOUT, budget=0, name='spinner_gone'):
+        """
+        antd 로딩 스피너가 화면에서 사라질 때까지 대기한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        def _condition(d):
+            return d.execute_script(
+                "return document.readyState === 'complete' && !document.querySelector(arguments[0]);",
+                cls.SPINNER_SELECTOR)
+        return cls._until(driver, _condition, timeout, name, budget)
+
+    @classmethod
+    def table_rows_stable(cls, driver, row_selector='table > tbody > tr', timeout=DEFAULT_TIMEOUT,
+                          budget=0, name='table_rows_stable'):
+        """
+        스피너가 없고 테이블 행 수가 STABLE_SECS 동안 변하지 않을 때까지 대기한다.
+        - '데이터가 없습니다'가 표시된 경우 행 수 0으로 판단한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            row_selector (str, optional): 행 CSS Selector. 기본값 'table > tbody > tr'
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Returns:
+            int: 안정화된 행 수 (데이터 없음이면 0)
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        def _probe(d):
+            return d.execute_script(
+                "if (document.querySelector(arguments[2])) return null;"
+                "if (document.querySelector(arguments[1])) return -1;"
+                "const rows = document.querySelectorAll(arguments[0]).length;"
+                "return rows > 0 ? rows : null;", row_selector, cls.EMPTY_SELECTOR, cls.SPINNER_SELECTOR)
+        rows, = cls._until(driver, cls._stable(_probe), timeout, name, budget)
+        return max(rows, 0)
+
+    @classmethod
+    def table_refresh(cls, driver, action, row_selector='table > tbody > tr', timeout=DEFAULT_TIMEOUT,
+                      budget=0, name='table_refresh'):
+        """
+        action()(조회/다음 페이지 클릭 등)으로 테이블이 다시 그려진 뒤 안정화될 때까지 대기한다.
+
+        - action 실행 전에 테이블 영역에 MutationObserver를 걸어 두고, 행/스피너 등 DOM 변화가
+          관찰된 뒤에만 안정화 판정(table_rows_stable)을 시작한다.
+          (클릭 직후 이전 행이나 이전 '데이터가 없습니다'가 STABLE_SECS 동안 그대로 남아 안정으로 오인되는 것 방지)
+        - REFRESH_GRACE 동안 아무 변화가 없으면 결과가 이전과 같다고 보고 안정화 판정으로 넘어간다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            action (Callable[[], object]): 테이블을 다시 조회하는 동작
+            row_selector (str, optional): 행 CSS Selector. 기본값 'table > tbody > tr'
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Returns:
+            int: 안정화된 행 수 (데이터 없음이면 0)
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        driver.execute_script(cls.ARM_REFRESH_JS)
+        action()
+
+        started = time.perf_counter()
+        try:
+            WebDriverWait(driver, min(timeout, cls.REFRESH_GRACE), poll_frequency=cls.POLL_INTERVAL,
+                          ignored_exceptions=(JavascriptException,)).until(
+                lambda d: d.execute_script("return window.__tableRefreshed === true;"))
+        except TimeoutException:
+            pass    # 변화 없음 : 이전과 같은 결과
+        finally:
+            cls._record(f'{name}_change', started, 0)
+        return cls.table_rows_stable(driver, row_selector=row_selector, timeout=timeout, budget=budget, name=name)
+
+    @classmethod
+    def antd_dropdown(cls, driver, timeout=DEFAULT_TIMEOUT, budget=0, name='antd_dropdown'):
+        """
+        body 하단에 렌더링되는 antd Select 드롭다운이 표시될 때까지 대기한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Returns:
+            WebElement: 표시된 드롭다운 요소
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        return cls._until(driver, EC.visibility_of_element_located((By.CSS_SELECTOR, cls.DROPDOWN_SELECTOR)),
+                          timeout, name, budget)
+
+    @classmethod
+    def element_gone(cls, driver, css_selector, timeout=DEFAULT_TIMEOUT, budget=0, name='element_gone'):
+        """
+        요소가 사라지거나 보이지 않게 될 때까지 대기한다.
+
+        Args:
+            driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+            css_selector (str): 대상 요소 CSS Selector
+            timeout (int, optional): 최대 대기 시간(초)
+            budget (float, optional): 이 대기가 대체한 기존 고정 대기 시간(초)
+            name (str, optional): 리포트에 표시할 대기 이름
+
+        Raises:
+            TimeoutException: 제한 시간 내 조건이 충족되지 않은 경우
+        """
+        return cls._until(driver, EC.invisibility_of_element_located((By.CSS_SELECTOR, css_selector)),
+                          timeout, name, budget)
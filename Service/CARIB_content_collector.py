@@ -1,14 +1,18 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import (
     TimeoutException, WebDriverException, JavascriptException)
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 
 from Common.log import Log
 from Service.constants import Constants
+from Function.wait_utils import WaitUtils
+from Function.table_utils import TableUtils
+from Function.step_timer import StepTimer
 
 # 상수 모음 ============================================================================================================ #
 DEFAULT_WAIT = 120
@@ -16,18 +20,24 @@ AD_ACCOUNT_IDS = [
     "*interpark.tour*",
     "*yanolja*"
 ]
+PAGE_SIZE = 1000            # 결과 테이블 페이지 크기 (페이지네이션 옵션 '<n> / 페이지'에 있는 값)
+MAX_PAGES = 200             # 결과 페이지 순회 상한 (무한 루프 방지)
+COLLECT_WORKERS = 2         # 광고계정 동시 처리 수 (1 이하면 메인 드라이버로 순차 처리)
+WORKER_HEADLESS = True      # 세션 복사 드라이버 헤드리스 실행 여부
 
 # 클래스 초기화 ======================================================================================================== #
 logging = Log()
 constants = Constants()
 
 # ==================================================================================================================== #
-def _setup_page_option(driver):
+@StepTimer.timed('setup_page_option')
+def _setup_page_option(driver, page_size=PAGE_SIZE):
     """
-    페이지네이션 옵션을 '1000 / 페이지'로 설정하고 테이블 로우가 표시될 때까지 대기한다.
+    페이지네이션 옵션을 '<page_size> / 페이지'로 설정하고 테이블 로우가 표시될 때까지 대기한다.
 
     Args:
         driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        page_size (int, optional): 페이지 크기. 기본값 PAGE_SIZE.
 
     Returns:
         None
@@ -44,18 +54,19 @@ def _setup_page_option(driver):
 
     last_err = None
     for attempt in range(1, max_retries + 1):
+        StepTimer.annotate(retries=attempt - 1)
         try:
-            time.sleep(5)
+            WaitUtils.table_rows_stable(driver, timeout=DEFAULT_WAIT, budget=5, name='page_option_table')
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")     # 스크롤 맨 아래로
-            time.sleep(10)
 
-            driver.find_element(By.CSS_SELECTOR,     # 페이지 콤보 박스
-                                'ul > li > div > div.ant-select-selector').click()
-            time.sleep(5)
-            driver.find_element(By.CSS_SELECTOR,     # 1000 / 페이지
-                                'div[role="option"][id="rc_select_2_list_3"][title="1000 / 페이지"]').click()
+            WaitUtils.element(driver, 'ul > li > div > div.ant-select-selector',     # 페이지 콤보 박스
+                              timeout=DEFAULT_WAIT, clickable=True, budget=10, name='page_option_combo').click()
+            WaitUtils.antd_dropdown(driver, timeout=DEFAULT_WAIT, budget=5, name='page_option_dropdown')
+            driver.find_element(By.CSS_SELECTOR,     # <page_size> / 페이지
+                                f'div[role="option"][title="{page_size} / 페이지"], '
+                                f'.ant-select-item-option[title="{page_size} / 페이지"]').click()
 
-            WebDriverWait(driver, DEFAULT_WAIT).until(EC.presence_of_element_located((By.CSS_SELECTOR, "table > tbody")))
+            WaitUtils.table_rows_stable(driver, timeout=DEFAULT_WAIT, name='page_option_table')
 
             logging.log("▷ 페이지 옵션 설정 → 완료", level="INFO")
             return  # 성공 시 종료
@@ -67,20 +78,155 @@ def _setup_page_option(driver):
             time.sleep(wait_secs)
 
     logging.log("> 페이지 옵션 설정 실패 : 최대 재시도 초과", level="ERROR")
-    raise TimeoutException("> 페이지 옵션 설정 실패(1000 / 쪽). 마지막 오류: " + (str(last_err) if last_err else "unknown"))
+    raise TimeoutException(f"> 페이지 옵션 설정 실패({page_size} / 쪽). 마지막 오류: " + (str(last_err) if last_err else "unknown"))
 
-def process_content_collection(driver, test_mode=False):
+def _page_row_keys(driver):
+    """현재 테이블 행의 식별 키 목록을 반환한다. (TableUtils 스냅샷 1회)"""
+    return tuple(row['key'] for row in TableUtils.snapshot(driver))
+
+def _active_page(driver):
+    """현재 활성화된 페이지네이션 번호(title)를 반환한다. (페이지네이션이 없으면 None)"""
+    return driver.execute_script(
+        "const item = document.querySelector('li.ant-pagination-item-active');"
+        "return item ? (item.getAttribute('title') || item.innerText.trim()) : null;")
+
+def iter_result_pages(driver, max_pages=MAX_PAGES, name='result_page'):
+    """
+    현재 조회 결과의 모든 페이지를 차례로 순회하는 제너레이터.
+
+    - 현재 페이지의 행 수를 확인하여 (페이지 번호, 행 수)를 yield 한다.
+    - 다음 값을 요청받으면 현재 페이지를 다시 읽어, 소비 측 처리('내가 처리하기', '심사 보류')로
+      행이 목록에서 빠져 구성이 바뀌었으면 같은 페이지를 다시 yield 하고,
+      바뀌지 않았으면 다음 페이지 버튼을 눌러 넘어간다.
+    - 다음 페이지로 넘어갈 때는 테이블이 다시 그려지고(WaitUtils.table_refresh) 활성 페이지 번호가
+      바뀐 뒤에만 새 페이지로 판단한다. (이전 페이지 중복 수집/다음 페이지 누락 방지)
+    - 결과가 비었거나, 다음 페이지가 없거나, max_pages에 도달하면 종료한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스 (조회가 완료된 상태)
+        max_pages (int, optional): 최대 yield 횟수. 기본값 MAX_PAGES.
+        name (str, optional): 대기 리포트에 표시할 이름
+
+    Yields:
+        tuple[int, int]: (페이지 번호, 행 수)
+
+    Raises:
+        TimeoutException: 페이지 로딩이 시간 초과된 경우
+    """
+    page_no = 1
+    rows = WaitUtils.table_rows_stable(driver, timeout=DEFAULT_WAIT, name=name)
+    for _ in range(max_pages):
+        if not rows:
+            return
+        row_keys = _page_row_keys(driver)
+        yield page_no, rows
+
+        WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, name=name)
+        rows = WaitUtils.table_rows_stable(driver, timeout=DEFAULT_WAIT, name=name)
+        if rows and _page_row_keys(driver) != row_keys:
+            continue    # 처리된 행이 빠지고 뒤의 행이 당겨짐 → 같은 페이지 재확인
+
+        next_buttons = driver.find_elements(By.CSS_SELECTOR, 'li.ant-pagination-next:not(.ant-pagination-disabled)')
+        if not next_buttons:
+            return
+
+        # 이전 페이지가 '안정'으로 오인되지 않도록 테이블 재렌더링과 활성 페이지 번호 변경을 모두 확인
+        active_page = _active_page(driver)
+        WaitUtils.table_refresh(driver, next_buttons[0].click, timeout=DEFAULT_WAIT, name=name)
+        WebDriverWait(driver, DEFAULT_WAIT, poll_frequency=WaitUtils.POLL_INTERVAL).until(
+            lambda d: _active_page(d) != active_page)
+        rows = WaitUtils.table_rows_stable(driver, timeout=DEFAULT_WAIT, name=name)
+        page_no += 1
+    logging.log(f"> 결과 페이지 순회 상한 도달 ({max_pages})", level="WARNING")
+
+def _collect_account(driver, ad_account_id, test_mode, claim_lock, claimed_keys):
+    """
+    광고계정 하나를 검색하여 결과 전체를 페이지 단위로 선택하고 '내가 처리하기'로 가져온다.
+
+    - 결과가 비거나 마지막 페이지까지 페이지마다 선택/처리를 반복한다. (iter_result_pages)
+    - 행 정보는 TableUtils 스냅샷 1회로 읽고, 선택은 행 키 기준 1회 호출로 처리한다.
+    - '내가 처리하기'는 claim_lock으로 직렬화한다.
+      다른 작업자가 이미 가져간 행(claimed_keys)이 선택되어 있으면 선택을 해제한 뒤 클릭하여 중복 처리를 막는다.
+    - 단계별(검색/선택/처리) 소요 시간과 확인/처리 행 수를 반환한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스 (페이지 옵션 설정 완료 상태)
+        ad_account_id (str): 검색할 광고계정 ID 패턴
+        test_mode (bool): True일 경우 '내가 처리하기' 버튼 클릭을 생략
+        claim_lock (threading.Lock): '내가 처리하기' 직렬화용 락
+        claimed_keys (set[str]): 이번 실행에서 이미 가져간 행 키 집합 (공유)
+
+    Returns:
+        tuple[dict[str, float], int, int]: (단계별 소요 시간(초), 확인한 행 수, 처리한 행 수)
+    """
+    timings = dict.fromkeys(('검색', '선택', '처리'), 0.0)
+    seen_keys = set()
+    processed = 0
+
+    started = time.perf_counter()
+    logging.log(f"> 검색 광고계정 ID : {ad_account_id}", level="INFO")
+    input_box = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="검색할 내용을 입력하세요."]')
+    input_box.send_keys(Keys.CONTROL, 'a')
+    input_box.send_keys(Keys.DELETE)
+    input_box.send_keys(ad_account_id)
+    submit = driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]')    # 조회 버튼
+
+    WaitUtils.table_refresh(driver, submit.click, timeout=DEFAULT_WAIT, budget=11, name='collection_search')
+    timings['검색'] += time.perf_counter() - started
+
+    for page_no, _ in iter_result_pages(driver, name='collection_page'):
+        started = time.perf_counter()
+        page_keys = [row['key'] for row in TableUtils.snapshot(driver)]
+        seen_keys.update(page_keys)
+        # 다른 작업자가 이미 가져간 행은 처음부터 제외하고 선택
+        row_keys = [key for key in page_keys if key not in claimed_keys]
+        TableUtils.set_checked(driver, row_keys)
+        timings['선택'] += time.perf_counter() - started
+
+        # 테스트 모드면 '내가 처리하기' 클릭 건너뜀
+        if test_mode:
+            logging.log(f"> (테스트 모드) '내가 처리하기' 클릭 생략 ({ad_account_id} / {page_no}페이지)", level="INFO")
+            continue
+
+        started = time.perf_counter()
+        with claim_lock:
+            # 선택 이후 다른 작업자가 가져간 행은 선택 해제
+            duplicated = [key for key in row_keys if key in claimed_keys]
+            if duplicated:
+                logging.log(f"> 다른 작업자가 처리한 행 {len(duplicated)}건 선택 해제 ({ad_account_id})", level="INFO")
+                TableUtils.set_checked(driver, duplicated, checked=False)
+                row_keys = [key for key in row_keys if key not in claimed_keys]
+
+            if row_keys:
+                driver.find_element(By.CSS_SELECTOR,     # 내가 처리하기 버튼
+                                    '#mainContent > div > div > div > div > div > div > div > button:nth-child(11)').click()
+                WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=5, name='collection_claim')
+                claimed_keys.update(row_keys)
+                processed += len(row_keys)
+        timings['처리'] += time.perf_counter() - started
+
+    if not seen_keys:
+        logging.log(f"> 데이터가 없습니다. ({ad_account_id})", level="INFO")
+    return timings, len(seen_keys), processed
+
+def process_content_collection(driver, test_mode=False, carib_utils=None, workers=COLLECT_WORKERS):
     """
     광고계정별 심사 데이터 수집을 수행한다.
 
     - 각 광고계정 ID를 검색 입력창에 넣고 조회 버튼을 클릭한다.
     - 결과가 없으면 스킵한다.
-    - 결과 테이블이 로드되면 체크박스를 선택한다.
+    - 결과 테이블이 로드되면 체크박스를 선택한다. (결과가 여러 페이지면 마지막 페이지까지 반복)
     - test_mode=False 인 경우에만 '내가 처리하기' 버튼을 클릭한다.
+    - carib_utils가 주어지고 workers > 1이면 로그인 세션을 복사한 드라이버(carib_utils.clone_session)로
+      광고계정을 동시에 처리한다. ('내가 처리하기'는 직렬화하고 중복 선택 행은 해제)
+      세션 복사 또는 복사 드라이버에서의 처리가 실패한 계정은 메인 드라이버 작업이 끝난 뒤 메인 드라이버로 다시 처리한다.
+    - 광고계정별 단계 소요 시간과 확인/처리 행 수를 로그로 남긴다.
 
     Args:
         driver (webdriver.Chrome): Selenium WebDriver 인스턴스
         test_mode (bool, optional): True일 경우 '내가 처리하기' 버튼 클릭을 생략. 기본값 False.
+        carib_utils (CaribUtils, optional): 병렬 처리 시 세션 복사에 사용할 CaribUtils 인스턴스
+        workers (int, optional): 광고계정 동시 처리 수. 기본값 COLLECT_WORKERS.
 
     Returns:
         None
@@ -91,39 +237,63 @@ def process_content_collection(driver, test_mode=False):
         JavascriptException: JS 실행 중 오류가 발생한 경우
     """
     logging.log("▷ [CARIB] 여행/숙박 소재 자동 수집 → 시작", level="INFO")
-    _setup_page_option(driver)
-    time.sleep(5)
 
-    for ad_account_id in AD_ACCOUNT_IDS:
+    claim_lock = threading.Lock()
+    claimed_keys = set()
+    account_results = {}
+    retry_ids = set()       # 세션 복사 드라이버에서 처리하지 못해 메인 드라이버로 다시 처리할 계정
+
+    def _run(account_driver, ad_account_id):
         try:
-            logging.log(f"> 검색 광고계정 ID : {ad_account_id}", level="INFO")
-            input_box = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="검색할 내용을 입력하세요."]')
-            input_box.send_keys(Keys.CONTROL, 'a')
-            input_box.send_keys(Keys.DELETE)
-            input_box.send_keys(ad_account_id)
-            time.sleep(1)
-            driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]').click()    # 조회 버튼
-            time.sleep(5)
-
-            if driver.execute_script('return document.querySelector("div.ant-empty-description")'):
-                logging.log("> 데이터가 없습니다.", level="INFO")
-                continue
-
-            WebDriverWait(driver, DEFAULT_WAIT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table > tbody > tr")))
-            time.sleep(5)
-            driver.find_element(By.CSS_SELECTOR,     # 체크박스
-                                'table > thead > tr > th > div > label > span > input[type="checkbox"]').click()
-
-            # 테스트 모드면 '내가 처리하기' 클릭 건너뜀
-            if test_mode:
-                logging.log("> (테스트 모드) '내가 처리하기' 클릭 생략", level="INFO")
-            else:
-                driver.find_element(By.CSS_SELECTOR,     # 내가 처리하기 버튼
-                                    '#mainContent > div > div > div > div > div > div > div > button:nth-child(11)').click()
-                time.sleep(5)
+            account_results[ad_account_id] = _collect_account(
+                account_driver, ad_account_id, test_mode, claim_lock, claimed_keys)
         except (TimeoutException, WebDriverException, JavascriptException) as e:
             logging.log(f"> 계정 처리 실패({ad_account_id}) : {type(e).__name__}", level="WARNING")
+
+    def _run_cloned(ad_account_id):
+        account_driver = None
+        try:
+            account_driver = carib_utils.clone_session(headless=WORKER_HEADLESS)
+            _setup_page_option(account_driver)
+            WaitUtils.spinner_gone(account_driver, timeout=DEFAULT_WAIT, budget=5, name='collection_ready')
+            account_results[ad_account_id] = _collect_account(
+                account_driver, ad_account_id, test_mode, claim_lock, claimed_keys)
+        except (TimeoutException, WebDriverException, JavascriptException) as e:
+            logging.log(f"> 세션 복사 드라이버 처리 실패({ad_account_id}) : {type(e).__name__} → 메인 드라이버로 재처리",
+                        level="INFO")
+            with claim_lock:
+                retry_ids.add(ad_account_id)
+        finally:
+            if account_driver is not None:
+                account_driver.quit()
+
+    if carib_utils is not None and workers and workers > 1 and len(AD_ACCOUNT_IDS) > 1:
+        # 첫 계정은 메인 드라이버, 나머지는 세션 복사 드라이버로 동시 처리
+        with ThreadPoolExecutor(max_workers=workers - 1, thread_name_prefix='collect') as executor:
+            futures = [executor.submit(_run_cloned, ad_account_id) for ad_account_id in AD_ACCOUNT_IDS[1:]]
+            _setup_page_option(driver)
+            WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=5, name='collection_ready')
+            _run(driver, AD_ACCOUNT_IDS[0])
+            for future in futures:
+                future.result()
+
+        # 세션 복사 드라이버에서 실패한 계정은 메인 드라이버로 재처리 (재처리도 실패하면 경고)
+        for ad_account_id in AD_ACCOUNT_IDS[1:]:
+            if ad_account_id in retry_ids:
+                _run(driver, ad_account_id)
+    else:
+        _setup_page_option(driver)
+        WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=5, name='collection_ready')
+        for ad_account_id in AD_ACCOUNT_IDS:
+            _run(driver, ad_account_id)
+
+    for ad_account_id in AD_ACCOUNT_IDS:
+        if ad_account_id not in account_results:
             continue
+        timings, seen, processed = account_results[ad_account_id]
+        summary = ', '.join(f'{step} {secs:.1f}s' for step, secs in timings.items())
+        logging.log(f"> 계정별 결과 [{ad_account_id}] : 확인 {seen}건 / 처리 {processed}건 ({summary})", level="INFO")
+        if not test_mode and processed < seen:
+            logging.log(f"> 미처리 행 {seen - processed}건 ({ad_account_id})", level="WARNING")
 
     logging.log("▷ [CARIB] 여행/숙박 소재 자동 수집 → 완료", level="INFO")
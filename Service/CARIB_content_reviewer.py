@@ -6,20 +6,87 @@ from selenium.common.exceptions import (
     TimeoutException, WebDriverException, JavascriptException)
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import sys
+import threading
 import time
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 from Common.log import Log
 from Service.constants import Constants
+from Function.wait_utils import WaitUtils
+from Function.table_utils import TableUtils
+from Function.step_timer import StepTimer
+from Function.carib_utils import CaribUtils
+from Function.tab_pool import TabPool
+from Function.landing_utils import LandingUtils, detect_site, normalize_landing_url
+from Function.landing_cache import LandingCache
+from Function.run_history import RunHistory
+from Function.rule_engine import RuleEngine, rules_version
+from Service.CARIB_content_collector import _setup_page_option, iter_result_pages
 
 # 상수 모음 ============================================================================================================ #
 DEFAULT_WAIT = 320
-HOLD_REASON = '[공통] 제한업종_모텔 업종'  # 보류 사유
+HOLD_RULES = [      # 제한 업종 분류 규칙 (앞쪽 우선) : 구분 값 / 분류 텍스트 키워드(대소문자·공백 무시) / 보류 사유
+    {'category': '무인텔', 'keywords': ['무인텔', '무인모텔'], 'hold_reason': '[공통] 제한업종_모텔 업종'},
+    {'category': '러브호텔', 'keywords': ['러브호텔'], 'hold_reason': '[공통] 제한업종_모텔 업종'},
+    {'category': '여관', 'keywords': ['여관', '여인숙'], 'hold_reason': '[공통] 제한업종_모텔 업종'},
+    {'category': '모텔', 'keywords': ['모텔'], 'hold_reason': '[공통] 제한업종_모텔 업종'},
+]
+HOLD_REASONS = {rule['category']: rule['hold_reason'] for rule in HOLD_RULES}     # 구분 값 → 보류 사유
+
+REVIEW_WORKERS = 4          # 랜딩 페이지 분류 병렬 작업자 수 (1 이하면 메인 드라이버로 순차 처리)
+WORKER_HEADLESS = True      # 작업자 전용 드라이버 헤드리스 실행 여부
+WORKER_LEAN_PROFILE = True  # 작업자 드라이버 lean 프로필 사용 여부 (eager 로드 + 폰트/동영상/트래커 차단)
+TAB_POOL_SIZE = 1           # 드라이버당 유지할 작업 탭 수
+TAB_RECYCLE_PAGES = 200     # 작업 탭(작업자 드라이버는 브라우저 전체) 재시작 주기(페이지 수)
+TAB_RECYCLE_MEMORY_MB = 512 # 작업 탭 재시작 기준 JS 힙 메모리(MB)
+DOMAIN_CONCURRENCY = {      # 사이트별 동시 요청 상한 (차단 방지)
+    'interpark': 2,
+    'yanolja': 2,
+}
+
+LANDING_CACHE_ENABLED = True                    # 랜딩 분류 캐시 사용 여부 (False면 우회)
+LANDING_CACHE_TTL = 7 * 24 * 60 * 60            # 캐시 유효 시간(초)
+LANDING_CACHE_MAX_ENTRIES = 5000                # 캐시 최대 건수 (초과 시 LRU 제거)
+LANDING_CACHE_FILE = 'landing_cache.db'         # DOWNLOAD_DIR 하위 캐시 파일명
+
+RUN_HISTORY_ENABLED = True                      # 이전 실행에서 처리가 끝난 심사대상ID 제외 여부 (False면 전체 처리)
+RUN_HISTORY_RETENTION = 30 * 24 * 60 * 60       # 실행 이력 보관 기간(초)
+RUN_HISTORY_FILE = 'run_history.db'             # DOWNLOAD_DIR 하위 실행 이력 파일명
+
+LANDING_URL_FILTER = "checkinnow|GY"    # 분류 대상 랜딩URL 정규식 (딥링크 방식 랜딩 URL)
+REVIEW_CSV_COLUMNS = ['랜딩URL', '심사대상ID']
+REVIEW_CSV_CHUNK_SIZE = 20000           # pyarrow 미사용 시 CSV 청크 크기(행)
+
+DEVTOOLS_CAPTURE = True     # 심사 목록을 CSV 대신 DevTools 네트워크 응답(JSON)에서 읽을지 여부 (실패 시 CSV 폴백)
+REVIEW_LIST_API_PATTERN = r'/api/.*review'     # 심사 목록 API 응답 URL 정규식
+REVIEW_FIELD_MAP = {        # DataFrame 컬럼 ← JSON 필드 후보 (앞에서부터 우선)
+    '랜딩URL': ('landingUrl', 'landingURL', 'landing_url', 'linkUrl'),
+    '심사대상ID': ('reviewTargetId', 'reviewTargetID', 'review_target_id', 'targetId'),
+}
+REVIEW_TOTAL_KEYS = ('totalElements', 'totalCount', 'total')    # 전체 건수 필드 후보
+
+HOLD_BATCH_ENABLED = True   # 일괄 보류 사용 여부
+HOLD_BATCH_MIN = 2          # 일괄 보류로 처리할 최소 건수 (미만이면 개별 처리)
+
+REVIEW_ID_COLUMN = '심사대상ID'   # 목록 테이블의 심사대상ID 헤더명 (없으면 모든 셀에서 검색)
 
 # 클래스 초기화 ======================================================================================================== #
 logging = Log()
 constants = Constants()
 
 # ==================================================================================================================== #
+@StepTimer.timed('setup_reviewer_option', target=lambda driver, mode, *args, **kwargs: mode)
 def _setup_reviewer_option(driver, mode, carib_id=None):
     """
     심사자/검색대상 콤보박스를 모드에 맞게 설정하고 조회를 수행한다.
@@ -56,8 +123,9 @@ def _setup_reviewer_option(driver, mode, carib_id=None):
 
     last_err = None
     for attempt in range(1, max_retries + 1):
+        StepTimer.annotate(retries=attempt - 1)
         try:
-            time.sleep(5)
+            WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=5, name='reviewer_option_ready')
 
             if mode == 'reviewer':
                 driver.find_element(By.CSS_SELECTOR, 'span[title="전체"][class="ant-select-selection-item"]').click()
@@ -65,11 +133,9 @@ def _setup_reviewer_option(driver, mode, carib_id=None):
             elif mode == 'target':
                 # 1) 셀렉트 열기
                 driver.find_element(By.CSS_SELECTOR, '.ant-select-selector').click()
-                time.sleep(1)
 
                 # 2) 드롭다운이 body 하단에 렌더됨 → 드롭다운 등장 대기
-                WebDriverWait(driver, DEFAULT_WAIT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.ant-select-dropdown:not([aria-hidden="true"])')))
+                WaitUtils.antd_dropdown(driver, timeout=DEFAULT_WAIT, budget=1, name='reviewer_option_dropdown')
 
                 # 3) 옵션 클릭 (title 또는 텍스트 매칭)
                 driver.find_element(
@@ -78,12 +144,9 @@ def _setup_reviewer_option(driver, mode, carib_id=None):
                     '//*[(@title="심사대상ID") or normalize-space(text())="심사대상ID"]'
                 ).click()
 
-            time.sleep(5)
-            driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]').click()  # 조회 버튼
-
-            WebDriverWait(driver, DEFAULT_WAIT).until(EC.presence_of_element_located((By.CSS_SELECTOR,
-                      "#mainContent > div > div.ant-card.ant-card-bordered > div > "
-                      "div > div > div > div > div > div > div > table > tbody > tr")))
+            WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=5, name='reviewer_option_submit')
+            submit = driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]')  # 조회 버튼
+            WaitUtils.table_refresh(driver, submit.click, timeout=DEFAULT_WAIT, name='reviewer_option_table')
 
             logging.log("▷ 심사자/검색대상 옵션 설정 → 완료", level="INFO")
             return  # 성공 시 종료
@@ -96,120 +159,846 @@ def _setup_reviewer_option(driver, mode, carib_id=None):
     logging.log("> 심사자/검색대상 옵션 설정 실패 : 최대 재시도 초과", level="ERROR")
     raise TimeoutException("> 심사자/검색대상 옵션 설정 실패. 마지막 오류 : " + (str(last_err) if last_err else "unknown"))
 
-def process_content_review(driver, carib_utils, carib_id):
+def _extract_with_selenium(tab_pool, landing_url):
     """
-    CARIB 소재 자동 심사를 수행한다.
+    탭 풀의 작업 탭에서 랜딩 페이지에 접속하고 분류 텍스트를 추출한다.
+
+    - interpark : <tr><th>분류</th><td>값</td>에서 텍스트 추출
+    - yanolja : 페이지 타이틀 추출
+    - 작업 탭은 사용 후 about:blank로 초기화되어 다음 URL에 재사용된다. (TabPool.page)
+    - 페이지 이동부터 분류 요소 확인까지의 시간과 전송 바이트를 함께 반환한다.
+
+    Args:
+        tab_pool (TabPool): 작업 탭 풀
+        landing_url (str): 랜딩 URL
+
+    Returns:
+        tuple[str | None, float, int | None]: (추출된 분류 텍스트, 로드 시간(초), 전송 바이트)
+
+    Raises:
+        TimeoutException: 페이지 요소가 제한 시간 내 나타나지 않은 경우
+        WebDriverException: 드라이버 실행 중 오류가 발생한 경우
+    """
+    elem_txt = None
+    with tab_pool.page() as driver:
+        CaribUtils.page_transfer_bytes(driver)     # 이전 페이지의 네트워크 이벤트 비우기
+        started = time.perf_counter()
+        driver.get(landing_url)
+
+        if 'interpark' in landing_url:
+            WebDriverWait(driver, DEFAULT_WAIT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table > tbody")))
+
+            elem_txt = driver.find_element(By.XPATH, "//tr[th[normalize-space(text())='분류']]/td").text
+
+        elif 'yanolja' in landing_url:
+            WebDriverWait(driver, DEFAULT_WAIT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div > div > h1")))
+            WebDriverWait(driver, DEFAULT_WAIT).until(lambda d: d.title)
+
+            elem_txt = driver.title
+
+        load_secs = time.perf_counter() - started
+        transfer_bytes = CaribUtils.page_transfer_bytes(driver)
+
+    return elem_txt, load_secs, transfer_bytes
+
+@StepTimer.timed('landing.fetch', target=lambda get_tab_pool, landing_utils, landing_url, *args, **kwargs: landing_url)
+def _classify_landing_url(get_tab_pool, landing_utils, landing_url, fast_path=True, lean=False):
+    """
+    랜딩URL 하나의 분류 텍스트를 추출한다.
+
+    - fast_path=True이면 먼저 HTTP(LandingUtils)로 원본 HTML을 파싱하고,
+      JS 렌더링이 필요한 페이지만 Selenium 경로로 폴백한다.
+    - 처리 경로는 사이트별 카운터(landing_utils.stats)에 기록된다.
+    - 작업 탭 풀은 Selenium 폴백이 필요할 때만 get_tab_pool()로 가져온다.
+    - Selenium 경로의 로드 시간/전송 바이트는 프로필(lean/default)별로 기록된다. (landing_utils.record_load)
+
+    Args:
+        get_tab_pool (Callable[[], TabPool]): 작업 탭 풀을 반환하는 함수
+        landing_utils (LandingUtils): HTTP 추출 유틸 인스턴스
+        landing_url (str): 랜딩 URL
+        fast_path (bool, optional): HTTP 우선 추출 사용 여부. 기본값 True.
+        lean (bool, optional): get_tab_pool()의 탭이 lean 프로필인지 여부. 기본값 False.
+
+    Returns:
+        str | None: 추출된 분류 텍스트 (확인되지 않은 사이트 또는 오류 시 None)
+    """
+    site = detect_site(landing_url)
+    if site is None:
+        StepTimer.annotate(outcome='unknown_site')
+        logging.log(f"> 확인 되지 않은 사이트 (URL={landing_url})", level="WARNING")
+        return None
+
+    if fast_path:
+        elem_txt = landing_utils.fetch_elem_txt(landing_url)
+        if elem_txt is not None:
+            landing_utils.record(site, 'http')
+            StepTimer.annotate(outcome='http')
+            logging.log(f"> {landing_url}-{elem_txt} (http)", level="INFO")
+            return elem_txt
+
+    try:
+        elem_txt, load_secs, transfer_bytes = _extract_with_selenium(get_tab_pool(), landing_url)
+    except Exception as e:
+        landing_utils.record(site, 'failed')
+        StepTimer.annotate(outcome=f'error:{type(e).__name__}')
+        logging.log(f"> 처리 중 오류 발생 (URL={landing_url}) : {type(e).__name__}", level="ERROR")
+        return None
+
+    landing_utils.record(site, 'selenium')
+    StepTimer.annotate(outcome='selenium')
+    landing_utils.record_load(site, 'lean' if lean else 'default', load_secs, transfer_bytes)
+    logging.log(f"> {landing_url}-{elem_txt}", level="INFO")
+    return elem_txt
+
+def _classify_concurrently(landing_urls, carib_utils, landing_utils, workers, fast_path=True, on_result=None,
+                           cancel=None):
+    """
+    랜딩URL 목록을 작업자 풀로 병렬 분류한다.
+
+    - 작업자 스레드는 필요할 때 각자 전용 드라이버(carib_utils.create_worker_driver)를 소유한 탭 풀을 하나씩 생성해 재사용한다.
+      (HTTP 경로로 모두 처리되면 드라이버를 생성하지 않는다. WORKER_LEAN_PROFILE이면 lean 프로필 사용)
+    - 사이트별 동시 처리 건수는 DOMAIN_CONCURRENCY 상한을 넘지 않는다.
+    - 결과는 입력 키 기준 dict로 반환하므로 완료 순서와 무관하게 결정적으로 반영할 수 있다.
+    - on_result가 주어지면 각 키의 분류가 끝나는 즉시 작업자 스레드에서 on_result(키, 분류 텍스트)를 호출한다.
+    - cancel이 설정되면 아직 시작하지 않은 키는 조회하지 않고 None으로 반환한다.
+    - 생성된 탭 풀은 통계를 남기고 모두 종료 후 반환한다.
+
+    Args:
+        landing_urls (dict): {키: 랜딩URL}
+        carib_utils (CaribUtils): 작업자 드라이버 생성에 사용할 CaribUtils 인스턴스
+        landing_utils (LandingUtils): HTTP 추출 유틸 인스턴스
+        workers (int): 작업자 수
+        fast_path (bool, optional): HTTP 우선 추출 사용 여부. 기본값 True.
+        on_result (Callable[[object, str | None], None], optional): 키별 분류 완료 콜백
+        cancel (threading.Event, optional): 분류 중단 신호
+
+    Returns:
+        dict: {키: 분류 텍스트(str | None)}
+    """
+    domain_limits = {site: threading.BoundedSemaphore(limit) for site, limit in DOMAIN_CONCURRENCY.items()}
+    local = threading.local()
+    tab_pools = []
+    pools_lock = threading.Lock()
+
+    def _create_driver():
+        return carib_utils.create_worker_driver(headless=WORKER_HEADLESS, lean=WORKER_LEAN_PROFILE,
+                                                measure_network=True)
+
+    def _get_tab_pool():
+        if getattr(local, 'tab_pool', None) is None:
+            local.tab_pool = TabPool(size=TAB_POOL_SIZE, max_pages=TAB_RECYCLE_PAGES,
+                                     max_memory_mb=TAB_RECYCLE_MEMORY_MB, driver_factory=_create_driver,
+                                     on_new_tab=CaribUtils.apply_lean_profile if WORKER_LEAN_PROFILE else None,
+                                     logger=logging)
+            with pools_lock:
+                tab_pools.append(local.tab_pool)
+        return local.tab_pool
+
+    def _task(key, landing_url):
+        if cancel is not None and cancel.is_set():
+            return None
+        limit = domain_limits.get(detect_site(landing_url))
+        if limit is None:
+            elem_txt = _classify_landing_url(_get_tab_pool, landing_utils, landing_url, fast_path=fast_path,
+                                             lean=WORKER_LEAN_PROFILE)
+        else:
+            with limit:
+                elem_txt = _classify_landing_url(_get_tab_pool, landing_utils, landing_url, fast_path=fast_path,
+                                                 lean=WORKER_LEAN_PROFILE)
+
+        if on_result is not None:
+            on_result(key, elem_txt)
+        return elem_txt
+
+    logging.log(f"> 랜딩 페이지 병렬 분류 : {len(landing_urls)}건 / 작업자 {workers}", level="INFO")
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='landing') as executor:
+            futures = {key: executor.submit(_task, key, url) for key, url in landing_urls.items()}
+            return {key: future.result() for key, future in futures.items()}
+    finally:
+        for tab_pool in tab_pools:
+            tab_pool.log_stats()
+            tab_pool.close()
+
+def _find_record_list(payload):
+    """JSON 본문에서 REVIEW_FIELD_MAP 필드를 가진 dict 리스트와 전체 건수(있으면)를 찾는다."""
+    if isinstance(payload, list):
+        if payload and all(isinstance(item, dict) for item in payload) and \
+                any(key in payload[0] for key in REVIEW_FIELD_MAP['심사대상ID']):
+            return payload, None
+        for item in payload:
+            found = _find_record_list(item)
+            if found[0] is not None:
+                return found
+    elif isinstance(payload, dict):
+        total = next((payload[key] for key in REVIEW_TOTAL_KEYS if isinstance(payload.get(key), int)), None)
+        for value in payload.values():
+            records, nested_total = _find_record_list(value)
+            if records is not None:
+                return records, nested_total if nested_total is not None else total
+    return None, None
+
+def _records_from_payloads(payloads):
+    """
+    DevTools로 수집한 심사 목록 JSON에서 '랜딩URL', '심사대상ID' DataFrame을 만든다.
+
+    - 가장 마지막 응답부터 확인하여 심사 목록 레코드를 찾는다.
+    - 응답에 전체 건수(REVIEW_TOTAL_KEYS)가 있고 레코드 수와 같을 때만 사용한다.
+    - 심사대상ID는 CSV 경로(dtype=str)와 같도록 문자열로 변환한다.
+      전체 건수가 없거나(첫 페이지만일 수 있음), 다르거나, 레코드에 랜딩URL/심사대상ID가 비어 있으면
+      사유를 로그로 남기고 CSV 폴백을 위해 None을 반환한다.
+
+    Args:
+        payloads (list): capture_json_responses 결과
+
+    Returns:
+        pandas.DataFrame | None: '랜딩URL', '심사대상ID' 컬럼 DataFrame. 사용할 수 없으면 None
+    """
+    for payload in reversed(payloads):
+        records, total = _find_record_list(payload)
+        if records is None:
+            continue
+        if total is None:
+            logging.log(f"> 네트워크 응답에 전체 건수 없음 ({len(records)}건, 일부 페이지일 수 있음) → CSV 사용",
+                        level="WARNING")
+            return None
+        if total != len(records):
+            logging.log(f"> 네트워크 응답 건수 불일치 ({len(records)}/{total}건) → CSV 사용", level="WARNING")
+            return None
 
-    - 심사자 옵션을 설정한다. (_setup_reviewer_option 호출)
-    - CSV 다운로드 버튼을 클릭하여 소재 심사 데이터를 다운로드한다.
-    - CSV 파일을 DataFrame으로 읽고 '랜딩URL', '심사대상ID' 컬럼만 추출한다.
-    - 랜딩URL에 'hotel|tour'이 포함된 행을 제거한다.
+        rows = []
+        for record in records:
+            rows.append({column: next((record[key] for key in keys if record.get(key) is not None), None)
+                         for column, keys in REVIEW_FIELD_MAP.items()})
+        missing = sum(1 for row in rows if any(value is None for value in row.values()))
+        if missing:
+            logging.log(f"> 네트워크 응답에 랜딩URL/심사대상ID 누락 {missing}건 → CSV 사용", level="WARNING")
+            return None
+        df = pd.DataFrame(rows, columns=list(REVIEW_FIELD_MAP))
+        df['심사대상ID'] = df['심사대상ID'].astype(str)
+        return df
+    logging.log("> 심사 목록 네트워크 응답 없음 → CSV 사용", level="WARNING")
+    return None
+
+def _filter_landing_urls(df):
+    """랜딩URL에 LANDING_URL_FILTER가 포함된 행만 남긴다."""
+    # df = df[~df['랜딩URL'].str.contains("hotel|tour", case=False, na=False)]
+    return df[df['랜딩URL'].str.contains(LANDING_URL_FILTER, case=False, na=False)]
+
+def _peak_rss_bytes():
+    """프로세스 최대 RSS(bytes)를 반환한다. (resource 또는 psutil, 측정할 수 없으면 None)"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024     # Linux는 KB 단위
+    if psutil is not None:
+        return getattr(psutil.Process().memory_info(), 'peak_wset', None)    # Windows
+    return None
+
+def _read_review_csv(csv_path):
+    """
+    CARIB 심사 목록 CSV에서 필요한 두 컬럼만 읽고 랜딩URL 필터를 적용한다.
+
+    - '랜딩URL', '심사대상ID' 컬럼만 문자열로 파싱한다. (usecols)
+    - pyarrow가 설치되어 있으면 pyarrow 엔진으로 한 번에 읽고,
+      없으면 REVIEW_CSV_CHUNK_SIZE 단위로 나눠 읽으며 청크마다 필터를 적용해 필요한 행만 보관한다.
+    - 읽은 행 수, 남은 행 수, 초당 처리 행 수, 프로세스 최대 RSS와 읽는 동안의 증가량을 로그로 남긴다.
+      (pyarrow는 파이썬 힙 밖에서 메모리를 할당하므로 RSS 기준, 측정할 수 없으면 생략)
+
+    Args:
+        csv_path (str): CSV 파일 경로
+
+    Returns:
+        pandas.DataFrame: 필터링된 '랜딩URL', '심사대상ID' DataFrame
+
+    Raises:
+        ValueError: CSV에 '랜딩URL', '심사대상ID' 컬럼이 없는 경우
+    """
+    started = time.perf_counter()
+    peak_before = _peak_rss_bytes()
+
+    rows_read = 0
+    try:
+        df_all = pd.read_csv(csv_path, encoding='utf-8', usecols=REVIEW_CSV_COLUMNS, dtype=str, engine='pyarrow')
+    except ImportError:     # pyarrow 미설치 → 청크 단위 읽기 (컬럼 누락 등 ValueError는 그대로 발생)
+        df_all = None
+    if df_all is not None:
+        rows_read = len(df_all)
+        df_work_data = _filter_landing_urls(df_all).reset_index(drop=True)
+        engine = 'pyarrow'
+    else:
+        chunks = []
+        for chunk in pd.read_csv(csv_path, encoding='utf-8', usecols=REVIEW_CSV_COLUMNS, dtype=str,
+                                 chunksize=REVIEW_CSV_CHUNK_SIZE):
+            rows_read += len(chunk)
+            chunks.append(_filter_landing_urls(chunk))
+        df_work_data = (pd.concat(chunks, ignore_index=True) if chunks
+                        else pd.DataFrame(columns=REVIEW_CSV_COLUMNS))
+        engine = 'chunked'
+    peak_after = _peak_rss_bytes()
+
+    elapsed = time.perf_counter() - started
+    rows_per_sec = rows_read / elapsed if elapsed > 0 else 0
+    memory = ''
+    if peak_after is not None:
+        memory = (f", 최대 RSS {peak_after / 1024 / 1024:.1f}MB "
+                  f"(읽기 중 증가 {(peak_after - (peak_before or 0)) / 1024 / 1024:.1f}MB)")
+    logging.log(f"> CSV 읽기({engine}) : {rows_read}행 → {len(df_work_data)}행 / {elapsed:.2f}s "
+                f"({rows_per_sec:,.0f}행/s{memory})", level="INFO")
+    return df_work_data[REVIEW_CSV_COLUMNS].copy()
+
+def _collect_review_targets(driver, carib_utils, carib_id):
+    """
+    심사자 옵션 설정 후 심사 목록을 읽어 분류 대상 DataFrame을 만든다.
+
+    - DEVTOOLS_CAPTURE=True이면 조회 시 발생한 심사 목록 API 응답(JSON)을 DevTools로 직접 읽는다.
+      응답을 찾지 못하거나 일부 페이지만 포함된 경우 CSV 다운로드로 폴백한다.
+    - CSV 파일은 '랜딩URL', '심사대상ID' 컬럼만 읽으면서 필터를 적용한다. (_read_review_csv 호출)
+    - 랜딩URL에 'checkinnow|GY'(LANDING_URL_FILTER)가 포함된 행만 남긴다.
     - '구분' 컬럼을 추가하여 초기값을 None으로 설정한다.
-    - 각 랜딩URL에 대해 새 탭을 열고 접속한다 :
-       * interpark : <tr><th>분류</th><td>값</td>에서 텍스트 추출
-       * yanolja : 페이지 타이틀 추출
-       * 그 외 : 경고 로그 기록
-       숙소 분류 텍스트에 '모텔'이 포함된 경우 '구분' 값을 '모텔'로 설정한다.
-    - 새 탭은 작업 후 닫고 원래 탭으로 복귀한다.
 
     Args:
         driver (webdriver.Chrome): Selenium WebDriver 인스턴스
         carib_utils (CaribUtils): CSV 다운로드 기능을 제공하는 CaribUtils 인스턴스
+        carib_id (str): 심사자 옵션에 사용할 CARIB 로그인 계정
 
     Returns:
-        pandas.DataFrame:
-            '랜딩URL', '심사대상ID', '구분' 컬럼으로 구성된 DataFrame.
-            - '구분'은 기본 None이며, 분류 결과에 따라 '모텔' 값이 반영될 수 있음.
+        pandas.DataFrame: '랜딩URL', '심사대상ID', '구분' 컬럼으로 구성된 DataFrame
     """
-    logging.log("▷ [CARIB] 소재 자동 심사 → 시작", level="INFO")
-
-    _setup_reviewer_option(driver, 'reviewer', carib_id=carib_id)
-    time.sleep(2)
+    df_work_data = None
+    if DEVTOOLS_CAPTURE:
+        payloads = carib_utils.capture_json_responses(
+            lambda: _setup_reviewer_option(driver, 'reviewer', carib_id=carib_id), REVIEW_LIST_API_PATTERN)
+        df_work_data = _records_from_payloads(payloads)
+    else:
+        _setup_reviewer_option(driver, 'reviewer', carib_id=carib_id)
 
-    button_selector = '"#mainContent > div > div > div > div:nth-child(2) > button:nth-child(2)'  # CSV 다운로드 버튼
-    csv_path = carib_utils.download_csv(button_selector)
+    if df_work_data is None:
+        # 목록 조회 요청이 모두 끝난 뒤 CSV 다운로드 (기존 고정 2초 대기 대체)
+        WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, name='review_csv_ready')
+        WaitUtils.network_idle(driver, timeout=DEFAULT_WAIT, budget=2, name='review_csv_network_idle')
 
-    df_ad_creative = pd.read_csv(csv_path, encoding='utf-8')
-    df_work_data = df_ad_creative[['랜딩URL', '심사대상ID']].copy()
+        button_selector = '"#mainContent > div > div > div > div:nth-child(2) > button:nth-child(2)'  # CSV 다운로드 버튼
+        csv_path = carib_utils.download_csv(button_selector)
 
-    # 딥링크 방식으로 변경된 랜딩 URL에서 checkinnow 또는 GY 가 포함된 경우만 수행하도록 필터링
-    # df_work_data = df_work_data[~df_work_data['랜딩URL'].str.contains("hotel|tour", case=False, na=False)]
-    df_work_data = df_work_data[
-        df_work_data['랜딩URL'].str.contains("checkinnow|GY", case=False, na=False)
-    ]
+        df_work_data = _read_review_csv(csv_path)
+    else:
+        logging.log(f"> 심사 목록 네트워크 응답 사용 : {len(df_work_data)}건 (CSV 다운로드 생략)", level="INFO")
+        # 딥링크 방식으로 변경된 랜딩 URL에서 checkinnow 또는 GY 가 포함된 경우만 수행하도록 필터링
+        df_work_data = _filter_landing_urls(df_work_data).copy()
 
     # 소재 구분용 컬럼 추가 (초기값 None)
     df_work_data['구분'] = None
+    return df_work_data
 
-    for idx, current_row in df_work_data.iterrows():
-        landing_url = current_row['랜딩URL']
+def _classify_review_targets(df_work_data, driver, carib_utils, fast_path=True, workers=REVIEW_WORKERS,
+                             use_cache=LANDING_CACHE_ENABLED, purge_cache=False, on_hold=None, cancel=None):
+    """
+    분류 대상 DataFrame의 랜딩URL을 분류하여 '구분' 컬럼을 채운다.
 
-        # 인터파크/야놀자 사이트 작업 ------------------------------------------------------------------------------------- #
-        driver.execute_script("window.open('');")
-        new_tab = driver.window_handles[-1]
-        original_tab = driver.window_handles[0]
-        driver.switch_to.window(new_tab)
+    - 랜딩URL을 숙소 단위 정규화 키로 묶어(normalize_landing_url) 숙소별로 한 번만 분류하고,
+      결과를 같은 키를 가진 모든 심사대상ID에 반영한다. (중복 제거율 로그 기록)
+    - 로컬 캐시에 유효한 결과가 있으면 조회를 생략하고, 새로 조회한 결과만 캐시에 저장한다.
+    - workers > 1 이거나 driver가 None이면 작업자 전용 드라이버 풀로 처리한다. (메인 드라이버 미사용)
+    - 분류 텍스트는 HOLD_RULES 규칙 엔진(RuleEngine, 다중 패턴 매칭)으로 판정한다.
+    - on_hold가 주어지면 제한 업종으로 판정되는 즉시 해당 숙소의 심사대상ID마다 on_hold((심사대상ID, 구분))를 호출한다.
+      (캐시 적중분은 조회 전에, 조회분은 작업자 스레드에서 호출된다)
+    - cancel이 설정되면 남은 랜딩URL은 조회하지 않는다. (조회하지 못한 건은 '확인불가')
+    - DataFrame의 '구분' 값은 모든 분류가 끝난 뒤 전체 분류 텍스트를 한 번에 판정하여(classify_many) 입력 순서대로 반영한다.
+      (일치한 규칙의 구분 값 / 분류 텍스트를 얻지 못한 경우 '확인불가' / 그 외 None)
+    - 완료 후 규칙별 적중 건수를 로그로 남긴다.
 
-        elem_txt = None
-        try:
-            driver.get(landing_url)
-            time.sleep(5)
+    Args:
+        df_work_data (pandas.DataFrame): '랜딩URL', '심사대상ID', '구분' 컬럼을 포함하는 DataFrame
+        driver (webdriver.Chrome | None): 순차 처리 시 사용할 Selenium WebDriver 인스턴스
+        carib_utils (CaribUtils): 작업자 드라이버 생성에 사용할 CaribUtils 인스턴스
+        fast_path (bool, optional): HTTP 우선 추출 사용 여부. 기본값 True.
+        workers (int, optional): 랜딩 페이지 분류 작업자 수. 기본값 REVIEW_WORKERS.
+        use_cache (bool, optional): 랜딩 분류 캐시 사용 여부. 기본값 LANDING_CACHE_ENABLED.
+        purge_cache (bool, optional): True일 경우 분류 전에 캐시를 모두 비운다. 기본값 False.
+        on_hold (Callable[[tuple[str, str]], None], optional): 제한 업종 판정 (심사대상ID, 구분) 콜백
+        cancel (threading.Event, optional): 분류 중단 신호
+
+    Returns:
+        pandas.DataFrame: '구분' 값이 반영된 DataFrame (입력 객체를 그대로 갱신)
+    """
+    landing_utils = LandingUtils(logger=logging)
+    rule_engine = RuleEngine(HOLD_RULES, logger=logging)
+    landing_cache = LandingCache(os.path.join(constants.DOWNLOAD_DIR, LANDING_CACHE_FILE),
+                                 ttl=LANDING_CACHE_TTL, max_entries=LANDING_CACHE_MAX_ENTRIES,
+                                 enabled=use_cache, logger=logging)
+    try:
+        if purge_cache:
+            landing_cache.purge()
 
-            if 'interpark' in landing_url:
-                WebDriverWait(driver, DEFAULT_WAIT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "table > tbody")))
+        # 숙소 단위 정규화/중복 제거 ------------------------------------------------------------------------------------ #
+        property_keys = df_work_data['랜딩URL'].map(normalize_landing_url)
+        representatives = {}    # {정규화 키: 대표 랜딩URL(최초 등장)}
+        target_ids = {}         # {정규화 키: [심사대상ID, ...]}
+        for idx, key in property_keys.items():
+            representatives.setdefault(key, df_work_data.at[idx, '랜딩URL'])
+            target_ids.setdefault(key, []).append(df_work_data.at[idx, '심사대상ID'])
 
-                elem_txt = driver.find_element(By.XPATH, "//tr[th[normalize-space(text())='분류']]/td").text
+        total_rows = len(df_work_data)
+        dedupe_ratio = (1 - len(representatives) / total_rows) * 100 if total_rows else 0.0
+        logging.log(f"> 랜딩URL 중복 제거 : {total_rows}건 → 숙소 {len(representatives)}건 ({dedupe_ratio:.1f}% 감소)",
+                    level="INFO")
 
-            elif 'yanolja' in landing_url:
-                WebDriverWait(driver, DEFAULT_WAIT).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div > div > h1")))
+        def _notify(key, elem_txt):
+            rule = rule_engine.classify(elem_txt) if on_hold is not None else None
+            if rule is not None:
+                for review_target_id in target_ids[key]:
+                    on_hold((review_target_id, rule['category']))
 
-                elem_txt = driver.title
+        # 캐시 조회 ------------------------------------------------------------------------------------------------------ #
+        elem_txts = {}      # {정규화 키: 분류 텍스트}
+        landing_urls = {}   # {정규화 키: 조회할 랜딩URL}
+        for key, landing_url in representatives.items():
+            cached = landing_cache.get(key)
+            if cached is not None:
+                elem_txts[key] = cached
+                _notify(key, cached)
             else:
-                logging.log(f"> 확인 되지 않은 사이트 (URL={landing_url})", level="WARNING")
+                landing_urls[key] = landing_url
+
+        # 인터파크/야놀자 사이트 작업 ------------------------------------------------------------------------------------- #
+        if driver is None or (workers and workers > 1):
+            fetched = _classify_concurrently(landing_urls, carib_utils, landing_utils, max(workers or 1, 1),
+                                             fast_path=fast_path, on_result=_notify, cancel=cancel)
+        else:
+            fetched = {}
+            tab_pools = []
+
+            def _get_tab_pool():
+                if not tab_pools:
+                    tab_pools.append(TabPool(driver, size=TAB_POOL_SIZE, max_pages=TAB_RECYCLE_PAGES,
+                                             max_memory_mb=TAB_RECYCLE_MEMORY_MB, logger=logging))
+                return tab_pools[0]
 
-            logging.log(f"> {landing_url}-{elem_txt}", level="INFO")
-        except Exception as e:
-            logging.log(f"> 처리 중 오류 발생 (URL={landing_url}) : {type(e).__name__}", level="ERROR")
-            continue
-        finally:
-            # 새 탭 닫고 원래 탭으로 복귀(오류가 나도 반드시 복귀)
             try:
-                driver.close()
-            except Exception:
-                pass
-            driver.switch_to.window(original_tab)
-
-        # 해당 숙소가 '모텔'인지 여부 확인
-        if elem_txt and ('모텔' in elem_txt):
-            df_work_data.at[idx, '구분'] = '모텔'
+                for key, url in landing_urls.items():
+                    if cancel is not None and cancel.is_set():
+                        break
+                    fetched[key] = _classify_landing_url(_get_tab_pool, landing_utils, url, fast_path=fast_path)
+                    _notify(key, fetched[key])
+            finally:
+                for tab_pool in tab_pools:
+                    tab_pool.log_stats()
+                    tab_pool.close()
+        elem_txts.update(fetched)
+
+        # 해당 숙소가 제한 업종인지 일괄 판정 (같은 숙소의 모든 심사대상ID에 입력 순서대로 반영)
+        matched_rules = rule_engine.classify_many(elem_txts)
+        for idx, key in property_keys.items():
+            rule = matched_rules.get(key)
+            if rule is not None:
+                df_work_data.at[idx, '구분'] = rule['category']
+            elif elem_txts.get(key) is None:
+                df_work_data.at[idx, '구분'] = RunHistory.CATEGORY_UNKNOWN
+
+        # 새로 조회한 결과만 캐시에 저장 (추출 실패 건은 저장하지 않음)
+        for key, elem_txt in fetched.items():
+            if elem_txt is not None:
+                landing_cache.put(key, landing_urls[key], elem_txt)
         # ------------------------------------------------------------------------------------------------------------ #
+    finally:
+        landing_utils.log_stats()
+        landing_utils.close()
+        rule_engine.log_stats()
+        landing_cache.log_stats()
+        landing_cache.close()
+
+    return df_work_data
+
+def open_run_history(enabled=RUN_HISTORY_ENABLED):
+    """DOWNLOAD_DIR 하위 실행 이력(RunHistory)을 연다. (enabled=False면 기록/제외 없이 통과, HOLD_RULES 버전 기록)"""
+    return RunHistory(os.path.join(constants.DOWNLOAD_DIR, RUN_HISTORY_FILE), retention=RUN_HISTORY_RETENTION,
+                      enabled=enabled, rule_version=rules_version(HOLD_RULES), logger=logging)
+
+def process_content_review(driver, carib_utils, carib_id, fast_path=True, workers=REVIEW_WORKERS,
+                           use_cache=LANDING_CACHE_ENABLED, purge_cache=False, incremental=RUN_HISTORY_ENABLED,
+                           run_history=None):
+    """
+    CARIB 소재 자동 심사를 수행한다.
+
+    - 심사자 옵션 설정 후 CSV를 내려받아 분류 대상을 만든다. (_collect_review_targets 호출)
+    - incremental=True이면 실행 이력(RunHistory)과 비교하여 이전 실행에서 처리가 끝난 심사대상ID를 제외하고,
+      분류 결과를 이력에 기록한다. run_history가 주어지면 그 인스턴스를 사용하고 닫지 않는다.
+      (이어지는 process_creative_hold에 같은 인스턴스를 넘겨 보류 결과를 기록)
+    - 숙소 단위로 중복을 제거한 뒤 랜딩URL의 분류 텍스트를 추출한다. (_classify_review_targets 호출)
+       * fast_path=True : HTTP로 원본 HTML을 파싱하고, JS 렌더링이 필요한 페이지만 새 탭(Selenium)으로 처리
+       * fast_path=False : 모든 페이지를 새 탭(Selenium)으로 처리
+       * workers > 1 : 작업자별 전용 드라이버로 병렬 처리 (사이트별 동시 처리 상한 적용)
+       * use_cache=True : 로컬 캐시(DOWNLOAD_DIR/landing_cache.db)에 유효한 결과가 있으면 조회를 생략
+       숙소 분류 텍스트가 HOLD_RULES 규칙에 일치하면 '구분' 값을 해당 규칙의 구분 값(예: '모텔')으로 설정한다.
+    - 완료 후 사이트별 처리 경로(http/selenium/failed) 건수와 캐시 적중률을 로그로 남긴다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        carib_utils (CaribUtils): CSV 다운로드 기능을 제공하는 CaribUtils 인스턴스
+        carib_id (str): 심사자 옵션에 사용할 CARIB 로그인 계정
+        fast_path (bool, optional): HTTP 우선 추출 사용 여부. 기본값 True.
+        workers (int, optional): 랜딩 페이지 분류 작업자 수. 기본값 REVIEW_WORKERS.
+        use_cache (bool, optional): 랜딩 분류 캐시 사용 여부. 기본값 LANDING_CACHE_ENABLED.
+        purge_cache (bool, optional): True일 경우 분류 전에 캐시를 모두 비운다. 기본값 False.
+        incremental (bool, optional): 실행 이력 기반 증분 처리 여부. 기본값 RUN_HISTORY_ENABLED.
+        run_history (RunHistory, optional): 사용할 실행 이력 (open_run_history). 주어지면 incremental은 무시.
+
+    Returns:
+        pandas.DataFrame:
+            '랜딩URL', '심사대상ID', '구분' 컬럼으로 구성된 DataFrame.
+            - '구분'은 기본 None이며, 분류 결과에 따라 HOLD_RULES의 구분 값 또는 '확인불가' 값이 반영될 수 있음.
+            - incremental=True이면 이전 실행에서 처리가 끝난 행은 포함되지 않음.
+    """
+    logging.log("▷ [CARIB] 소재 자동 심사 → 시작", level="INFO")
+
+    df_work_data = _collect_review_targets(driver, carib_utils, carib_id)
+
+    own_history = run_history is None
+    if own_history:
+        run_history = open_run_history(incremental)
+    try:
+        df_work_data, _ = run_history.delta(df_work_data)
+        _classify_review_targets(df_work_data, driver, carib_utils, fast_path=fast_path, workers=workers,
+                                 use_cache=use_cache, purge_cache=purge_cache)
+        run_history.record_classification(df_work_data)
+    finally:
+        if own_history:
+            run_history.close()
 
     logging.log("▷ [CARIB] 소재 자동 심사 → 완료", level="INFO")
     return df_work_data
 
-def process_creative_hold(driver, df_work_data, test_mode=False):
+def _submit_hold(driver, label, hold_reason, test_mode=False, wait_empty=True):
+    """
+    현재 선택된 행들에 대해 '심사 보류' 모달을 열고 보류 사유를 입력해 제출한다.
+
+    - '심사 보류' 버튼을 클릭하고, 보류 입력 정보 모달(div.react-draggable)이 나타날 때까지 대기한다.
+    - 모달 내부에서 보류사유 Select 박스를 열고 hold_reason 항목을 선택한다. (예: '[공통] 제한업종_모텔 업종')
+    - test_mode=True이면 팝업을 닫고 로그만 남긴다.
+    - test_mode=False이면 '입력' 버튼을 눌러 실제 보류 처리를 진행하고,
+      wait_empty=True이면 '데이터가 없습니다' 메시지가, False이면 모달이 사라질 때까지 대기한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        label (str): 로그에 표시할 처리 대상 (심사대상ID 또는 일괄 처리 건수)
+        hold_reason (str): 입력할 보류 사유 (HOLD_RULES의 hold_reason)
+        test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        wait_empty (bool, optional): 제출 후 '데이터가 없습니다' 표시까지 대기할지 여부. 기본값 True.
+
+    Raises:
+        TimeoutException: 모달/드롭다운이 제한 시간 내 나타나지 않은 경우 (심사 보류 버튼 최대 재시도 초과 포함)
+        WebDriverException: 드라이버 실행 중 오류가 발생한 경우 (입력 버튼 최대 재시도 초과 포함)
+    """
+    max_retries = constants.RETRY_COUNT
+    wait_secs = getattr(constants, "RETRY_DELAY", 5)
+
+    # 버튼 클릭 재시도 로직
+    for attempt in range(1, max_retries + 1):
+        try:
+            driver.find_element(By.CSS_SELECTOR,  # 심사보류 버튼
+                                'button.ant-btn.css-l9pxc0.ant-btn-primary.ant-btn-dangerous.ant-btn-color-dangerous.ant-btn-variant-solid').click()
+
+            WebDriverWait(driver, DEFAULT_WAIT).until(  # 보류 입력 정보 창
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.react-draggable")))
+            break  # 성공 시 루프 종료
+        except TimeoutException:
+            if attempt == max_retries:
+                logging.log(f"> 보류 입력 정보 창 미등장({label}) : 최대 재시도 초과", level="ERROR")
+                raise
+            logging.log(
+                f"> 보류 입력 정보 창 미등장 : 재클릭 시도 {attempt}/{max_retries}", level="WARNING")
+            time.sleep(wait_secs)
+
+    # 0) 모달 등장 대기 (스코프를 모달로 한정)
+    modal = WebDriverWait(driver, DEFAULT_WAIT).until(
+        EC.visibility_of_element_located((By.CSS_SELECTOR, 'div.react-draggable'))
+    )
+    # 1) 모달 내부의 보류사유 Select 박스 열기
+    select_box = modal.find_element(By.CSS_SELECTOR, '.ant-select .ant-select-selector')
+    try:
+        select_box.click()
+    except Exception:
+        driver.execute_script("arguments[0].click();", select_box)
+
+    # 2) 드롭다운(바디 포털) 등장 대기
+    WaitUtils.antd_dropdown(driver, timeout=DEFAULT_WAIT, budget=1, name='hold_reason_dropdown')
+
+    # 3) 활성 인풋에 텍스트 입력 → 옵션 리스트 로딩 대기 → Enter로 확정
+    driver.switch_to.active_element.send_keys(hold_reason)
+    WebDriverWait(driver, DEFAULT_WAIT).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, '.ant-select-item-option')))
+    driver.switch_to.active_element.send_keys(Keys.ENTER)
+
+    # 4) 선택 적용 확인 (모달 내부 셀렉트 영역에 원하는 텍스트가 표시될 때까지 대기)
+    WebDriverWait(driver, DEFAULT_WAIT).until(EC.text_to_be_present_in_element(
+            (By.CSS_SELECTOR, 'div.react-draggable .ant-select .ant-select-selector'), hold_reason))
+
+    # 테스트 모드면 '심사 보류' 처리 건너뜀
+    if test_mode:
+        driver.find_element(By.CSS_SELECTOR, 'div.popup-handle > button').click()    # (팝업창) 닫기 버튼
+        logging.log("> (테스트 모드) '심사 보류' 처리 생략", level="INFO")
+        WaitUtils.element_gone(driver, 'div.react-draggable', timeout=DEFAULT_WAIT, budget=1, name='hold_modal_close')
+        return
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            driver.find_element(By.CSS_SELECTOR,  # 입력 버튼
+                                'body > div > div > div > button.ant-btn.css-l9pxc0.ant-btn-primary.ant-btn-color-primary.ant-btn-variant-solid.ant-btn').click()
+            WaitUtils.spinner_gone(driver, timeout=DEFAULT_WAIT, budget=2, name='hold_submit')
+            if wait_empty:
+                WebDriverWait(driver, DEFAULT_WAIT).until(  # '데이터가 없습니다' 텍스트
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.ant-empty-description")))
+            else:
+                WebDriverWait(driver, DEFAULT_WAIT).until(  # 보류 입력 정보 창 닫힘
+                    EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.react-draggable")))
+
+            # 성공 시 루프 종료
+            break
+        except WebDriverException as e:
+            if attempt == max_retries:
+                logging.log(f"> 입력 버튼 클릭 실패({label}) : 최대 재시도 초과", level="ERROR")
+                raise
+            logging.log(
+                f"> 입력 버튼 클릭 실패({label}) : {type(e).__name__} 재시도 {attempt}/{max_retries}",level="WARNING"
+            )
+            time.sleep(wait_secs)
+
+def _hold_list_state():
+    """보류 처리 1회 실행 동안 공유하는 목록 화면 상태 (마지막 검색어, 페이지 크기 설정 여부)"""
+    return {'keyword': None, 'page_option': False}
+
+def _search_review_target(driver, keyword, list_state=None):
+    """
+    검색창에 키워드를 입력하고 조회 버튼을 클릭한다. (빈 문자열이면 전체 조회)
+
+    - list_state의 마지막 검색어와 같으면 검색창은 그대로 두고 조회 버튼만 다시 눌러 목록을 새로 고친다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        keyword (str): 검색어 (심사대상ID)
+        list_state (dict, optional): 목록 화면 상태 (_hold_list_state). 기본값 None.
+
+    Returns:
+        bool: 검색 결과가 있으면 True, '데이터가 없습니다'가 표시되면 False
+    """
+    if list_state is None or list_state['keyword'] != keyword:
+        input_box = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="검색할 내용을 입력하세요."]')
+        input_box.send_keys(Keys.CONTROL, 'a')
+        input_box.send_keys(Keys.DELETE)
+        if keyword:
+            input_box.send_keys(keyword)
+        if list_state is not None:
+            list_state['keyword'] = keyword
+    submit = driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]')    # 조회 버튼
+
+    # 조회 전 테이블(이전 행/이전 '데이터가 없습니다')이 새 결과로 바뀐 뒤에만 판정
+    return WaitUtils.table_refresh(driver, submit.click, timeout=DEFAULT_WAIT, budget=5, name='hold_search') > 0
+
+def _select_rows_by_id(driver, review_target_ids):
+    """
+    목록 테이블에서 심사대상ID가 일치하는 행의 체크박스를 선택한다.
+
+    - TableUtils 스냅샷 1회로 행을 읽어 REVIEW_ID_COLUMN 셀(없으면 모든 셀)로 대상을 찾고,
+      선택은 행 키 기준 1회 호출로 처리한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        review_target_ids (list[str]): 선택할 심사대상ID 목록
+
+    Returns:
+        list[str]: 선택된 심사대상ID 목록
+
+    Raises:
+        JavascriptException: JS 실행 중 오류가 발생한 경우
+    """
+    targets = set(map(str, review_target_ids))
+    matched = {}
+    for row in TableUtils.snapshot(driver):
+        cells = row['cells']
+        candidates = [cells[REVIEW_ID_COLUMN]] if REVIEW_ID_COLUMN in cells else cells.values()
+        review_target_id = next((text for text in candidates if text in targets), None)
+        if review_target_id is not None and review_target_id not in matched.values():
+            matched[row['key']] = review_target_id
+
+    TableUtils.set_checked(driver, matched)
+    return list(matched.values())
+
+@StepTimer.timed('hold.single', target=lambda driver, review_target_id, *args, **kwargs: review_target_id)
+def _hold_single(driver, review_target_id, hold_reason, test_mode=False, list_state=None):
+    """
+    심사대상ID 하나를 검색하여 '심사 보류' 처리를 수행한다.
+
+    - 심사대상ID를 검색창에 입력 후 조회를 수행하고,
+      검색 결과가 없으면 경고 로그를 남기고 False를 반환한다.
+    - 검색 결과 중 심사대상ID가 정확히 일치하는 행만 선택한 뒤 보류 사유를 입력해 제출한다. (_submit_hold 호출)
+    - 처리 중 Selenium 오류가 발생하면 로그에 남기고 False를 반환한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스 (검색대상 모드로 설정된 상태)
+        review_target_id (str): 심사대상ID
+        hold_reason (str): 입력할 보류 사유
+        test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        list_state (dict, optional): 목록 화면 상태 (_hold_list_state). 기본값 None.
+
+    Returns:
+        bool: 보류(테스트 모드에서는 보류 사유 입력까지) 처리 성공 여부
+    """
+    try:
+        if not _search_review_target(driver, review_target_id, list_state):
+            StepTimer.annotate(outcome='not_found')
+            logging.log(f"> 검색 결과 없음 : {review_target_id}", level="WARNING")
+            return False
+
+        # 심사 보류 처리 ----------------------------------------------------------------------------------------------- #
+        if not _select_rows_by_id(driver, [review_target_id]):
+            StepTimer.annotate(outcome='not_found')
+            logging.log(f"> 검색 결과에 일치하는 심사대상ID 없음 : {review_target_id}", level="WARNING")
+            return False
+        _submit_hold(driver, review_target_id, hold_reason, test_mode=test_mode)
+        # ------------------------------------------------------------------------------------------------------------ #
+        return True
+
+    except (TimeoutException, WebDriverException, JavascriptException) as e:
+        StepTimer.annotate(outcome=f'error:{type(e).__name__}')
+        logging.log(f"> 심사대상ID 보류 처리 실패({review_target_id}) : {type(e).__name__}", level="WARNING")
+        return False
+
+@StepTimer.timed('hold.batch', target=lambda driver, review_target_ids, *args, **kwargs: f'{len(review_target_ids)}건')
+def _hold_batch(driver, review_target_ids, hold_reason, test_mode=False, list_state=None):
+    """
+    여러 심사대상ID를 한 번의 조회와 한 번의 보류 모달로 일괄 보류 처리한다.
+
+    - 검색어 없이 전체 대기 목록을 조회하고 페이지 크기를 설정한다. (_setup_page_option 호출)
+      같은 list_state로 이미 설정했으면 페이지 크기 설정은 생략하고,
+      직전 검색어도 비어 있으면 조회 버튼만 다시 눌러 목록을 새로 고친다.
+    - 목록의 모든 페이지를 순회하며(iter_result_pages), 페이지마다 테이블 스냅샷으로
+      대상 심사대상ID 행의 체크박스를 선택하고(_select_rows_by_id) 보류 사유를 한 번만 입력해 제출한다. (_submit_hold 호출)
+    - 모든 대상을 선택했으면 남은 페이지 순회를 중단한다.
+    - 목록에서 찾지 못한 ID와, 일괄 제출이 실패한 경우 선택된 모든 ID는 개별 처리(_hold_single)로 폴백한다.
+    - 조회/선택/제출/폴백 단계별 소요 시간을 로그로 남긴다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스 (검색대상 모드로 설정된 상태)
+        review_target_ids (list[str]): 보류 처리할 심사대상ID 목록
+        hold_reason (str): 입력할 보류 사유
+        test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        list_state (dict, optional): 목록 화면 상태 (_hold_list_state). 기본값 None(호출마다 새로 설정).
+
+    Returns:
+        list[str]: 보류 처리에 성공한 심사대상ID 목록
+    """
+    if list_state is None:
+        list_state = _hold_list_state()
+    timings = dict.fromkeys(('조회', '선택', '제출'), 0.0)
+    target_ids = [str(review_target_id) for review_target_id in dict.fromkeys(review_target_ids)]
+    selected_ids, fallback_ids = [], list(target_ids)
+    pages = 0
+
+    try:
+        started = time.perf_counter()
+        if _search_review_target(driver, '', list_state) and not list_state['page_option']:
+            _setup_page_option(driver)
+            list_state['page_option'] = True
+        timings['조회'] += time.perf_counter() - started
+
+        for page_no, _ in iter_result_pages(driver, name='hold_page'):
+            pages = page_no
+            started = time.perf_counter()
+            page_selected = _select_rows_by_id(driver, fallback_ids)
+            timings['선택'] += time.perf_counter() - started
+
+            if page_selected:
+                started = time.perf_counter()
+                _submit_hold(driver, f'{len(page_selected)}건 일괄', hold_reason, test_mode=test_mode, wait_empty=False)
+                timings['제출'] += time.perf_counter() - started
+                selected_ids += page_selected
+                fallback_ids = [review_target_id for review_target_id in fallback_ids
+                                if review_target_id not in page_selected]
+            if not fallback_ids:
+                break
+
+    except (TimeoutException, WebDriverException, JavascriptException) as e:
+        logging.log(f"> 일괄 보류 처리 실패({len(target_ids)}건) : {type(e).__name__} → 개별 처리로 전환", level="WARNING")
+        fallback_ids = [review_target_id for review_target_id in target_ids if review_target_id not in selected_ids]
+
+    held_ids = list(selected_ids)
+    if fallback_ids:
+        started = time.perf_counter()
+        for review_target_id in fallback_ids:
+            if _hold_single(driver, review_target_id, hold_reason, test_mode=test_mode, list_state=list_state):
+                held_ids.append(review_target_id)
+        timings['개별 폴백'] = time.perf_counter() - started
+
+    summary = ', '.join(f'{step} {secs:.1f}s' for step, secs in timings.items())
+    logging.log(f"> 일괄 보류 : 대상 {len(target_ids)}건 / 일괄 {len(selected_ids)}건 / 개별 {len(fallback_ids)}건 "
+                f"/ {pages}페이지 ({summary})",
+                level="INFO")
+    return held_ids
+
+def _hold_targets(driver, targets, test_mode=False, batch=HOLD_BATCH_ENABLED, list_state=None):
     """
-    모텔로 분류된 소재에 대해 '심사 보류' 처리를 수행한다.
+    (심사대상ID, 구분) 목록을 보류 사유(HOLD_REASONS)별로 묶어 보류 처리한다.
+
+    - 같은 사유의 대상이 HOLD_BATCH_MIN건 이상이고 batch=True이면 일괄 처리하고(_hold_batch),
+      그 외에는 심사대상ID별로 처리한다. (_hold_single 호출)
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스 (검색대상 모드로 설정된 상태)
+        targets (list[tuple[str, str]]): (심사대상ID, 구분) 목록
+        test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        batch (bool, optional): 일괄 보류 사용 여부. 기본값 HOLD_BATCH_ENABLED.
+        list_state (dict, optional): 실행 동안 공유할 목록 화면 상태 (_hold_list_state). 기본값 None(새로 생성).
+
+    Returns:
+        list[str]: 보류 처리에 성공한 심사대상ID 목록
+    """
+    if list_state is None:
+        list_state = _hold_list_state()
+    by_reason = {}
+    for review_target_id, category in targets:
+        by_reason.setdefault(HOLD_REASONS[category], []).append(review_target_id)
+
+    held_ids = []
+    for hold_reason, review_target_ids in by_reason.items():
+        if batch and len(review_target_ids) >= HOLD_BATCH_MIN:
+            held_ids += _hold_batch(driver, review_target_ids, hold_reason, test_mode=test_mode,
+                                    list_state=list_state)
+        else:
+            held_ids += [review_target_id for review_target_id in review_target_ids
+                         if _hold_single(driver, review_target_id, hold_reason, test_mode=test_mode,
+                                         list_state=list_state)]
+    return held_ids
+
+def _record_hold_results(run_history, target_ids, held_ids, test_mode=False):
+    """보류 대상 중 성공한 ID는 'held'(테스트 모드는 'test'), 나머지는 'failed'로 실행 이력에 기록한다."""
+    held = set(map(str, held_ids))
+    run_history.record_holds(held, RunHistory.HOLD_TEST if test_mode else RunHistory.HOLD_DONE)
+    run_history.record_holds([review_target_id for review_target_id in map(str, target_ids)
+                              if review_target_id not in held], RunHistory.HOLD_FAILED)
+
+def process_creative_hold(driver, df_work_data, test_mode=False, batch=HOLD_BATCH_ENABLED,
+                          incremental=RUN_HISTORY_ENABLED, run_history=None):
+    """
+    제한 업종(모텔 등 HOLD_RULES)으로 분류된 소재에 대해 '심사 보류' 처리를 수행한다.
 
     - 먼저 `_setup_reviewer_option(driver, 'target')`을 호출해 검색대상 모드로 전환한다.
-    - df_work_data에서 '구분' 값이 '모텔'인 행만 추출하여 순회한다.
-    - 각 심사대상ID를 검색창에 입력 후 조회를 수행하고,
-      검색 결과가 없으면 경고 로그를 남기고 다음 항목으로 넘어간다.
-    - 검색 결과가 있을 경우:
-        * 전체 선택 체크박스를 클릭한다.
-        * '심사 보류' 버튼을 클릭하고, 보류 입력 정보 모달(div.react-draggable)이 나타날 때까지 대기한다.
-        * 모달 내부에서 보류사유 Select 박스를 열고 '92. [공통] 제한업종' 항목을 선택한다.
-        * test_mode=True이면 팝업을 닫고 로그만 남긴다.
-        * test_mode=False이면 '입력' 버튼을 눌러 실제 보류 처리를 진행하고,
-          처리 완료 후 '데이터가 없습니다' 메시지가 나타날 때까지 대기한다.
+    - df_work_data에서 '구분' 값이 HOLD_RULES의 구분 값인 행의 심사대상ID를 추출한다.
+    - 보류 사유별로 묶어, batch=True이고 대상이 HOLD_BATCH_MIN건 이상이면 목록 1회 조회/모달 1회 제출로 일괄 처리하고,
+      그 외에는 심사대상ID별로 검색하여 보류 처리한다. (_hold_targets 호출)
     - 개별 심사대상ID 처리 중 오류가 발생하면 로그에 남기고 다음 항목을 계속 처리한다.
+    - incremental=True이면 심사대상ID별 보류 결과를 실행 이력(RunHistory)에 기록한다.
+      (보류에 실패한 ID는 다음 실행에서 다시 처리된다)
+      분류에 사용한 run_history가 주어지면 같은 인스턴스에 기록하고 닫지 않는다.
 
     Args:
         driver (webdriver.Chrome): Selenium WebDriver 인스턴스
         df_work_data (pandas.DataFrame): '랜딩URL', '심사대상ID', '구분' 컬럼을 포함하는 DataFrame
         test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        batch (bool, optional): 일괄 보류 사용 여부. 기본값 HOLD_BATCH_ENABLED.
+        incremental (bool, optional): 실행 이력에 보류 결과를 기록할지 여부. 기본값 RUN_HISTORY_ENABLED.
+        run_history (RunHistory, optional): 분류 시 사용한 실행 이력. 주어지면 incremental은 무시.
 
     Returns:
         None
@@ -222,100 +1011,120 @@ def process_creative_hold(driver, df_work_data, test_mode=False):
     logging.log("▷ [CARIB] 소재 심사 보류 → 시작", level="INFO")
     _setup_reviewer_option(driver, 'target')
 
-    max_retries = constants.RETRY_COUNT
-    wait_secs = getattr(constants, "RETRY_DELAY", 5)
+    df_hold = df_work_data[df_work_data['구분'].isin(list(HOLD_REASONS))]
+    targets = list(zip(df_hold['심사대상ID'], df_hold['구분']))
+    held_ids = _hold_targets(driver, targets, test_mode=test_mode, batch=batch)
 
-    df_motel_only = df_work_data[df_work_data['구분'] == '모텔'].copy()
+    own_history = run_history is None
+    if own_history:
+        run_history = open_run_history(incremental)
+    try:
+        _record_hold_results(run_history, [review_target_id for review_target_id, _ in targets], held_ids,
+                             test_mode=test_mode)
+    finally:
+        if own_history:
+            run_history.close()
 
-    for idx, current_row in df_motel_only.iterrows():
-        review_target_id = current_row['심사대상ID']
-        try:
-            input_box = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="검색할 내용을 입력하세요."]')
-            input_box.send_keys(Keys.CONTROL, 'a')
-            input_box.send_keys(Keys.DELETE)
-            input_box.send_keys(review_target_id)
-            time.sleep(1)
-            driver.find_element(By.CSS_SELECTOR, '#complex-form > button[type="submit"]').click()    # 조회 버튼
-            time.sleep(3)
-
-            if driver.execute_script('return document.querySelector("div.ant-empty-description")'):
-                logging.log(f"> 검색 결과 없음 : {review_target_id}", level="WARNING")
-                continue
+    logging.log("▷ [CARIB] 소재 심사 보류 → 완료", level="INFO")
 
-            WebDriverWait(driver, DEFAULT_WAIT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table > tbody > tr")))
-            time.sleep(1)
-
-            # 심사 보류 처리 ------------------------------------------------------------------------------------------- #
-            driver.find_element(By.CSS_SELECTOR,  # 체크박스
-                                'table > thead > tr > th > div > label > span > input[type="checkbox"]').click()
-            time.sleep(1)
-            # 버튼 클릭 재시도 로직
-            for attempt in range(1, max_retries + 1):
-                try:
-                    driver.find_element(By.CSS_SELECTOR,  # 심사보류 버튼
-                                        'button.ant-btn.css-l9pxc0.ant-btn-primary.ant-btn-dangerous.ant-btn-color-dangerous.ant-btn-variant-solid').click()
-
-                    WebDriverWait(driver, DEFAULT_WAIT).until(  # 보류 입력 정보 창
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.react-draggable")))
-                    break  # 성공 시 루프 종료
-                except TimeoutException:
-                    logging.log(
-                        f"> 보류 입력 정보 창 미등장 : 재클릭 시도 {attempt}/{max_retries}", level="WARNING")
-                    time.sleep(wait_secs)
-
-            # 0) 모달 등장 대기 (스코프를 모달로 한정)
-            modal = WebDriverWait(driver, DEFAULT_WAIT).until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, 'div.react-draggable'))
-            )
-            time.sleep(1)
-            # 1) 모달 내부의 보류사유 Select 박스 열기
-            select_box = modal.find_element(By.CSS_SELECTOR, '.ant-select .ant-select-selector')
+def process_review_and_hold(driver, carib_utils, carib_id, test_mode=False, fast_path=True, workers=REVIEW_WORKERS,
+                            use_cache=LANDING_CACHE_ENABLED, purge_cache=False, batch=HOLD_BATCH_ENABLED,
+                            incremental=RUN_HISTORY_ENABLED):
+    """
+    소재 자동 심사(분류)와 심사 보류를 생산자/소비자 방식으로 겹쳐 수행한다.
+
+    - 메인 드라이버로 심사자 옵션 설정 및 CSV 다운로드를 마친 뒤(_collect_review_targets),
+      랜딩 페이지 분류를 백그라운드 스레드에서 작업자 전용 드라이버로 수행한다. (메인 드라이버 미사용)
+    - 그동안 메인 스레드는 검색대상 모드로 전환하고,
+      제한 업종(HOLD_RULES)으로 판정된 심사대상ID가 큐에 들어오는 즉시 보류 처리한다.
+      큐에 쌓인 ID는 보류 사유별로 묶어, HOLD_BATCH_MIN건 이상이면 일괄 처리한다. (_hold_targets 호출)
+      전체 목록 조회와 페이지 크기 설정은 첫 일괄 처리에서 한 번만 하고, 이후 묶음은 목록만 새로 고친다.
+    - 전체 소요 시간이 (분류 + 보류)가 아닌 max(분류, 보류)에 가까워진다.
+    - 분류 스레드에서 예외가 발생하면 큐를 닫고, 보류 처리를 마친 뒤 같은 예외를 다시 발생시킨다.
+    - 보류 처리(메인 스레드)에서 예외가 발생하면 분류 스레드에 중단 신호를 보내고, 분류 스레드가 끝날 때까지 기다린 뒤
+      같은 예외를 다시 발생시킨다. (이력 기록 생략)
+    - incremental=True이면 실행 이력(RunHistory)과 비교하여 이전 실행에서 처리가 끝난 심사대상ID를 제외하고,
+      분류 결과(분류 스레드가 정상 종료된 경우)와 보류 결과를 이력에 기록한다.
+
+    Args:
+        driver (webdriver.Chrome): Selenium WebDriver 인스턴스
+        carib_utils (CaribUtils): CSV 다운로드 및 작업자 드라이버 생성에 사용할 CaribUtils 인스턴스
+        carib_id (str): 심사자 옵션에 사용할 CARIB 로그인 계정
+        test_mode (bool, optional): True일 경우 실제 보류 처리 대신 팝업 닫기만 수행. 기본값 False.
+        fast_path (bool, optional): HTTP 우선 추출 사용 여부. 기본값 True.
+        workers (int, optional): 랜딩 페이지 분류 작업자 수. 기본값 REVIEW_WORKERS.
+        use_cache (bool, optional): 랜딩 분류 캐시 사용 여부. 기본값 LANDING_CACHE_ENABLED.
+        purge_cache (bool, optional): True일 경우 분류 전에 캐시를 모두 비운다. 기본값 False.
+        batch (bool, optional): 일괄 보류 사용 여부. 기본값 HOLD_BATCH_ENABLED.
+        incremental (bool, optional): 실행 이력 기반 증분 처리 여부. 기본값 RUN_HISTORY_ENABLED.
+
+    Returns:
+        pandas.DataFrame: '랜딩URL', '심사대상ID', '구분' 컬럼으로 구성된 DataFrame
+    """
+    logging.log("▷ [CARIB] 소재 자동 심사/보류 (스트리밍) → 시작", level="INFO")
+
+    df_work_data = _collect_review_targets(driver, carib_utils, carib_id)
+    run_history = open_run_history(incremental)
+    try:
+        df_work_data, _ = run_history.delta(df_work_data)
+
+        hold_queue = queue.Queue()
+        producer_errors = []
+        cancel = threading.Event()
+
+        def _produce():
             try:
-                select_box.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", select_box)
+                _classify_review_targets(df_work_data, None, carib_utils, fast_path=fast_path, workers=workers,
+                                         use_cache=use_cache, purge_cache=purge_cache, on_hold=hold_queue.put,
+                                         cancel=cancel)
+            except Exception as e:
+                producer_errors.append(e)
+                logging.log(f"> 랜딩 페이지 분류 중 오류 : {type(e).__name__}", level="ERROR")
+            finally:
+                hold_queue.put(None)    # 종료 신호
 
-            # 2) 드롭다운(바디 포털) 등장 대기
-            WebDriverWait(driver, DEFAULT_WAIT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.ant-select-dropdown:not([aria-hidden="true"])')))
+        producer = threading.Thread(target=_produce, name='landing-producer', daemon=True)
+        producer.start()
 
-            # 3) 활성 인풋에 텍스트 입력 → 옵션 리스트 로딩 대기 → Enter로 확정
-            driver.switch_to.active_element.send_keys(HOLD_REASON)
-            WebDriverWait(driver, DEFAULT_WAIT).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.ant-select-item-option')))
-            driver.switch_to.active_element.send_keys(Keys.ENTER)
-
-            # 4) 선택 적용 확인 (모달 내부 셀렉트 영역에 원하는 텍스트가 표시될 때까지 대기)
-            WebDriverWait(driver, DEFAULT_WAIT).until(EC.text_to_be_present_in_element(
-                    (By.CSS_SELECTOR, 'div.react-draggable .ant-select .ant-select-selector'), HOLD_REASON))
-            time.sleep(2)
-
-            # 테스트 모드면 '심사 보류' 처리 건너뜀
-            if test_mode:
-                driver.find_element(By.CSS_SELECTOR, 'div.popup-handle > button').click()    # (팝업창) 닫기 버튼
-                logging.log("> (테스트 모드) '심사 보류' 처리 생략", level="INFO")
-                time.sleep(1)
-            else:
-                for attempt in range(1, max_retries + 1):
-                    try:
-                        driver.find_element(By.CSS_SELECTOR,  # 입력 버튼
-                                            'body > div > div > div > button.ant-btn.css-l9pxc0.ant-btn-primary.ant-btn-color-primary.ant-btn-variant-solid.ant-btn').click()
-                        time.sleep(2)
-                        WebDriverWait(driver, DEFAULT_WAIT).until(  # '데이터가 없습니다' 텍스트
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "div.ant-empty-description")))
-
-                        # 성공 시 루프 종료
-                        break
-                    except WebDriverException as e:
-                        logging.log(
-                            f"> 입력 버튼 클릭 실패({review_target_id}) : {type(e).__name__} 재시도 {attempt}/{max_retries}",level="WARNING"
-                        )
-                        time.sleep(wait_secs)
-            # -------------------------------------------------------------------------------------------------------- #
+        held_ids = set()
+        hold_success = []
+        list_state = _hold_list_state()     # 목록 조회/페이지 크기 설정은 실행 중 1회, 이후 묶음은 새로 고침만
+        try:
+            _setup_reviewer_option(driver, 'target')
 
-        except (TimeoutException, WebDriverException, JavascriptException) as e:
-            logging.log(f"> 심사대상ID 보류 처리 실패({review_target_id}) : {type(e).__name__}", level="WARNING")
-            continue
+            finished = False
+            while not finished:
+                # 대기 중인 ID를 모두 꺼내 한 묶음으로 처리 (종료 신호를 만나면 마지막 묶음)
+                pending = [hold_queue.get()]
+                while not hold_queue.empty():
+                    pending.append(hold_queue.get_nowait())
+                finished = None in pending
 
-    logging.log("▷ [CARIB] 소재 심사 보류 → 완료", level="INFO")
+                pending = [target for target in dict.fromkeys(pending)
+                           if target is not None and target[0] not in held_ids]
+                if not pending:
+                    continue
+                held_ids.update(review_target_id for review_target_id, _ in pending)
+
+                hold_success += _hold_targets(driver, pending, test_mode=test_mode, batch=batch,
+                                              list_state=list_state)
+        except BaseException:
+            cancel.set()    # 보류 처리 실패 → 남은 분류 중단
+            logging.log("> 보류 처리 중단 → 랜딩 페이지 분류 중단 요청", level="WARNING")
+            raise
+        finally:
+            producer.join()
+        logging.log(f"> 보류 처리 : {len(hold_success)}/{len(held_ids)}건", level="INFO")
+
+        # 분류 결과 → 보류 결과 순으로 기록 (분류 기록 시 보류 결과가 초기화되므로)
+        if not producer_errors:
+            run_history.record_classification(df_work_data)
+        _record_hold_results(run_history, held_ids, hold_success, test_mode=test_mode)
+    finally:
+        run_history.close()
+
+    if producer_errors:
+        raise producer_errors[0]
+
+    logging.log("▷ [CARIB] 소재 자동 심사/보류 (스트리밍) → 완료", level="INFO")
+    return df_work_data
@@ -1,12 +1,33 @@
 import gspread
-from gspread_dataframe import get_as_dataframe
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import requests
 import json
+import os
+import threading
 import time
 
 from Common.log import Log
+from Service.constants import Constants
+
+constants = Constants()
+
+
+# 상수 모음 ------------------------------------------------------------------------------------------------------------ #
+KAKAOWORK_URL = "https://api.kakaowork.com/v1/messages.send_by_email"
+KAKAOWORK_TIMEOUT = (5, 10)         # (연결, 응답) 제한 시간(초)
+KAKAOWORK_MAX_WORKERS = 8           # 동시 전송 수 (세션 연결 풀 크기와 동일)
+KAKAOWORK_RETRIES = 3               # 429/5xx/네트워크 오류 재시도 횟수
+KAKAOWORK_BACKOFF = 1.0             # 재시도 대기(초) = BACKOFF * 2^(시도-1), Retry-After가 있으면 우선
+
+RECIPIENT_DOCS = '[RPA] 외부DSP 숙박/여행상품 자동 심사'
+RECIPIENT_COLUMN = '수신자'
+RECIPIENT_CACHE_ENABLED = True      # 수신자 로컬 캐시 사용 여부 (False면 매번 조회)
+RECIPIENT_CACHE_TTL = 24 * 60 * 60  # 캐시 유효 시간(초). 만료 후에도 캐시를 먼저 쓰고 백그라운드에서 갱신
+RECIPIENT_CACHE_FILE = 'recipients_cache.json'  # DOWNLOAD_DIR 하위 캐시 파일명 (테스트 모드는 recipients_cache_test.json)
+RECIPIENT_FETCH_RETRIES = 3         # 스프레드시트 조회 시도 횟수
 
 
 class NotificationService:
@@ -16,19 +37,60 @@ class NotificationService:
 
     # 클래스 초기화
     logging = Log()
+    _session = None
+    _session_lock = threading.Lock()
+    _background = None     # fire-and-forget 전송용 단일 스레드 실행기 (전송 순서 유지)
+    _recipient_lock = threading.Lock()
+    _refreshing = set()    # 백그라운드 갱신 중인 시트명
+
+    @staticmethod
+    def _recipient_cache_path(cache_dir=None, test_mode=False):
+        """수신자 캐시 파일 경로 (cache_dir 기본값: DOWNLOAD_DIR, 테스트 모드는 별도 파일)"""
+        file_name = RECIPIENT_CACHE_FILE
+        if test_mode:
+            root, ext = os.path.splitext(RECIPIENT_CACHE_FILE)
+            file_name = f'{root}_test{ext}'
+        return os.path.join(cache_dir or constants.DOWNLOAD_DIR, file_name)
+
+    @staticmethod
+    def _load_recipient_cache(cache_path, google_sheet):
+        """로컬 캐시에서 (수신자 목록, 조회 시각)을 읽는다. (없거나 손상되면 None)"""
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                entry = json.load(f).get(google_sheet)
+        except (OSError, ValueError):
+            return None
+        if not entry or not isinstance(entry.get('recipients'), list):
+            return None
+        return entry['recipients'], float(entry.get('fetched_at', 0))
+
+    @staticmethod
+    def _save_recipient_cache(cache_path, google_sheet, recipients):
+        """수신자 목록을 시트명별로 로컬 캐시에 저장한다. (임시 파일 작성 후 교체)"""
+        with NotificationService._recipient_lock:
+            try:
+                with open(cache_path, encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            cache[google_sheet] = {'recipients': recipients, 'fetched_at': time.time()}
+
+            tmp_path = f'{cache_path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
 
     @staticmethod
-    def get_recipients_from_gsheet(test_mode=False):
+    def _fetch_recipients(google_sheet):
         """
-        구글 스프레드시트에서 수신자 목록을 읽어온다.
+        워크시트의 '수신자' 컬럼 값만 읽어온다. (전체 시트를 DataFrame으로 변환하지 않음)
 
-        - 특정 문서와 워크시트를 열어 '수신자' 컬럼을 DataFrame으로 변환한다.
-        - NaN/빈값을 제거한 뒤 리스트로 변환하여 반환한다.
-        - 최대 3회 재시도를 수행한다. 실패 시 예외 발생.
-        - test_mode=False인 경우 현업 수신자에게 발송
+        - 헤더 행에서 '수신자' 컬럼 위치를 찾은 뒤 해당 컬럼 범위만 조회한다.
+        - 빈 값을 제거한 뒤 리스트로 반환한다.
+        - RECIPIENT_FETCH_RETRIES회까지 재시도한다. 실패 시 예외 발생.
 
         Args:
-            test_mode (bool, optional): True일 경우 실제 현업 수신자가 아닌 개발자로 발송. 기본값 False.
+            google_sheet (str): 워크시트명
 
         Returns:
             list[str]: 수신자 아이디 리스트
@@ -40,8 +102,60 @@ class NotificationService:
         base_dir = Path(__file__).resolve().parent.parent
         json_file_path = base_dir / 'Resource' / 'gspreadAPI_teemo.json'
 
-        google_docs = '[RPA] 외부DSP 숙박/여행상품 자동 심사'
-        google_account = gspread.service_account(filename=json_file_path)
+        for retry_count in range(1, RECIPIENT_FETCH_RETRIES + 1):
+            try:
+                google_account = gspread.service_account(filename=json_file_path)
+                docs_sheet = google_account.open(RECIPIENT_DOCS).worksheet(google_sheet)
+
+                header = docs_sheet.row_values(1)
+                column = header.index(RECIPIENT_COLUMN) + 1
+                values = docs_sheet.col_values(column)[1:]
+                return [value.strip() for value in values if value and value.strip()]
+            except Exception as e:
+                if retry_count == RECIPIENT_FETCH_RETRIES:
+                    raise Exception(f'> 구글 스프레드시트 불러오기 실패 : {e}')
+                NotificationService.logging.log(
+                    f'> 재시도 중... ({retry_count}/{RECIPIENT_FETCH_RETRIES})', level="WARNING")
+                time.sleep(getattr(constants, "RETRY_DELAY", 5))
+
+    @staticmethod
+    def _refresh_recipients(cache_path, google_sheet):
+        """백그라운드 갱신 : 성공하면 캐시를 교체하고, 실패하면 기존 캐시를 유지한다."""
+        try:
+            recipients = NotificationService._fetch_recipients(google_sheet)
+            NotificationService._save_recipient_cache(cache_path, google_sheet, recipients)
+            NotificationService.logging.log(f'> 수신자 캐시 갱신 : {len(recipients)}명', level="INFO")
+        except Exception as e:
+            NotificationService.logging.log(f'> 수신자 캐시 갱신 실패 (기존 캐시 유지) : {e}', level="WARNING")
+        finally:
+            with NotificationService._recipient_lock:
+                NotificationService._refreshing.discard(google_sheet)
+
+    @staticmethod
+    def get_recipients_from_gsheet(test_mode=False, use_cache=RECIPIENT_CACHE_ENABLED, cache_dir=None):
+        """
+        구글 스프레드시트에서 수신자 목록을 읽어온다.
+
+        - 특정 문서와 워크시트의 '수신자' 컬럼 범위만 읽어 빈 값을 제거한 리스트로 반환한다.
+        - use_cache=True이면 로컬 캐시(cache_dir/recipients_cache.json, 테스트 모드는 recipients_cache_test.json)를
+          먼저 사용한다.
+            * 캐시가 RECIPIENT_CACHE_TTL 이내면 조회 없이 바로 반환
+            * 캐시가 만료되었으면 캐시를 바로 반환하고, 백그라운드에서 새로 조회해 캐시를 갱신 (stale-while-revalidate)
+            * 캐시가 없으면 직접 조회 후 캐시에 저장
+        - 직접 조회가 실패해도 캐시가 있으면 캐시로 대체한다. (둘 다 없으면 예외 발생)
+        - test_mode=False인 경우 현업 수신자에게 발송
+
+        Args:
+            test_mode (bool, optional): True일 경우 실제 현업 수신자가 아닌 개발자로 발송. 기본값 False.
+            use_cache (bool, optional): 로컬 캐시 사용 여부. 기본값 RECIPIENT_CACHE_ENABLED.
+            cache_dir (str, optional): 캐시 파일 폴더 (실행에 주입된 constants.DOWNLOAD_DIR). 기본값 None(모듈 constants).
+
+        Returns:
+            list[str]: 수신자 아이디 리스트
+
+        Raises:
+            Exception: 스프레드시트 로딩 실패 시 (캐시도 없는 경우)
+        """
         google_sheet = '외부DSP 숙박/여행상품 RPA 알림 수신자'
 
         # 테스트 모드면 시트명 변경
@@ -50,67 +164,173 @@ class NotificationService:
 
         NotificationService.logging.log('▷ [Docs] 수신자 확인 → 시작', level="INFO")
 
-        retry_count = 0
-        max_retries = 3
-        while retry_count <= max_retries:
+        cache_path = NotificationService._recipient_cache_path(cache_dir, test_mode)
+        cached = NotificationService._load_recipient_cache(cache_path, google_sheet)
+        if use_cache and cached is not None:
+            recipients, fetched_at = cached
+            age = time.time() - fetched_at
+            if age >= RECIPIENT_CACHE_TTL:
+                with NotificationService._recipient_lock:
+                    start_refresh = google_sheet not in NotificationService._refreshing
+                    NotificationService._refreshing.add(google_sheet)
+                if start_refresh:
+                    threading.Thread(target=NotificationService._refresh_recipients, args=(cache_path, google_sheet),
+                                     name='recipient-refresh', daemon=True).start()
+            refresh_note = ', 백그라운드 갱신' if age >= RECIPIENT_CACHE_TTL else ''
+            NotificationService.logging.log(f'> 수신자 캐시 사용 : {len(recipients)}명 ({age / 3600:.1f}시간 전{refresh_note})',
+                                            level="INFO")
+            NotificationService.logging.log('▷ [Docs] 수신자 확인 → 완료', level="INFO")
+            return recipients
+
+        try:
+            recipients = NotificationService._fetch_recipients(google_sheet)
+        except Exception:
+            if cached is None:
+                raise
+            NotificationService.logging.log('> 구글 스프레드시트 조회 실패 → 수신자 캐시로 대체', level="WARNING")
+            recipients = cached[0]
+        else:
             try:
-                retry_count += 1
-                docs_sheet = google_account.open(google_docs).worksheet(google_sheet)
+                NotificationService._save_recipient_cache(cache_path, google_sheet, recipients)
+            except OSError as e:
+                NotificationService.logging.log(f'> 수신자 캐시 저장 실패 : {type(e).__name__}', level="WARNING")
 
-                origin_df = get_as_dataframe(docs_sheet, dtype=str)
-                recipients = origin_df['수신자'].dropna().tolist()
+        NotificationService.logging.log('▷ [Docs] 수신자 확인 → 완료', level="INFO")
+        return recipients
 
-                NotificationService.logging.log('▷ [Docs] 수신자 확인 → 완료', level="INFO")
-                return recipients
-            except Exception as e:
-                NotificationService.logging.log(f'> 재시도 중... ({retry_count}/3)', level="WARNING")
-                time.sleep(10)
+    @classmethod
+    def _get_session(cls):
+        """keep-alive 연결 풀을 가진 공용 HTTP 세션을 반환한다. (최초 호출 시 생성)"""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=KAKAOWORK_MAX_WORKERS)
+                session.mount('https://', adapter)
+                cls._session = session
+            return cls._session
 
-                if retry_count == max_retries:
-                    raise Exception(f'> 구글 스프레드시트 불러오기 실패 : {e}')
+    @classmethod
+    def _post_message(cls, headers, recipient, contents):
+        """
+        수신자 한 명에게 메시지를 전송한다.
+
+        - 429/5xx 응답과 네트워크 오류는 KAKAOWORK_RETRIES회까지 지수 백오프로 재시도한다.
+          (429의 Retry-After 헤더가 있으면 그 값을 대기 시간으로 사용)
+
+        Args:
+            headers (dict): 요청 헤더 (인증 포함)
+            recipient (str): 수신자 아이디
+            contents (str): 전송할 메시지 내용
+
+        Returns:
+            tuple[bool, str]: (성공 여부, 실패 사유)
+        """
+        payload = {
+            "email": f"{recipient}@knworks.co.kr",
+            "text": f"{contents}",
+        }
+
+        reason = ''
+        for attempt in range(1, KAKAOWORK_RETRIES + 2):
+            delay = KAKAOWORK_BACKOFF * (2 ** (attempt - 1))
+            try:
+                response = cls._get_session().post(KAKAOWORK_URL, headers=headers, json=payload,
+                                                   timeout=KAKAOWORK_TIMEOUT)
+            except requests.RequestException as e:
+                reason = type(e).__name__
+            else:
+                if response.status_code == 429 or response.status_code >= 500:
+                    reason = f'HTTP {response.status_code}'
+                    retry_after = response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = int(retry_after)
+                else:
+                    try:
+                        if response.json().get('success'):
+                            return True, ''
+                    except ValueError:
+                        pass
+                    return False, response.text
+
+            if attempt <= KAKAOWORK_RETRIES:
+                time.sleep(delay)
+        return False, reason
 
     @staticmethod
-    def send_kakaowork_message(kakaowork_api_key=None, recipients=None, contents=None):
+    def send_kakaowork_message(kakaowork_api_key=None, recipients=None, contents=None, background=False):
         """
         카카오워크 알림 메시지를 전송한다.
 
-        - recipients 리스트를 순회하면서 각 수신자에게 개별적으로 메시지를 전송한다.
+        - 공용 HTTP 세션(keep-alive 연결 풀)으로 수신자들에게 동시에 전송한다. (최대 KAKAOWORK_MAX_WORKERS건)
         - 각 수신자 아이디에 '@knworks.co.kr'을 붙여 email 필드에 사용한다.
+        - 요청마다 제한 시간(KAKAOWORK_TIMEOUT)을 두고, 429/5xx는 백오프 후 재시도한다.
         - API 응답에서 'success' 값이 True면 전송 성공, False면 실패로 간주한다.
         - 성공/실패 여부는 로그로 남긴다.
+        - background=True면 전송을 백그라운드 스레드에 맡기고 바로 반환한다. (호출 순서대로 전송)
 
         Args:
             kakaowork_api_key (str, optional): 카카오워크 API 키
             recipients (list[str], optional): 수신자 아이디 리스트 (ex: ["teemo.hi", "abc"])
             contents (str, optional): 전송할 메시지 내용
+            background (bool, optional): 백그라운드 전송 여부. 기본값 False.
 
         Returns:
-            None
+            concurrent.futures.Future | None: background=True면 전송 작업 Future, 아니면 None
         """
+        if background:
+            cls = NotificationService
+            with cls._session_lock:
+                if cls._background is None:
+                    cls._background = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kakaowork')
+                return cls._background.submit(cls._send_safely, kakaowork_api_key, recipients, contents)
+
         NotificationService.logging.log(f'▷ [KAKAOWORK] 알림 전송 → 시작', level="INFO")
 
-        for recipient in recipients:
-            url = "https://api.kakaowork.com/v1/messages.send_by_email"
+        headers = {
+            "Authorization": f"Bearer {kakaowork_api_key}",
+            "Content-Type": "application/json",
+        }
 
-            # 필수 값 할당 ------------------------------------------------------------------------------------------- #
-            headers = {
-                "Authorization": f"Bearer {kakaowork_api_key}",
-                "Content-Type": "application/json",
-            }
+        recipients = list(recipients or [])
+        if recipients:
+            with ThreadPoolExecutor(max_workers=min(KAKAOWORK_MAX_WORKERS, len(recipients)),
+                                    thread_name_prefix='kakaowork-send') as executor:
+                results = list(executor.map(
+                    lambda recipient: NotificationService._post_message(headers, recipient, contents), recipients))
 
-            payload = {
-                "email": f"{recipient}@knworks.co.kr",
-                "text": f"{contents}",
-            }
+            for recipient, (success, reason) in zip(recipients, results):
+                if success:
+                    NotificationService.logging.log(f'> 알림 전송 성공', level="INFO")
+                else:
+                    NotificationService.logging.log(f'> 알림 전송 실패 : {recipient} - {reason}', level="WARNING")
 
-            # 호출 --------------------------------------------------------------------------------------------------- #
-            response = requests.post(url, headers=headers, json=payload)
+        NotificationService.logging.log(f'▷ [KAKAOWORK] 알림 전송 → 완료', level="INFO")
 
-            sendResult = json.loads(response.content).get('success')
+    @staticmethod
+    def _send_safely(kakaowork_api_key, recipients, contents):
+        """백그라운드 전송용 : 예외가 나도 로그만 남기고 삼킨다."""
+        try:
+            NotificationService.send_kakaowork_message(kakaowork_api_key, recipients, contents)
+        except Exception as e:
+            NotificationService.logging.log(f'> 알림 전송 오류 : {type(e).__name__} - {e}', level="WARNING")
 
-            if sendResult:
-                NotificationService.logging.log(f'> 알림 전송 성공', level="INFO")
-            else:
-                NotificationService.logging.log(f'> 알림 전송 실패 : {recipient} - {response.text}', level="WARNING")
+    @classmethod
+    def flush(cls, timeout=None):
+        """
+        백그라운드 전송이 모두 끝날 때까지 기다린다. (프로세스 종료 전 호출)
 
-        NotificationService.logging.log(f'▷ [KAKAOWORK] 알림 전송 → 완료', level="INFO")
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). 기본값 None(무제한).
+
+        Returns:
+            bool: 제한 시간 안에 모두 끝났으면 True
+        """
+        with cls._session_lock:
+            if cls._background is None:
+                return True
+            marker = cls._background.submit(lambda: None)
+        try:
+            marker.result(timeout=timeout)
+            return True
+        except Exception:
+            return False
@@ -6,13 +6,22 @@ from Service.constants import Constants
 from Service.notification_service import NotificationService
 from Function.common_utils import CommonUtils
 from Function.carib_utils import CaribUtils
+from Function.wait_utils import WaitUtils
+from Function.table_utils import TableUtils
+from Function.step_timer import StepTimer
+
+from concurrent.futures import ThreadPoolExecutor
 
 from Service.CARIB_content_collector import process_content_collection
-from Service.CARIB_content_reviewer import process_content_review, process_creative_hold
+from Service.CARIB_content_reviewer import (process_content_review, process_creative_hold, process_review_and_hold,
+                                            open_run_history, DEVTOOLS_CAPTURE)
 
+import html
 import os
 import sys
+import time
 import traceback
+from datetime import datetime, timedelta
 
 try:
     os.chdir(sys._MEIPASS)
@@ -28,87 +37,314 @@ email = EmailSender(constants.SMTP_ID, constants.SMTP_PW)
 utils = CommonUtils()
 noti_service = NotificationService()
 
-g_logFile = logging.get_log_paths()
 g_developer = ['teemo.hi@knworks.co.kr']
 
 # 상수 모음 ------------------------------------------------------------------------------------------------------------ #
 CARIB_URL = 'https://kad-review.kakaosecure.net/waiting?reviewType=APPIER_BIZBOARD_DYNAMIC'
+CASE_B_STREAMING = True     # Case B 분류/보류 동시 수행 여부 (False면 분류 완료 후 보류)
+PERSIST_SESSION = False     # (데몬) CARIB 로그인 세션(쿠키) 암호화 보관/복원 사용 여부 (CARIB_SESSION_KEY 필요)
+SESSION_FILE_NAME = 'carib_session.bin'
+WORK_DATA_FILE_NAME = 'df_work_data_test.csv'    # Case B 이번 실행 처리 대상 확인용 CSV (증분 처리 시 제외된 행 미포함)
+DAEMON_WARMUP_SECS = 60     # (데몬) 실행 시각 몇 초 전에 로그인 세션을 재검증할지
+DAEMON_MAX_SLEEP = 30       # (데몬) 대기 중 시각 재확인 주기(초)
+DAEMON_MAX_LATE_SECS = 3 * 60 * 60  # (데몬) 이보다 늦은 슬롯은 실행하지 않음 (절전/중단 후 재개 대비)
 
 
-# main --------------------------------------------------------------------------------------------------------------- #
-def run_pipeline(now=None, mailer=None, constants_obj=None, test_mode=False):
-    _mailer = mailer or email
-    _constants = constants_obj or constants
+def _session_file(download_dir):
+    """PERSIST_SESSION 설정과 세션 키(CARIB_SESSION_KEY) 유무에 따라 세션 보관 파일 경로(또는 None)를 반환한다."""
+    if not PERSIST_SESSION:
+        return None
+    if utils.session_key() is None:
+        logging.log(f'> 세션 보관 생략 : {utils.SESSION_KEY_ENV} 미설정', level='WARNING')
+        return None
+    return os.path.join(download_dir, SESSION_FILE_NAME)
 
-    logging.log(f'□ [{_constants.PROCESS_NAME}] 시작', level='INFO')
 
-    case_classify = utils.check_schedule_case(current=now)   # "A" / "B" / None
-    carib_id, carib_pw = utils.decrypt_carib_account()   # 카리브 아이디 / 비밀번호
-    recipients = NotificationService.get_recipients_from_gsheet(test_mode=test_mode)     # 수신자
+def _save_work_data(df_work_data):
+    """
+    Case B 이번 실행의 처리 대상과 분류 결과('구분')를 DOWNLOAD_DIR 하위 CSV로 저장한다.
 
-    carib_utils = CaribUtils(
-        carib_url=CARIB_URL,
-        carib_id=carib_id,
-        carib_pw=carib_pw,
-        logger=logging,
-        download_dir=_constants.DOWNLOAD_DIR
-    )
+    - 실행 이력(RUN_HISTORY_ENABLED) 사용 시 이전 실행에서 처리가 끝난 행은 포함되지 않는다. (증분 대상만 기록)
+      전체 심사 목록이 필요하면 Service.CARIB_content_reviewer.RUN_HISTORY_ENABLED를 False로 두고 실행한다.
+    """
+    if df_work_data is not None:
+        save_path = os.path.join(constants.DOWNLOAD_DIR, WORK_DATA_FILE_NAME)
+        df_work_data.to_csv(save_path, index=False, encoding="utf-8-sig")
 
-    noti_service.send_kakaowork_message(kakaowork_api_key=_constants.WORK_API_KEY, recipients=recipients,
-                                 contents=f'[{_constants.PROCESS_ID}], [시작]')
 
-    driver = carib_utils.login()
+def _timing_file():
+    """로그 폴더 하위 날짜별 단계 기록(JSON lines) 파일 경로를 반환한다."""
+    return os.path.join(logging.log_dir, f'Timing_{datetime.now():%Y%m%d}.jsonl')
 
-    if case_classify == "A":
-        # CaseA. 여행/숙박 소재 자동 수집 (7:00, 7:30)
-        try:
-            # TODO: Case A 동작 수행
-            logging.log('> [ Case A ]', level='INFO')
-            process_content_collection(driver, test_mode=test_mode)
-        finally:
-            carib_utils.logout()
-            carib_utils.quit()
-    elif case_classify == "B":
-        # CaseB. 소재 자동 심사 및 보류 처리 (7:34)
+
+def _timing_mail_body():
+    """단계별 소요 시간 요약표를 메일 본문(HTML)으로 반환한다. (기록이 없으면 빈 문자열)"""
+    table = StepTimer.summary_table()
+    return f'<pre>{html.escape(table)}</pre>' if table else ''
+
+
+def _startup(_constants, test_mode=False, session=None):
+    """
+    실행 준비 단계(계정 복호화/로그인, 수신자 조회, 시작 알림)를 병렬로 수행한다.
+
+    - [login] 계정 복호화 → CaribUtils 생성 → 브라우저 기동 및 로그인 (session이 있으면 세션 재검증)
+    - [notify] 구글 스프레드시트 수신자 조회 → 카카오워크 시작 알림 (백그라운드 전송, 대기하지 않음)
+    - 두 작업을 동시에 실행하므로 Sheets/카카오워크 지연이 CARIB 로그인을 늦추지 않는다.
+    - 작업별 소요 시간과 전체(임계 경로) 소요 시간을 로그로 남긴다.
+    - 수신자 조회가 실패하면 새로 띄운 드라이버를 종료한 뒤 예외를 다시 발생시킨다.
+
+    Args:
+        _constants (Constants): 상수 객체
+        test_mode (bool, optional): 테스트 모드 여부. 기본값 False.
+        session (CaribUtils, optional): 로그인 상태를 유지 중인 CaribUtils 인스턴스
+
+    Returns:
+        tuple: (carib_utils, driver, recipients)
+    """
+    started = time.perf_counter()
+    durations = {}
+
+    def _login():
+        task_started = time.perf_counter()
+        if session is not None:
+            carib_utils = session
+            driver = carib_utils.ensure_login()
+        else:
+            carib_id, carib_pw = utils.decrypt_carib_account()   # 카리브 아이디 / 비밀번호
+            carib_utils = CaribUtils(
+                carib_url=CARIB_URL,
+                carib_id=carib_id,
+                carib_pw=carib_pw,
+                logger=logging,
+                download_dir=_constants.DOWNLOAD_DIR,    # 단발 실행은 세션을 보관하지 않고 항상 로그아웃
+                capture_network=DEVTOOLS_CAPTURE
+            )
+            driver = carib_utils.login()
+        durations['login'] = time.perf_counter() - task_started
+        return carib_utils, driver
+
+    def _notify():
+        task_started = time.perf_counter()
+        recipients = NotificationService.get_recipients_from_gsheet(
+            test_mode=test_mode, cache_dir=_constants.DOWNLOAD_DIR)     # 수신자
+        noti_service.send_kakaowork_message(kakaowork_api_key=_constants.WORK_API_KEY, recipients=recipients,
+                                            contents=f'[{_constants.PROCESS_ID}], [시작]', background=True)
+        durations['notify'] = time.perf_counter() - task_started
+        return recipients
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix='startup') as executor:
+        login_future = executor.submit(_login)
+        notify_future = executor.submit(_notify)
+
+        carib_utils, driver = login_future.result()
         try:
-            # TODO: Case B 동작 수행
-            logging.log('> [ Case B ]', level='INFO')
-            df_work_data = process_content_review(driver, carib_utils, carib_id)
+            recipients = notify_future.result()
+        except Exception:
+            if session is None:
+                carib_utils.quit()
+            raise
 
-            if df_work_data is not None:
-                save_path = os.path.join(constants.DOWNLOAD_DIR, "df_work_data_test.csv")
-                df_work_data.to_csv(save_path, index=False, encoding="utf-8-sig")
+    total = time.perf_counter() - started
+    critical = max(durations, key=durations.get)
+    logging.log(f"> 실행 준비 : {total:.1f}s (임계 경로 {critical}) / "
+                + ', '.join(f'{name} {secs:.1f}s' for name, secs in durations.items()), level='INFO')
+    return carib_utils, driver, recipients
 
-            process_creative_hold(driver, df_work_data, test_mode=test_mode)
-        finally:
-            carib_utils.logout()
-            carib_utils.quit()
-    else:
-        logging.log('> 케이스 해당 없음', level='INFO')
+
+# main --------------------------------------------------------------------------------------------------------------- #
+def run_pipeline(now=None, mailer=None, constants_obj=None, test_mode=False, case=None, session=None):
+    """
+    스케줄 케이스에 맞는 CARIB 작업(Case A/B)을 1회 수행한다.
+
+    - case가 주어지지 않으면 now 기준으로 케이스를 판별한다. (±OFFSET)
+    - session(CaribUtils)이 주어지면 새로 로그인하지 않고 세션을 재검증하여 재사용하며,
+      작업 후에도 로그아웃/드라이버 종료를 하지 않는다. (데몬 모드)
+    - 단계별 소요 시간은 StepTimer로 로그 폴더의 Timing_YYYYMMDD.jsonl에 기록하고,
+      단계별 요약표(건수/p50/p95/최대)를 로그와 완료 메일 본문에 남긴다.
+
+    Args:
+        now (datetime, optional): 케이스 판별 기준 시각
+        mailer (EmailSender, optional): 메일 발송 객체
+        constants_obj (Constants, optional): 상수 객체
+        test_mode (bool, optional): 테스트 모드 여부. 기본값 False.
+        case (str, optional): 실행할 케이스("A" / "B"). 지정 시 시각 판별 생략
+        session (CaribUtils, optional): 로그인 상태를 유지 중인 CaribUtils 인스턴스
+    """
+    _mailer = mailer or email
+    _constants = constants_obj or constants
+
+    logging.log(f'□ [{_constants.PROCESS_NAME}] 시작', level='INFO')
+    WaitUtils.reset()
+    TableUtils.reset()
+    StepTimer.reset(_timing_file())
+    logging.reset_stats()
+
+    with StepTimer.span('run_pipeline') as run_span:
+        case_classify = case or utils.check_schedule_case(current=now)   # "A" / "B" / None
+        run_span.target = f'Case {case_classify}'
+        carib_utils, driver, recipients = _startup(_constants, test_mode=test_mode, session=session)
+        carib_id = carib_utils.carib_id
+
+        if case_classify == "A":
+            # CaseA. 여행/숙박 소재 자동 수집 (7:00, 7:30)
+            try:
+                # TODO: Case A 동작 수행
+                logging.log('> [ Case A ]', level='INFO')
+                process_content_collection(driver, test_mode=test_mode, carib_utils=carib_utils)
+            finally:
+                if session is None:
+                    carib_utils.logout()
+                    carib_utils.quit()
+        elif case_classify == "B":
+            # CaseB. 소재 자동 심사 및 보류 처리 (7:34)
+            try:
+                # TODO: Case B 동작 수행
+                logging.log('> [ Case B ]', level='INFO')
+                if CASE_B_STREAMING:
+                    df_work_data = process_review_and_hold(driver, carib_utils, carib_id, test_mode=test_mode)
+                    _save_work_data(df_work_data)
+                else:
+                    # 분류/보류 결과를 같은 실행 이력에 기록
+                    run_history = open_run_history()
+                    try:
+                        df_work_data = process_content_review(driver, carib_utils, carib_id, run_history=run_history)
+                        _save_work_data(df_work_data)
+                        process_creative_hold(driver, df_work_data, test_mode=test_mode, run_history=run_history)
+                    finally:
+                        run_history.close()
+            finally:
+                if session is None:
+                    carib_utils.logout()
+                    carib_utils.quit()
+        else:
+            logging.log('> 케이스 해당 없음', level='INFO')
 
     noti_service.send_kakaowork_message(kakaowork_api_key=_constants.WORK_API_KEY, recipients=recipients,
-                                 contents=f'[{_constants.PROCESS_ID}], [완료]')
+                                        contents=f'[{_constants.PROCESS_ID}], [완료]', background=True)
 
+    WaitUtils.log_report(logging)
+    TableUtils.log_report(logging)
+    StepTimer.log_report(logging)
+    logging.report_overhead()
     logging.log(f'□ [{_constants.PROCESS_NAME}] 종료', level='INFO')
+    logging.flush()
 
     if case_classify == "B":
-        # 최종 실행 완료 후 로그 메일 받기
-        _mailer.send_email(
+        # 최종 실행 완료 후 로그 메일 받기 (비동기 전송을 지원하면 백그라운드 전송, 종료 전 flush)
+        mail_kwargs = dict(
             mail_subject=f'[{_constants.PROCESS_ID}] {_constants.PROCESS_NAME}, [완료]',
-            mail_body='',
+            mail_body=_timing_mail_body(),
             mail_to=g_developer,
-            mail_attachments=[g_logFile]
+            mail_attachments=logging.get_log_parts()
         )
+        send_async = getattr(_mailer, 'send_email_async', None)
+        if send_async is None:
+            _mailer.send_email(**mail_kwargs)
+        else:
+            send_async(**mail_kwargs).add_done_callback(_log_mail_failure)
 
-if __name__ == "__main__":
+def _log_mail_failure(future):
+    """백그라운드 메일 전송 실패를 로그로 남긴다."""
+    if future.exception() is not None:
+        logging.log(f'> 완료 메일 전송 실패 : {future.exception()}', level='WARNING')
+
+def _report_failure(e):
+    """파이프라인 오류를 로그로 남기고 개발자에게 실패 메일을 보낸다."""
+    logging.log(f'※ [{constants.PROCESS_NAME}] 중 오류 : {str(e)}', level="ERROR")
+    logging.log(traceback.format_exc(), level="ERROR")
+    StepTimer.log_report(logging)
+    logging.flush()
+    email.send_email(
+        mail_subject=f'[{constants.PROCESS_ID}] {constants.PROCESS_NAME}, [실패]',
+        mail_body=_timing_mail_body(),
+        mail_to=g_developer,
+        mail_attachments=logging.get_log_parts()
+    )
+
+def _sleep_until(target):
+    """target 시각까지 대기한다. (시스템 시각 변경에 대비해 DAEMON_MAX_SLEEP 주기로 재확인)"""
+    while True:
+        remaining = (target - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, DAEMON_MAX_SLEEP))
+
+def run_daemon(test_mode=False):
+    """
+    상주 프로세스로 실행하며 CASE_A_TIMES / CASE_B_TIMES 스케줄을 직접 관리한다.
+
+    - 계정 복호화와 CARIB 로그인은 최초 1회만 수행하고 세션을 유지한다.
+    - 각 실행 시각 DAEMON_WARMUP_SECS 전에 세션을 재검증(필요 시 재로그인)해 두고,
+      정확한 실행 시각에 run_pipeline(case=..., session=...)을 호출한다.
+    - 다음 슬롯은 마지막 슬롯 기준으로 계산하므로, 이전 실행이 다음 슬롯 시각을 넘겨도
+      그 슬롯을 건너뛰지 않고 늦게 실행하며 지연을 로그로 남긴다. (DAEMON_MAX_LATE_SECS 초과 시 생략)
+    - 실행 중 오류가 발생해도 실패 메일만 보내고 다음 스케줄을 계속 대기한다.
+    - 종료(KeyboardInterrupt) 시 로그아웃 후 드라이버를 종료한다.
+
+    Args:
+        test_mode (bool, optional): 테스트 모드 여부. 기본값 False.
+    """
+    logging.log(f'□ [{constants.PROCESS_NAME}] 데몬 모드 시작', level='INFO')
+
+    carib_id, carib_pw = utils.decrypt_carib_account()
+    session = CaribUtils(
+        carib_url=CARIB_URL,
+        carib_id=carib_id,
+        carib_pw=carib_pw,
+        logger=logging,
+        download_dir=constants.DOWNLOAD_DIR,
+        session_file=_session_file(constants.DOWNLOAD_DIR),
+        capture_network=DEVTOOLS_CAPTURE
+    )
+
+    last_slot = None
     try:
-        run_pipeline()
-    except Exception as e:
-        logging.log(f'※ [{constants.PROCESS_NAME}] 중 오류 : {str(e)}', level="ERROR")
-        logging.log(traceback.format_exc(), level="ERROR")
-        email.send_email(
-            mail_subject=f'[{constants.PROCESS_ID}] {constants.PROCESS_NAME}, [실패]',
-            mail_body='',
-            mail_to=g_developer,
-            mail_attachments=[g_logFile]
-        )
+        while True:
+            # 마지막 슬롯 기준으로 다음 슬롯을 계산 → 이전 실행이 길어져 지난 슬롯도 건너뛰지 않음
+            slot_dt, case = utils.next_schedule(after=last_slot)
+            last_slot = slot_dt
+            late_secs = (datetime.now() - slot_dt).total_seconds()
+
+            if late_secs > DAEMON_MAX_LATE_SECS:
+                logging.log(f'> 실행 생략 : {slot_dt:%Y-%m-%d %H:%M:%S} (Case {case}) '
+                            f'{late_secs / 60:.0f}분 경과', level='WARNING')
+                continue
+            if late_secs > 0:
+                logging.log(f'> 지연 실행 : {slot_dt:%Y-%m-%d %H:%M:%S} (Case {case}) '
+                            f'{late_secs:.0f}초 늦음', level='WARNING')
+            else:
+                logging.log(f'> 다음 실행 : {slot_dt:%Y-%m-%d %H:%M:%S} (Case {case})', level='INFO')
+
+                _sleep_until(slot_dt - timedelta(seconds=DAEMON_WARMUP_SECS))
+                try:
+                    session.ensure_login()
+                except Exception as e:
+                    logging.log(f'> 세션 사전 확인 실패 : {type(e).__name__}', level='WARNING')
+
+                _sleep_until(slot_dt)
+
+            try:
+                run_pipeline(test_mode=test_mode, case=case, session=session)
+            except Exception as e:
+                _report_failure(e)
+    except KeyboardInterrupt:
+        logging.log(f'□ [{constants.PROCESS_NAME}] 데몬 모드 종료', level='INFO')
+    finally:
+        try:
+            session.logout()
+        finally:
+            session.quit()
+            NotificationService.flush(timeout=60)
+            email.close()
+
+if __name__ == "__main__":
+    if '--daemon' in sys.argv:
+        run_daemon()
+    else:
+        try:
+            run_pipeline()
+        except Exception as e:
+            _report_failure(e)
+        finally:
+            NotificationService.flush(timeout=60)   # 백그라운드 알림 전송 마무리
+            email.close()                           # 완료 메일 전송 마무리 및 SMTP 연결 종료
@@ -1,5 +1,6 @@
 # main_test.py
 
+from concurrent.futures import Future
 from datetime import datetime
 import main
 
@@ -8,6 +9,14 @@ class MockEmailSender:
     def send_email(self, mail_subject, mail_body, mail_to, mail_attachments=None):
         print(f"[MOCK-EMAIL] {mail_subject}")
 
+    def send_email_async(self, *args, **kwargs):
+        future = Future()
+        future.set_result(self.send_email(*args, **kwargs))
+        return future
+
+    def close(self):
+        pass
+
 class MockConstants:
     PROCESS_ID = "CAU061 (테스트)"
     PROCESS_NAME = "CARIB 파이프라인 (테스트)"
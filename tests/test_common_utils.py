@@ -0,0 +1,37 @@
+# test_common_utils.py
+import unittest
+from datetime import datetime
+
+from Function.common_utils import CommonUtils
+
+
+class NextScheduleTest(unittest.TestCase):
+    """CommonUtils.next_schedule : 데몬 다음 실행 슬롯 (기본 스케줄 A 07:00, 07:30 / B 07:34)"""
+
+    def test_nearest_slot_from_current(self):
+        self.assertEqual(CommonUtils.next_schedule(current=datetime(2026, 1, 5, 6, 0)),
+                         (datetime(2026, 1, 5, 7, 0), 'A'))
+        self.assertEqual(CommonUtils.next_schedule(current=datetime(2026, 1, 5, 7, 31)),
+                         (datetime(2026, 1, 5, 7, 34), 'B'))
+
+    def test_current_slot_is_included(self):
+        self.assertEqual(CommonUtils.next_schedule(current=datetime(2026, 1, 5, 7, 30)),
+                         (datetime(2026, 1, 5, 7, 30), 'A'))
+
+    def test_rolls_over_to_next_day(self):
+        self.assertEqual(CommonUtils.next_schedule(current=datetime(2026, 1, 5, 8, 0)),
+                         (datetime(2026, 1, 6, 7, 0), 'A'))
+
+    def test_after_returns_slot_strictly_after_last_slot(self):
+        # 이전 실행이 07:00 슬롯에서 07:40까지 걸려도 07:30 슬롯을 건너뛰지 않음 (지난 시각이어도 반환)
+        self.assertEqual(CommonUtils.next_schedule(current=datetime(2026, 1, 5, 7, 40),
+                                                   after=datetime(2026, 1, 5, 7, 0)),
+                         (datetime(2026, 1, 5, 7, 30), 'A'))
+        self.assertEqual(CommonUtils.next_schedule(after=datetime(2026, 1, 5, 7, 30)),
+                         (datetime(2026, 1, 5, 7, 34), 'B'))
+        self.assertEqual(CommonUtils.next_schedule(after=datetime(2026, 1, 5, 7, 34)),
+                         (datetime(2026, 1, 6, 7, 0), 'A'))
+
+
+if __name__ == '__main__':
+    unittest.main()
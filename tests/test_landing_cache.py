@@ -0,0 +1,66 @@
+# test_landing_cache.py
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from Function.landing_cache import LandingCache
+
+
+class LandingCacheTest(unittest.TestCase):
+    """LandingCache : TTL 만료 / LRU 제거 / 우회"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, 'landing_cache.db')
+        self.now = 1_000_000.0
+        patcher = mock.patch('Function.landing_cache.time.time', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cache(self, **kwargs):
+        cache = LandingCache(self.db_path, logger=mock.Mock(), **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_hit_and_miss(self):
+        cache = self._cache()
+        self.assertIsNone(cache.get('interpark:1'))
+        cache.put('interpark:1', 'https://travel.interpark.com/goods/1', '모텔')
+        self.assertEqual(cache.get('interpark:1'), '모텔')
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_expired_entry_is_removed(self):
+        cache = self._cache(ttl=60)
+        cache.put('interpark:1', 'url', '호텔')
+        self.now += 61
+        self.assertIsNone(cache.get('interpark:1'))
+        self.now -= 61      # 만료 항목은 조회 시 삭제되어 시각을 되돌려도 없음
+        self.assertIsNone(cache.get('interpark:1'))
+
+    def test_lru_eviction_keeps_recently_read(self):
+        cache = self._cache(max_entries=2)
+        cache.put('a', 'url-a', 'A')
+        self.now += 1
+        cache.put('b', 'url-b', 'B')
+        self.now += 1
+        cache.get('a')      # a를 최근 조회로 갱신 → b가 가장 오래됨
+        self.now += 1
+        cache.put('c', 'url-c', 'C')
+
+        self.assertEqual(cache.get('a'), 'A')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 'C')
+
+    def test_disabled_cache_bypasses(self):
+        cache = self._cache(enabled=False)
+        cache.put('a', 'url-a', 'A')
+        self.assertIsNone(cache.get('a'))
+        self.assertFalse(os.path.exists(self.db_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
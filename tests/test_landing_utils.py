@@ -0,0 +1,57 @@
+# test_landing_utils.py
+import unittest
+
+from Function.landing_utils import normalize_landing_url
+
+
+class NormalizeLandingUrlTest(unittest.TestCase):
+    """normalize_landing_url : 숙소 단위 정규화 키"""
+
+    def test_goods_detail_query_code(self):
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/detail?goodsCode=111'),
+                         'interpark:111')
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/detail?goodsCode=222'),
+                         'interpark:222')
+
+    def test_goods_detail_trailing_slash_goods_cd(self):
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/detail/?goods_cd=ABC'),
+                         'interpark:ABC')
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/detail/?goods_cd=XYZ'),
+                         'interpark:XYZ')
+
+    def test_goods_path_code(self):
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/detail/12345?utm_source=x'),
+                         'interpark:12345')
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/12345'), 'interpark:12345')
+
+    def test_query_key_before_path(self):
+        self.assertEqual(normalize_landing_url('https://travel.interpark.com/goods/view?goodsCode=777'),
+                         'interpark:777')
+
+    def test_no_identifier_keeps_full_url(self):
+        first = normalize_landing_url('https://travel.interpark.com/goods/detail?seq=1&utm_source=a')
+        second = normalize_landing_url('https://travel.interpark.com/goods/detail?seq=2')
+        self.assertEqual(first, 'https://travel.interpark.com/goods/detail?seq=1')
+        self.assertNotEqual(first, second)
+
+    def test_generic_query_params_are_kept(self):
+        # 식별자를 찾지 못한 URL : 일반적인 이름의 파라미터는 숙소/객실 식별자일 수 있으므로 키에 남긴다
+        first = normalize_landing_url('https://travel.interpark.com/stay?source=1001&n_room=7&utm_source=dsp')
+        second = normalize_landing_url('https://travel.interpark.com/stay?source=1002&n_room=7&utm_source=dsp')
+        self.assertIn('source=1001', first)
+        self.assertIn('n_room=7', first)
+        self.assertNotIn('utm_source', first)
+        self.assertNotEqual(first, second)
+
+    def test_tracking_params_are_dropped(self):
+        self.assertEqual(
+            normalize_landing_url('https://travel.interpark.com/stay?id=5&gclid=a&fbclid=b&af_sub1=c&appier_x=d'),
+            normalize_landing_url('https://travel.interpark.com/stay?id=5'))
+
+    def test_yanolja_place(self):
+        self.assertEqual(normalize_landing_url('https://place-site.yanolja.com/places/1000112?utm_medium=ad'),
+                         'yanolja:1000112')
+
+
+if __name__ == '__main__':
+    unittest.main()
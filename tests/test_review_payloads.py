@@ -0,0 +1,56 @@
+# test_review_payloads.py
+import unittest
+from unittest import mock
+
+from Service.CARIB_content_reviewer import _records_from_payloads
+
+
+def _payload(records, **extra):
+    """심사 목록 API 응답 형태 JSON"""
+    return {'data': dict({'content': records}, **extra)}
+
+
+RECORDS = [
+    {'reviewTargetId': 101, 'landingUrl': 'https://checkinnow.example/1'},
+    {'reviewTargetId': 102, 'landingUrl': 'https://checkinnow.example/2'},
+]
+
+
+class RecordsFromPayloadsTest(unittest.TestCase):
+    """_records_from_payloads : 네트워크 응답 사용 / CSV 폴백 판단"""
+
+    def setUp(self):
+        patcher = mock.patch('Service.CARIB_content_reviewer.logging')
+        self.logger = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matching_total_builds_dataframe(self):
+        df = _records_from_payloads([_payload(RECORDS, totalElements=2)])
+        self.assertEqual(list(df.columns), ['랜딩URL', '심사대상ID'])
+        self.assertEqual(list(df['심사대상ID']), ['101', '102'])     # CSV 경로와 같이 문자열
+        self.logger.log.assert_not_called()
+
+    def test_latest_payload_is_used(self):
+        df = _records_from_payloads([_payload(RECORDS[:1], totalElements=1),
+                                     {'unrelated': True},
+                                     _payload(RECORDS, totalCount=2)])
+        self.assertEqual(len(df), 2)
+
+    def test_total_mismatch_falls_back(self):
+        self.assertIsNone(_records_from_payloads([_payload(RECORDS, totalElements=3)]))
+        self.assertIn('불일치', self.logger.log.call_args[0][0])
+
+    def test_missing_total_falls_back(self):
+        self.assertIsNone(_records_from_payloads([_payload(RECORDS)]))
+
+    def test_missing_field_falls_back(self):
+        records = RECORDS + [{'reviewTargetId': 103, 'landingUrl': None}]
+        self.assertIsNone(_records_from_payloads([_payload(records, total=3)]))
+
+    def test_no_payloads_falls_back(self):
+        self.assertIsNone(_records_from_payloads([]))
+        self.assertIsNone(_records_from_payloads([{'unrelated': [1, 2]}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# test_rule_engine.py
+import unittest
+from unittest import mock
+
+from Function.rule_engine import RuleEngine, rules_version
+
+RULES = [
+    {'category': '무인텔', 'keywords': ['무인텔', '무인모텔'], 'hold_reason': '모텔 업종'},
+    {'category': '러브호텔', 'keywords': ['러브호텔'], 'hold_reason': '모텔 업종'},
+    {'category': '모텔', 'keywords': ['모텔'], 'hold_reason': '모텔 업종'},
+]
+
+
+class RuleEngineTest(unittest.TestCase):
+    """RuleEngine : Aho-Corasick 다중 패턴 매칭과 규칙 우선순위"""
+
+    def setUp(self):
+        self.engine = RuleEngine(RULES, logger=mock.Mock())
+
+    def test_no_match(self):
+        self.assertIsNone(self.engine.classify('비즈니스 호텔'))
+        self.assertIsNone(self.engine.classify(None))
+        self.assertEqual(self.engine.match(''), [])
+
+    def test_case_and_whitespace_are_ignored(self):
+        self.assertEqual(self.engine.classify('러브 호텔')['category'], '러브호텔')
+
+    def test_overlapping_keywords_follow_rule_order(self):
+        # '무인모텔'은 '모텔'도 포함 → 앞쪽 규칙(무인텔)이 대표
+        self.assertEqual([rule['category'] for rule in self.engine.match('강남 무인모텔')], ['무인텔', '모텔'])
+        self.assertEqual(self.engine.classify('강남 무인모텔')['category'], '무인텔')
+
+    def test_match_found_through_failure_link(self):
+        # '무인' 뒤에 '모텔'이 아닌 문자가 와도 이후 '모텔'을 찾아야 함
+        self.assertEqual(self.engine.classify('무인카페 옆 모텔')['category'], '모텔')
+
+    def test_classify_many_counts_hits(self):
+        results = self.engine.classify_many({'a': '모텔', 'b': '호텔', 'c': '무인텔', 'd': None})
+        self.assertEqual({key: rule and rule['category'] for key, rule in results.items()},
+                         {'a': '모텔', 'b': None, 'c': '무인텔', 'd': None})
+        self.assertEqual(self.engine.hits, {'무인텔': 1, '러브호텔': 0, '모텔': 1})
+
+    def test_invalid_rule_raises(self):
+        with self.assertRaises(ValueError):
+            RuleEngine([{'category': '모텔', 'keywords': [' '], 'hold_reason': '사유'}], logger=mock.Mock())
+
+
+class RulesVersionTest(unittest.TestCase):
+    """rules_version : 규칙이 실제로 바뀔 때만 달라지는 버전 값"""
+
+    def test_same_for_equivalent_rules(self):
+        reordered = [dict(rule, keywords=list(reversed(rule['keywords']))) for rule in RULES]
+        self.assertEqual(rules_version(RULES), rules_version(reordered))
+        self.assertEqual(rules_version(RULES), RuleEngine(RULES, logger=mock.Mock()).version)
+
+    def test_changes_with_keywords_or_priority(self):
+        added = RULES[:-1] + [dict(RULES[-1], keywords=['모텔', '여관'])]
+        self.assertNotEqual(rules_version(RULES), rules_version(added))
+        self.assertNotEqual(rules_version(RULES), rules_version(list(reversed(RULES))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# test_run_history.py
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from Function.run_history import RunHistory
+
+
+def _frame(rows):
+    """[(심사대상ID, 랜딩URL, 구분), ...] → 분류 대상 DataFrame"""
+    return pd.DataFrame(rows, columns=['심사대상ID', '랜딩URL', '구분'])
+
+
+class RunHistoryDeltaTest(unittest.TestCase):
+    """RunHistory.delta : 이전 실행에서 처리가 끝난 심사대상ID 제외"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, 'run_history.db')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _history(self, **kwargs):
+        history = RunHistory(self.db_path, logger=mock.Mock(), **kwargs)
+        self.addCleanup(history.close)
+        return history
+
+    def test_first_run_keeps_everything(self):
+        df, skipped = self._history().delta(_frame([('1', 'u1', None), ('2', 'u2', None)]))
+        self.assertEqual(list(df['심사대상ID']), ['1', '2'])
+        self.assertEqual(skipped, 0)
+
+    def test_finished_rows_are_skipped(self):
+        history = self._history()
+        history.record_classification(_frame([
+            ('1', 'u1', None),                          # 제한 업종 아님 → 완료
+            ('2', 'u2', '모텔'),                        # 보류 완료 → 완료
+            ('3', 'u3', '모텔'),                        # 보류 실패 → 재처리
+            ('4', 'u4', RunHistory.CATEGORY_UNKNOWN),   # 분류 실패 → 재처리
+        ]))
+        history.record_holds(['2'], RunHistory.HOLD_DONE)
+        history.record_holds(['3'], RunHistory.HOLD_FAILED)
+
+        df, skipped = history.delta(_frame([('1', 'u1', None), ('2', 'u2', None), ('3', 'u3', None),
+                                            ('4', 'u4', None), ('5', 'u5', None)]))
+        self.assertEqual(list(df['심사대상ID']), ['3', '4', '5'])
+        self.assertEqual(skipped, 2)
+
+    def test_changed_landing_url_is_reprocessed(self):
+        history = self._history()
+        history.record_classification(_frame([('1', 'u1', None)]))
+        df, _ = history.delta(_frame([('1', 'u1-new', None)]))
+        self.assertEqual(list(df['심사대상ID']), ['1'])
+
+    def test_numeric_ids_match_string_history(self):
+        history = self._history()
+        history.record_classification(_frame([('100', 'u1', None)]))
+        df, skipped = history.delta(_frame([(100, 'u1', None)]))
+        self.assertTrue(df.empty)
+        self.assertEqual(skipped, 1)
+
+    def test_expired_history_is_forgotten(self):
+        with mock.patch('Function.run_history.time.time', return_value=1_000.0):
+            history = self._history(retention=60)
+            history.record_classification(_frame([('1', 'u1', None)]))
+        with mock.patch('Function.run_history.time.time', return_value=1_100.0):
+            df, skipped = history.delta(_frame([('1', 'u1', None)]))
+        self.assertEqual(list(df['심사대상ID']), ['1'])
+        self.assertEqual(skipped, 0)
+
+    def test_disabled_history_passes_through(self):
+        history = self._history(enabled=False)
+        history.record_classification(_frame([('1', 'u1', None)]))
+        df, skipped = history.delta(_frame([('1', 'u1', None)]))
+        self.assertEqual(len(df), 1)
+        self.assertFalse(os.path.exists(self.db_path))
+
+
+class RunHistoryRuleVersionTest(unittest.TestCase):
+    """RunHistory : 분류 규칙이 바뀌면 '제한 업종 아님' 이력 재확인"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, 'run_history.db')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _delta_ids(self, rule_version, rows):
+        history = RunHistory(self.db_path, rule_version=rule_version, logger=mock.Mock())
+        try:
+            df, _ = history.delta(_frame(rows))
+            return list(df['심사대상ID'])
+        finally:
+            history.close()
+
+    def test_non_restricted_rows_rechecked_after_rule_change(self):
+        history = RunHistory(self.db_path, rule_version='v1', logger=mock.Mock())
+        history.record_classification(_frame([('1', 'u1', None), ('2', 'u2', '모텔')]))
+        history.record_holds(['2'], RunHistory.HOLD_DONE)
+        history.close()
+
+        rows = [('1', 'u1', None), ('2', 'u2', None)]
+        self.assertEqual(self._delta_ids('v1', rows), [])
+        self.assertEqual(self._delta_ids('v2', rows), ['1'])     # 보류 완료 건은 규칙과 무관하게 종료
+
+    def test_history_without_version_column_is_migrated(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE review_history (review_target_id TEXT PRIMARY KEY, landing_url TEXT,"
+                     " category TEXT, hold_status TEXT, first_seen REAL NOT NULL, last_seen REAL NOT NULL)")
+        conn.execute("INSERT INTO review_history VALUES ('1', 'u1', NULL, NULL, ?, ?)", (time.time(), time.time()))
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self._delta_ids('v1', [('1', 'u1', None)]), ['1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# test_step_timer.py
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from Function.step_timer import StepTimer
+
+
+class StepTimerTest(unittest.TestCase):
+    """StepTimer : 단계 기록과 p50/p95 요약"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.jsonl_path = os.path.join(self._tmp.name, 'timing.jsonl')
+        StepTimer.reset(self.jsonl_path)
+
+    def tearDown(self):
+        StepTimer.reset()
+        self._tmp.cleanup()
+
+    def _record(self, step, values_ms, outcome='ok'):
+        with StepTimer._lock:
+            StepTimer._records.extend((step, outcome, value) for value in values_ms)
+
+    def test_percentiles_use_nearest_rank(self):
+        self._record('landing.fetch', range(1, 101))      # 1..100ms
+        row, = StepTimer.summary()
+        self.assertEqual((row['count'], row['p50'], row['p95'], row['max']), (100, 50, 95, 100))
+
+    def test_single_value_and_error_count(self):
+        self._record('carib.login', [120.0])
+        self._record('carib.login', [30.0], outcome='error:TimeoutException')
+        row, = StepTimer.summary()
+        self.assertEqual((row['count'], row['errors'], row['p50'], row['p95']), (2, 1, 30.0, 120.0))
+
+    def test_span_writes_json_line_with_annotations(self):
+        with StepTimer.span('hold.single', target='123'):
+            StepTimer.annotate(retries=2, outcome='not_found')
+
+        with open(self.jsonl_path, encoding='utf-8') as f:
+            record = json.loads(f.readline())
+        self.assertEqual((record['step'], record['target'], record['outcome'], record['retries']),
+                         ('hold.single', '123', 'not_found', 2))
+        self.assertGreaterEqual(record['ms'], 0)
+
+    def test_timed_records_exception_outcome(self):
+        @StepTimer.timed('carib.download_csv', target=lambda name: name)
+        def _download(name):
+            raise TimeoutError(name)
+
+        with self.assertRaises(TimeoutError):
+            _download('acct')
+        row, = StepTimer.summary()
+        self.assertEqual((row['step'], row['errors']), ('carib.download_csv', 1))
+
+    def test_summary_table_and_log_report(self):
+        self.assertEqual(StepTimer.summary_table(), '')
+        self._record('run_pipeline', [1000.0])
+        self.assertIn('run_pipeline', StepTimer.summary_table())
+
+        logger = mock.Mock()
+        StepTimer.log_report(logger)
+        self.assertEqual(logger.log.call_count, 3)     # 제목 + 헤더 + 1행
+
+
+if __name__ == '__main__':
+    unittest.main()